@@ -3,29 +3,41 @@ import time
 import contextlib
 from io import StringIO
 from analyzers import PackageAnalyzer
+from analyzers.code_analyzer import CodeAnalyzer
 from reporters import TextReporter, GraphReporter
-from utils import FileHandler
+from utils import FileHandler, capture_output
 
-def analyze_single_package(package, out_dir, package_index, total_packages, include_local, local_dir, workers) -> None:
-    """Analyzing a single npm package with optional local versions"""
+def analyze_single_package(package, out_dir, package_index, total_packages, include_local, local_dir, workers, evidence_policy=None, stream_threshold=CodeAnalyzer.STREAM_THRESHOLD,
+                           metrics_cache=None, pool=None, download_slot=None, scan_slot=None, parallel_versions=False,
+                           planner=None) -> None:
+    """Analyzing a single npm package with optional local versions.
+        download_slot and scan_slot limit the packages downloading and scanning at the same time (see BatchScheduler)"""
     pkg_dir = Path(out_dir) / package.replace('/', '_')
     pkg_dir.mkdir(parents=True, exist_ok=True)
 
     start_time = time.time()
     print(f"[{package_index}/{total_packages}] Analyzing {package}...")
-    analyzer = PackageAnalyzer(include_local=include_local, local_versions_dir=local_dir, workers=workers, package_name=package, output_dir=pkg_dir)
+    analyzer = PackageAnalyzer(include_local=include_local, local_versions_dir=local_dir, workers=workers, package_name=package, output_dir=pkg_dir, evidence_policy=evidence_policy,
+                               stream_threshold=stream_threshold, metrics_cache=metrics_cache, pool=pool,
+                               parallel_versions=parallel_versions, planner=planner)
 
     txt_flags_summary_path = pkg_dir / f"{package.replace('/', '_')}_flags_summary.txt"
     TextReporter.initialize_report(txt_flags_summary_path, package)
 
-    # Capture the output of analyze_package
+    # Capture the output of analyze_package (only of this thread, if more packages are analyzed at the same time)
     output_buffer = StringIO()
-    with contextlib.redirect_stdout(output_buffer):
-        analyzer.analyze_package()
+    with capture_output(output_buffer):
+        # The tarballs are downloaded in the background, also while waiting for a scan slot
+        fetched = analyzer.fetch_versions(download_slot)
 
-    TextReporter().generate_log_txt(pkg_dir, package, output_buffer)
-    TextReporter().finish_report(txt_flags_summary_path)
-    GraphReporter().generate_graphs(pkg_dir, package)
+    with scan_slot or contextlib.nullcontext():
+        if fetched:
+            with capture_output(output_buffer):
+                analyzer.analyze_versions()
+
+        TextReporter().generate_log_txt(pkg_dir, package, output_buffer)
+        TextReporter().finish_report(txt_flags_summary_path)
+        GraphReporter().generate_graphs(pkg_dir, package)
     #FileHandler().delete_tarballs(package)
 
     elapsed_time = time.time() - start_time
@@ -1,4 +1,6 @@
 from .package_analyzer import PackageAnalyzer
 from .aggregate_metrics_by_tag import AggregateMetricsByTag
+from .analysis_pool import AnalysisPool
+from .execution_planner import ExecutionPlanner, ExecutionPlan
 
-__all__ = ['PackageAnalyzer', 'AggregateMetricsByTag']
\ No newline at end of file
+__all__ = ['PackageAnalyzer', 'AggregateMetricsByTag', 'AnalysisPool', 'ExecutionPlanner', 'ExecutionPlan']
\ No newline at end of file
@@ -54,6 +54,7 @@ class AggregateMetricsByTag:
 
             version_metrics.crypto.crypto_addresses += fm.crypto.crypto_addresses
             version_metrics.crypto.list_crypto_addresses.extend(fm.crypto.list_crypto_addresses)
+            version_metrics.crypto.crypto_addresses_digest += fm.crypto.crypto_addresses_digest
             version_metrics.crypto.cryptocurrency_name += fm.crypto.cryptocurrency_name
             version_metrics.crypto.wallet_detection += fm.crypto.wallet_detection
             version_metrics.crypto.replaced_crypto_addresses += fm.crypto.replaced_crypto_addresses
@@ -0,0 +1,407 @@
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import itertools
+import math
+import multiprocessing as mp
+import os
+import signal
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener, wait
+from multiprocessing.pool import AsyncResult
+from models import EvidencePolicy, SourceType
+from models.composed_metrics import FileMetrics
+from utils import MetricsCache, synchronized_print, OutputTarget
+from .code_analyzer import CodeAnalyzer, ScanPart
+
+# Data shared by the files of a version: (package name, version, package directory, source).
+# The same tuple is in all the tasks of a version, pickled once per chunk of tasks
+TaskContext = Tuple[str, str, str, SourceType]
+# A file to analyze: (index in the version, path relative to the package, raw content if already in memory, context)
+Task = Tuple[int, str, Optional[bytes], TaskContext]
+# Result of a file on a worker: (index, metrics, error), the metrics are None and the error is set if the analysis failed
+FileResult = Tuple[int, Optional[FileMetrics], Optional[str]]
+
+# CodeAnalyzer of a worker process, created once by the initializer of the pool and used by all its tasks
+_code_analyzer: Optional[CodeAnalyzer] = None
+# Progress of the worker, read by the monitor of the pool: (pid, ticket of the task, index of the file started or None when the task is done).
+# Its own connection to the monitor (no lock shared with the other workers, that a killed worker could keep), written synchronously
+# (no feeder thread), so the file is known also if the worker dies while analyzing it
+_progress: Optional[Connection] = None
+
+def _init_worker(evidence_policy: Optional[EvidencePolicy], stream_threshold: Optional[int], metrics_cache: Optional[MetricsCache],
+                 progress: Optional[Tuple[str, bytes]] = None) -> None:
+    global _code_analyzer, _progress
+    _code_analyzer = CodeAnalyzer(evidence_policy, stream_threshold, metrics_cache)
+    if progress is not None:
+        address, authkey = progress
+        try:
+            _progress = Client(address, authkey=authkey)
+        except OSError:
+            _progress = None    # The pool closed before this worker started, it has no tasks
+
+def _report(ticket: int, index: Optional[int]) -> None:
+    """At the end of a task (index None) wait until the monitor has read it: the monitor kills a worker only while it analyzes a file,
+        never while it writes its result on the result queue of the pool (the queue would stay locked for the other workers).
+        The monitor answers True, or False once when it stops (the pool is closing): no more reports then
+    """
+    global _progress
+    if _progress is None:
+        return
+    try:
+        _progress.send((os.getpid(), ticket, index))
+        if index is None and not _progress.recv():
+            _progress = None
+    except (EOFError, OSError):
+        _progress = None
+
+def _package_info(file_name: str, context: TaskContext) -> Dict:
+    package_name, version, package_dir, source = context
+    return {
+        'name': package_name,
+        'version': version,
+        'git_repo_path': package_dir,
+        'file_name': file_name,
+        'info': source
+    }
+
+def analyze_file_task(task: Task, scan_parts: Optional[List[ScanPart]] = None, cheap: bool = False) -> FileResult:
+    """Analyze a single file with the CodeAnalyzer of the worker, the error instead of the metrics if it fails.
+        scan_parts are the patterns of the file already scanned in parts by scan_part_task, cheap computes only the generic metrics
+    """
+    index, file_name, raw, context = task
+    try:
+        return index, _code_analyzer.analyze_file(Path(context[2]) / file_name, _package_info(file_name, context), raw, scan_parts, cheap), None
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}"
+
+def analyze_chunk_task(ticket: int, tasks: List[Task], cheap: bool = False, scan_parts: Optional[List[ScanPart]] = None) -> List[FileResult]:
+    """Task of a worker: analyze a chunk of files, reporting each file it starts (scan_parts only for a chunk of a single file)"""
+    results = []
+    for task in tasks:
+        _report(ticket, task[0])
+        results.append(analyze_file_task(task, scan_parts, cheap))
+    _report(ticket, None)
+    return results
+
+def scan_part_task(ticket: int, task: Task, part: int, parts: int) -> Optional[ScanPart]:
+    """Task of a worker: scan a part of the patterns of a large file, None if the file is cached or the scan failed (the whole file is analyzed then)"""
+    _, file_name, raw, context = task
+    _report(ticket, task[0])
+    try:
+        return _code_analyzer.scan_part(Path(context[2]) / file_name, _package_info(file_name, context), part, parts, raw)
+    except Exception as e:
+        print(f"Error scanning part {part + 1}/{parts} of {file_name}: {type(e).__name__}: {e}")
+        return None
+    finally:
+        _report(ticket, None)
+
+class AnalysisPool:
+    """Pool of worker processes shared by all the versions and packages of a run, each worker has its own CodeAnalyzer (patterns compiled once).
+        A worker is replaced after max_tasks_per_worker chunks of files (None never), to keep the memory of the workers stable.
+        The files of a version are sent largest first (the cost of a file grows with its size), so that a large file does not start last
+        and keep a worker busy when the others are done. A file larger than the share of a worker has its patterns scanned in parts by more workers.
+        A monitor kills a worker that spends more than file_timeout seconds on a file (the pool starts another one) and finds the workers that crash:
+        the file is analyzed again with the generic metrics only, the other files of its chunk are sent again.
+        Each worker reports its progress on its own connection to the monitor, the end of a task waits for the monitor: a worker is killed
+        only if, read all its messages, it is still on the file over the timeout, so it is not writing a result
+    """
+    MAX_TASKS_PER_WORKER = 1000
+    CHUNKS_PER_WORKER = 4               # As Pool.map, more chunks than workers to balance the load
+    MAX_CHUNK_BYTES = 4 * 1024 * 1024   # Content sent to a worker with a single chunk, large files are sent alone
+    SPLIT_MIN_BYTES = 1024 * 1024       # Smaller files are always scanned by a single worker
+    FILE_TIMEOUT = 300.0                # seconds
+    POLL_INTERVAL = 0.5                 # seconds between the checks of the monitor
+
+    def __init__(self, processes: int, evidence_policy: Optional[EvidencePolicy] = None, stream_threshold: Optional[int] = CodeAnalyzer.STREAM_THRESHOLD,
+                 metrics_cache: Optional[MetricsCache] = None, max_tasks_per_worker: Optional[int] = MAX_TASKS_PER_WORKER,
+                 file_timeout: Optional[float] = FILE_TIMEOUT):
+        self.processes = processes
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.stream_threshold = stream_threshold    # Streamed files are not split
+        self.file_timeout = file_timeout            # None never stops a file
+        # The workers connect to the listener when they start, the accepted connections wait in _accepted for the monitor
+        self._authkey = os.urandom(32)
+        self._listener = Listener(authkey=self._authkey)
+        self._accepted: List[Connection] = []
+        self._wakeup_read, self._wakeup_write = os.pipe()   # Wakes up the monitor for a new connection or to stop
+        self._pool = mp.Pool(
+            processes=processes,
+            initializer=_init_worker,
+            initargs=(evidence_policy, stream_threshold, metrics_cache, (self._listener.address, self._authkey)),
+            maxtasksperchild=max_tasks_per_worker
+        )
+        self._tickets = itertools.count()
+        self._lock = threading.Lock()
+        self._running: Dict[int, Tuple[int, int, float]] = {}           # pid -> (ticket, index of the file, started)
+        self._lost: Dict[int, Tuple[int, str]] = {}                     # ticket -> (index of the file, "timeout" or "crash")
+        self._tasks_lost = False
+        self._stopped = threading.Event()
+        self._acceptor = threading.Thread(target=self._accept, name="pool-acceptor", daemon=True)
+        self._acceptor.start()
+        self._monitor = threading.Thread(target=self._watch, name="pool-monitor", daemon=True)
+        self._monitor.start()
+
+    def analyze_files(self, package_name: str, version: str, package_dir: Path, source: SourceType,
+                      files: List[Tuple[str, Optional[bytes]]], workers: Optional[int] = None) -> Iterator[Tuple[int, Optional[FileMetrics]]]:
+        """Metrics of each file (path relative to package_dir, raw content or None to read it from disk) with its index in files,
+            in the order they are completed (None if the analysis of the file failed). The files are split for the given workers (all of them if None)
+        """
+        workers = min(workers or self.processes, self.processes)
+        context = (package_name, version, str(package_dir), source)
+        sizes = self.file_sizes(package_dir, files)
+        total = sum(sizes)
+        tasks = sorted(((index, file_name, raw, context) for index, (file_name, raw) in enumerate(files)), key=lambda task: -sizes[task[0]])
+        # The parts of the split files are queued first, they are the largest
+        parts = {task[0]: self.parts(sizes[task[0]], total, workers) for task in tasks}
+        pending: Dict[int, Tuple[AsyncResult, tuple]] = {}
+        wakeup = threading.Event()      # Set when a task of these files is completed
+        for task in tasks:
+            for part in range(parts[task[0]] if parts[task[0]] > 1 else 0):
+                self._submit(pending, wakeup, scan_part_task, (task, part, parts[task[0]]), ("part", task, part, parts[task[0]]))
+        for chunk in self.chunks([task for task in tasks if parts[task[0]] == 1], sizes, workers):
+            self._submit(pending, wakeup, analyze_chunk_task, (chunk,), ("chunk", chunk, False, None))
+        return self._collect(pending, wakeup)
+
+    @staticmethod
+    def file_sizes(package_dir: Path, files: List[Tuple[str, Optional[bytes]]]) -> List[int]:
+        """Size of each file, of its content in memory or on disk"""
+        sizes = []
+        for file_name, raw in files:
+            if raw is not None:
+                sizes.append(len(raw))
+                continue
+            try:
+                sizes.append((Path(package_dir) / file_name).stat().st_size)
+            except OSError:
+                sizes.append(0)
+        return sizes
+
+    def chunks(self, tasks: List[Task], sizes: List[int], workers: Optional[int] = None) -> List[List[Task]]:
+        """Files sent to a worker at a time, in order: CHUNKS_PER_WORKER chunks per worker, and chunks of about the same bytes
+            (at most MAX_CHUNK_BYTES), so a large file is sent alone and the small ones together
+        """
+        if not tasks:
+            return []
+        workers = workers or self.processes
+        max_files = math.ceil(len(tasks) / (workers * self.CHUNKS_PER_WORKER))
+        max_bytes = min(self.MAX_CHUNK_BYTES, max(1, sum(sizes[task[0]] for task in tasks) // (workers * self.CHUNKS_PER_WORKER)))
+        chunks, chunk, chunk_bytes = [], [], 0
+        for task in tasks:
+            size = sizes[task[0]]
+            if chunk and (len(chunk) >= max_files or chunk_bytes + size > max_bytes):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append(task)
+            chunk_bytes += size
+        chunks.append(chunk)
+        return chunks
+
+    def parts(self, size: int, total: int, workers: Optional[int] = None) -> int:
+        """Workers that scan the patterns of a file of the given size, in a version of total bytes: more than one if the file is larger than the share of a worker"""
+        workers = workers or self.processes
+        if workers < 2 or size < self.SPLIT_MIN_BYTES or size * workers <= total:
+            return 1
+        if self.stream_threshold is not None and size > self.stream_threshold:
+            return 1
+        return min(workers, math.ceil(size * workers / total))
+
+    def _submit(self, pending: Dict[int, Tuple[AsyncResult, tuple]], wakeup: threading.Event, func, args: tuple, job: tuple) -> None:
+        """Queue a task on the workers, with a ticket to follow it: job is what the task is, to handle its result (or its loss)"""
+        ticket = next(self._tickets)
+        pending[ticket] = (self._pool.apply_async(func, (ticket, *args), callback=lambda _: wakeup.set(), error_callback=lambda _: wakeup.set()), job)
+
+    def _collect(self, pending: Dict[int, Tuple[AsyncResult, tuple]], wakeup: threading.Event) -> Iterator[Tuple[int, Optional[FileMetrics]]]:
+        """Results of the tasks as they are completed. A file that fails goes to the retry queue (analyzed again with the generic metrics only),
+            the parts of a split file are merged by a last task when they are all done
+        """
+        scanned_parts: Dict[int, List[Optional[ScanPart]]] = {}
+        while pending:
+            wakeup.clear()
+            done = [ticket for ticket, (result, _) in pending.items() if result.ready()]
+            with self._lock:
+                lost = {ticket: self._lost.pop(ticket) for ticket in pending if ticket not in done and ticket in self._lost}
+            if not done and not lost:
+                wakeup.wait(self.POLL_INTERVAL)     # Also without a completed task, to find the lost ones
+                continue
+
+            for ticket in done + list(lost):
+                result, job = pending.pop(ticket)
+                kind = job[0]
+                if kind == "part":
+                    _, task, part, parts = job
+                    scanned_parts.setdefault(task[0], [None] * parts)[part] = result.get() if ticket in done else None
+                    # All the parts done: a missing one (cached, failed or lost) and the whole file is analyzed again
+                    if not any(other[0] == "part" and other[1][0] == task[0] for _, other in pending.values()):
+                        scan_parts = scanned_parts.pop(task[0])
+                        self._submit(pending, wakeup, analyze_chunk_task, ([task], False, scan_parts if all(p is not None for p in scan_parts) else None),
+                                     ("chunk", [task], False, None))
+                    continue
+
+                _, chunk, cheap, reason = job
+                if ticket in done:
+                    for index, metrics, error in result.get():
+                        if metrics is not None:
+                            if reason is not None:
+                                metrics.scan.timed_out = reason == "timeout"
+                            yield index, metrics
+                        else:
+                            yield from self._retry(pending, wakeup, next(task for task in chunk if task[0] == index), cheap, error)
+                    continue
+
+                # The worker was killed or crashed on a file: the file goes to the retry queue, the others of the chunk are sent again
+                index, loss = lost[ticket]
+                failed = [task for task in chunk if task[0] == index]
+                others = [task for task in chunk if task[0] != index]
+                if others:
+                    self._submit(pending, wakeup, analyze_chunk_task, (others, cheap), ("chunk", others, cheap, reason))
+                for task in failed:
+                    yield from self._retry(pending, wakeup, task, cheap, loss)
+
+    def _retry(self, pending: Dict[int, Tuple[AsyncResult, tuple]], wakeup: threading.Event, task: Task, cheap: bool, error: str) -> Iterator[Tuple[int, Optional[FileMetrics]]]:
+        """Analyze again a file that failed, with the generic metrics only. None if that fails too"""
+        index, file_name, _, (package_name, version, _, _) = task
+        if error == "timeout":
+            synchronized_print(f"    Timeout: {package_name}@{version} {file_name} took more than {self.file_timeout:.0f}s on a worker")
+        elif error == "crash":
+            synchronized_print(f"    Worker crashed analyzing {package_name}@{version} {file_name}")
+        else:
+            synchronized_print(f"    Error analyzing {package_name}@{version} {file_name}{' (generic metrics only)' if cheap else ''}: {error}")
+        if cheap:
+            yield index, None
+            return
+        synchronized_print(f"    Retrying {file_name} with the generic metrics only", target=OutputTarget.FILE_ONLY)
+        self._submit(pending, wakeup, analyze_chunk_task, ([task], True), ("chunk", [task], True, error))
+
+    def _accept(self) -> None:
+        """Accept the connections of the workers (also of the ones that replace the others) until the pool is stopped"""
+        while True:
+            try:
+                connection = self._listener.accept()
+            except (OSError, mp.AuthenticationError):
+                if self._stopped.is_set():
+                    return
+                continue
+            # Checked with the lock: once the monitor has taken the last accepted connections, the new ones are released here
+            with self._lock:
+                stopped = self._stopped.is_set()
+                if not stopped:
+                    self._accepted.append(connection)
+            if stopped:
+                self._release(connection)
+                return
+            os.write(self._wakeup_write, b'\0')
+
+    def _watch(self) -> None:
+        """Monitor of the workers: follows the file each worker is analyzing, kills the workers over the file timeout and finds the crashed ones"""
+        workers: Dict[Connection, Optional[int]] = {}    # Connection of each worker -> its pid, known from its first message
+        while not self._stopped.is_set():
+            for ready in wait([self._wakeup_read, *workers], self.POLL_INTERVAL):
+                if ready == self._wakeup_read:
+                    os.read(self._wakeup_read, 4096)
+                    with self._lock:
+                        workers.update((connection, None) for connection in self._accepted)
+                        self._accepted.clear()
+                else:
+                    self._read_progress(ready, workers)
+            if self.file_timeout is None:
+                continue
+            now = time.monotonic()
+            for connection, pid in list(workers.items()):
+                with self._lock:
+                    running = self._running.get(pid)
+                if running is None or now - running[2] <= self.file_timeout:
+                    continue
+                # Its last messages: it could be on another file of the chunk or done, waiting for the monitor
+                self._read_progress(connection, workers)
+                with self._lock:
+                    if self._running.get(pid) != running:
+                        continue
+                try:
+                    os.kill(pid, signal.SIGKILL)     # The pool starts another worker
+                except ProcessLookupError:
+                    pass
+                self._lose(pid, running[0], running[1], "timeout")
+        # Also the connections accepted after the last wakeup was read
+        with self._lock:
+            workers.update((connection, None) for connection in self._accepted)
+            self._accepted.clear()
+        for connection in workers:
+            self._release(connection)
+
+    @staticmethod
+    def _release(connection: Connection) -> None:
+        """The worker waiting for the monitor on the connection goes on (the connection can stay open in the workers forked later, they inherit it)"""
+        try:
+            connection.send(False)
+        except OSError:
+            pass
+        connection.close()
+
+    def _read_progress(self, connection: Connection, workers: Dict[Connection, Optional[int]]) -> None:
+        """Read the messages of a worker on its connection, the end of its connection is the end of the worker"""
+        try:
+            while connection.poll():
+                pid, ticket, index = connection.recv()
+                workers[connection] = pid
+                with self._lock:
+                    if index is None:
+                        self._running.pop(pid, None)
+                    else:
+                        self._running[pid] = (ticket, index, time.monotonic())
+                if index is None:
+                    connection.send(True)
+        except (EOFError, OSError):
+            # Exited (max_tasks_per_worker), killed or crashed: a crash if it was analyzing a file
+            pid = workers.pop(connection)
+            connection.close()
+            with self._lock:
+                running = self._running.get(pid)
+            if running is not None:
+                self._lose(pid, running[0], running[1], "crash")
+
+    def _lose(self, pid: int, ticket: int, index: int, loss: str) -> None:
+        """The task of the worker is lost on the file: collected as lost (its pool task is never completed)"""
+        with self._lock:
+            if self._running.get(pid, (None,))[0] == ticket:
+                del self._running[pid]
+                self._lost[ticket] = (index, loss)
+                self._tasks_lost = True
+
+    def close(self) -> None:
+        """Wait for the pending tasks and stop the workers"""
+        self._stop_monitor()
+        if self._tasks_lost:
+            # A lost task is never completed, the pool would wait for it
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        self._stop_monitor()
+        self._pool.terminate()
+        self._pool.join()
+
+    def _stop_monitor(self) -> None:
+        self._stopped.set()
+        os.write(self._wakeup_write, b'\0')
+        self._monitor.join()
+        # A connection of our own to wake up the acceptor
+        try:
+            Client(self._listener.address, authkey=self._authkey).close()
+        except OSError:
+            pass
+        self._acceptor.join()
+        self._listener.close()
+        os.close(self._wakeup_read)
+        os.close(self._wakeup_write)
+
+    def __enter__(self) -> "AnalysisPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
\ No newline at end of file
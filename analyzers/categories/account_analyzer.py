@@ -5,26 +5,26 @@ from utils import NPMClient
 from datetime import datetime, timezone
 from utils import synchronized_print
 import re
-from models import SourceType
+from models import SourceType, Packument
 from models.composed_metrics.aggregate_metrics.account import AccountVersion
 
 class AccountAnalyzer:
     """Analyzes account compromise & release integrity anomalies"""
-    _npm_cache: Dict[str, Dict] = {}
+    _npm_cache: Dict[str, Optional[Packument]] = {}
     UTC_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
 
     def __init__(self, pkg_name: str = ""):
         self.package_name = pkg_name
         self.npm_client = NPMClient(pkg_name=pkg_name)   
     
-    def _get_npm_data_cached(self) -> Optional[Dict]:
+    def _get_npm_data_cached(self) -> Optional[Packument]:
         """Fetch NPM data with caching"""
         # If it's already cached, it will return immediately.
         if self.package_name in AccountAnalyzer._npm_cache:
             #synchronized_print(f"Using cached NPM data for {self.package_name}")
             return AccountAnalyzer._npm_cache[self.package_name]
         
-        # Otherwise, fetch from NPM
+        # Otherwise, fetch from NPM (or from the packument cache on disk, shared with the other processes)
         #synchronized_print(f"Fetching NPM data for {self.package_name}")
         npm_data = self.npm_client.get_npm_package_data()
         
@@ -62,23 +62,22 @@ class AccountAnalyzer:
         # Get npm metrics
         npm_data = self._get_npm_data_cached()
         
-        if npm_data and 'versions' in npm_data:
+        if npm_data and npm_data.versions:
             version = self.normalize_version(version)
-            if version not in npm_data['versions']:
+            if version not in npm_data.versions:
                 #synchronized_print(f"    NPM data for version {version} not found in package data")
-                #synchronized_print(f"    Available versions: {list(npm_data['versions'].keys())}")
+                #synchronized_print(f"    Available versions: {list(npm_data.versions.keys())}")
                 version = self.extract_version(version)
-                if version not in npm_data['versions']:
+                if version not in npm_data.versions:
                     print(f"    NPM data for extracted version {version} still not found, skipping NPM metrics")
                     return account
 
-            version_data = npm_data['versions'][version]
+            version_data = npm_data.versions[version]
             # Get maintainers/owners
-            maintainers = version_data.get('maintainers', [])
-            account.npm_maintainers = len(maintainers)
-            account.npm_hash_commit = version_data.get('gitHead', "")
-            if 'time' in npm_data and version in npm_data['time']:
-                account.npm_release_date = self._parse_date(npm_data['time'][version])
+            account.npm_maintainers = len(version_data.maintainers)
+            account.npm_hash_commit = version_data.git_head
+            if version_data.released:
+                account.npm_release_date = self._parse_date(version_data.released)
             #metrics['npm_maintainers_nicks'] = [maintainer.get('name', '') for maintainer in maintainers if maintainer.get('name')]
             #metrics['npm_maintainers_emails'] = [maintainer.get('email', '') for maintainer in maintainers if maintainer.get('email')] 
             # Get publisher info
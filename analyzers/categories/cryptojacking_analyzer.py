@@ -1,7 +1,9 @@
+import hashlib
 import re
-from typing import List, Pattern
-from utils import UtilsForAnalyzer
-from models.domains import CryptoMetrics
+from typing import Dict, List, Optional, Pattern, Tuple
+from utils import ContentView, PatternEngine
+from models.domains import CryptoMetrics, Evidence
+from models import EvidencePolicy
 from utils import synchronized_print
 class CryptojackingAnalyzer:
     """Analyze cryptojacking & wallet theft techniques"""
@@ -76,17 +78,55 @@ class CryptojackingAnalyzer:
         re.compile(r'\b(eth_sendTransaction|solana_signTransaction|solana_signAndSendTransaction)\b', re.IGNORECASE),
     ]
 
-    def analyze(self, content: str) -> CryptoMetrics:
+    # Pattern lists scanned by the PatternEngine, by tag
+    PATTERN_GROUPS: Dict[str, List[Pattern]] = {
+        'crypto_addresses': CRYPTO_PATTERNS,
+        'cryptocurrency_names': CRYPTOCURRENCY_NAMES,
+        'wallet_detection': WALLET_DETECTION_PATTERNS,
+        'replaced_crypto_addresses': REPLACE_CRYPTO_ADDRESS_PATTERN,
+        'hook_provider': HOOK_PROVIDER_PATTERN,
+    }
+
+    # Literal anchors of the patterns for the prefilter: every match contains at least one of them (case insensitive)
+    # CRYPTO_PATTERNS has no anchor (addresses can start with a digit), it is always run
+    PATTERN_ANCHORS: Dict[Pattern, Tuple[str, ...]] = {
+        CRYPTOCURRENCY_NAMES[0]: ('eth', 'btc', 'bch', 'bitcoin'),
+        WALLET_DETECTION_PATTERNS[0]: ('ethereum',),
+        REPLACE_CRYPTO_ADDRESS_PATTERN[0]: ('.replace',),
+        HOOK_PROVIDER_PATTERN[0]: ('eth_sendTransaction', 'solana_sign'),
+    }
+
+    # Tags whose distinct matches are all kept (not only the evidence), for the digest of the addresses
+    UNBOUNDED_TAGS: Tuple[str, ...] = ('crypto_addresses',)
+
+    def __init__(self, evidence: Optional[EvidencePolicy] = None):
+        self.pattern_engine = PatternEngine(self.PATTERN_GROUPS, self.PATTERN_ANCHORS, evidence=evidence, unbounded_tags=self.UNBOUNDED_TAGS)
+
+    def pattern_tags(self, view: ContentView) -> List[str]:
+        """Tags to scan, the same for every file"""
+        return list(self.PATTERN_GROUPS)
+
+    def analyze(self, view: ContentView, hits: Optional[Dict[str, Tuple[int, Evidence]]] = None) -> CryptoMetrics:
         crypto = CryptoMetrics()
-        if not content:
+        if view.is_empty:
             return crypto
 
-        crypto.crypto_addresses, crypto.list_crypto_addresses = UtilsForAnalyzer.detect_patterns(content, self.CRYPTO_PATTERNS)
-        crypto.cryptocurrency_name = UtilsForAnalyzer.detect_count_patterns(content, self.CRYPTOCURRENCY_NAMES)
-        crypto.wallet_detection, crypto.wallet_detection_list = UtilsForAnalyzer.detect_patterns(content, self.WALLET_DETECTION_PATTERNS)
+        if hits is None:
+            hits = self.pattern_engine.scan(view.text)
+        crypto.crypto_addresses, addresses = hits['crypto_addresses']
+        crypto.crypto_addresses_digest = self._digest(view.match_texts(addresses))
+        crypto.list_crypto_addresses = view.match_texts(self.pattern_engine.select_evidence(addresses))
+        crypto.cryptocurrency_name, _ = hits['cryptocurrency_names']
+        crypto.wallet_detection, crypto.wallet_detection_list = hits['wallet_detection']
         # Mechanism present in the malware considered :
         #   Intercepts all HTTP responses (fetch/XMLHttpRequest) and replaces the crypto addresses found in the content with those controlled by the attacker
         # Check presence of cryptocurrency name and .replace function could indicate address substitution
-        crypto.replaced_crypto_addresses, crypto.replaced_crypto_addresses_list = UtilsForAnalyzer.detect_patterns(content, self.REPLACE_CRYPTO_ADDRESS_PATTERN)
-        crypto.hook_provider = UtilsForAnalyzer.detect_count_patterns(content, self.HOOK_PROVIDER_PATTERN)
-        return crypto
\ No newline at end of file
+        crypto.replaced_crypto_addresses, crypto.replaced_crypto_addresses_list = hits['replaced_crypto_addresses']
+        crypto.hook_provider, _ = hits['hook_provider']
+        return crypto
+
+    @staticmethod
+    def _digest(addresses: List[Tuple[str, int]]) -> int:
+        """Sum of a 64 bit hash of every occurrence of the addresses, independent of their order"""
+        return sum(int.from_bytes(hashlib.blake2b(address.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), 'big') * occurrences
+                   for address, occurrences in addresses)
\ No newline at end of file
@@ -1,20 +1,22 @@
 import re
-from typing import List, Pattern
-from utils import UtilsForAnalyzer
-from models.domains import ExfiltrationMetrics
+from typing import Dict, List, Optional, Pattern, Tuple
+from utils import ContentView, PatternEngine
+from models.domains import Evidence, ExfiltrationMetrics
+from models import EvidencePolicy
 from utils import synchronized_print
 
 class DataExfiltrationAnalyzer:
     """Analyze data exfiltration & command and control techniques"""
     
     SCAN_FUNCTIONS_PATTERNS: List[Pattern] = [
-        re.compile(r'(\w+)\.(get)?homedir\s*\(?\s*\)?\s*', re.IGNORECASE),
-        re.compile(r'(\w+)\.((?:read(?:dir|file)|scanfilesystem)(?:sync)?)\s*\(([^;]*);', re.IGNORECASE)
+        re.compile(r'(?:(?<!\w)|(?<=homedir))(\w+)\.(get)?homedir\s*\(?\s*\)?\s*', re.IGNORECASE),
+        re.compile(r'(?<!\w)(\w+)\.((?:read(?:dir|file)|scanfilesystem)(?:sync)?)\s*\(([^;]*);', re.IGNORECASE)
         # os.homedir() Gets the home directory and is base, gethomedir() is custom wrapper function
         # readdirsync reads the content of a directory
         # scanFileSystem is custom function
         # readFileSync reads the content of a file
         # statSync reads the metadata of a file or folder and returns a fs.Stats object. It can be used later to do e.g. stats.isFile()
+        # (?<!\w) (\w+) starts only at the beginning of a word (linear time on long words), or right after a previous match ending in homedir
     ]
 
     SCANNED_ELEMENTS_PATTERNS: List[Pattern] = [
@@ -51,17 +53,42 @@ class DataExfiltrationAnalyzer:
 
     DATA_TRANSMISSION_PATTERNS: List[Pattern] = [
         # e.g. client.request(https://server.com/api)
-        re.compile(r'(\w+)\.(post|get|put|delete|request)\s*\(\s*[\'"]?(https?:\/\/[^\s\'"]+)[\'"]?', re.IGNORECASE),
+        re.compile(r'(?<!\w)(\w+)\.(post|get|put|delete|request)\s*\(\s*[\'"]?(https?:\/\/[^\s\'"]+)[\'"]?', re.IGNORECASE),
         # e.g. new WebSocket("wss://example.com")
         re.compile(r'new\s+WebSocket\s*\(\s*[\'"]?(wss?:\/\/[^\s\'"]+)[\'"]?', re.IGNORECASE),
     ]
 
-    def analyze(self, content: str) -> ExfiltrationMetrics:
+    # Pattern lists scanned by the PatternEngine, by tag
+    PATTERN_GROUPS: Dict[str, List[Pattern]] = {
+        'scan_functions': SCAN_FUNCTIONS_PATTERNS,
+        'sensitive_elements': SCANNED_ELEMENTS_PATTERNS,
+        'data_transmissions': DATA_TRANSMISSION_PATTERNS,
+    }
+
+    # Literal anchors of the patterns for the prefilter: every match contains at least one of them (case insensitive)
+    PATTERN_ANCHORS: Dict[Pattern, Tuple[str, ...]] = {
+        SCAN_FUNCTIONS_PATTERNS[0]: ('homedir',),
+        SCAN_FUNCTIONS_PATTERNS[1]: ('.readdir', '.readfile', '.scanfilesystem'),
+        SCANNED_ELEMENTS_PATTERNS[0]: ('pass', 'secret', 'access', 'api', 'aws', 'ssh', 'private', 'database', 'google'),
+        DATA_TRANSMISSION_PATTERNS[0]: ('http',),
+        DATA_TRANSMISSION_PATTERNS[1]: ('WebSocket',),
+    }
+
+    def __init__(self, evidence: Optional[EvidencePolicy] = None):
+        self.pattern_engine = PatternEngine(self.PATTERN_GROUPS, self.PATTERN_ANCHORS, evidence=evidence)
+
+    def pattern_tags(self, view: ContentView) -> List[str]:
+        """Tags to scan, the same for every file"""
+        return list(self.PATTERN_GROUPS)
+
+    def analyze(self, view: ContentView, hits: Optional[Dict[str, Tuple[int, Evidence]]] = None) -> ExfiltrationMetrics:
         exfiltration = ExfiltrationMetrics()
-        if not content:
+        if view.is_empty:
             return exfiltration
 
-        exfiltration.scan_functions_count,  exfiltration.list_scan_functions = UtilsForAnalyzer.detect_patterns(content, self.SCAN_FUNCTIONS_PATTERNS)
-        exfiltration.sensitive_elements_count, exfiltration.list_sensitive_elements = UtilsForAnalyzer.detect_patterns(content, self.SCANNED_ELEMENTS_PATTERNS)
-        exfiltration.data_transmission_count, exfiltration.list_data_transmissions = UtilsForAnalyzer.detect_patterns(content, self.DATA_TRANSMISSION_PATTERNS)
+        if hits is None:
+            hits = self.pattern_engine.scan(view.text)
+        exfiltration.scan_functions_count,  exfiltration.list_scan_functions = hits['scan_functions']
+        exfiltration.sensitive_elements_count, exfiltration.list_sensitive_elements = hits['sensitive_elements']
+        exfiltration.data_transmission_count, exfiltration.list_data_transmissions = hits['data_transmissions']
         return exfiltration
\ No newline at end of file
@@ -1,9 +1,9 @@
 import re
-from typing import Dict, List, Pattern
-from utils import UtilsForAnalyzer
+from typing import Dict, List, Optional, Pattern, Tuple
+from utils import ContentView, PatternEngine, LineSpanPattern
 import jsbeautifier
-from models.domains import EvasionMetrics
-from models import SourceType, CodeType
+from models.domains import EvasionMetrics, Evidence, ScanMetrics
+from models import SourceType, CodeType, EvidencePolicy
 from utils import synchronized_print
 class EvasionAnalyzer:
     """Analyze evasion techniques"""
@@ -11,7 +11,7 @@ class EvasionAnalyzer:
     OBFUSCATION_PATTERNS: List[Pattern] = [
         re.compile(r'_?0x[0-9a-fA-F]{6,}'),                                                   # Hexadecimal values and variables (at least 6 hex values), e.g. 0x58e7a2 or _0x5f3b1c
         re.compile(r'parseInt\(_?0x[0-9a-fA-F]{6,}', re.IGNORECASE),                          # ParseInt with hexadecimals, e.g. parseInt(0x58e7a2
-        re.compile(r'try\{.*?\}catch\(_?0x[0-9a-fA-F]{6,}\)', re.IGNORECASE),                 # Try-catch blocks with obfuscated vars, e.g. try{...}catch(_0x5f3b1c)
+        LineSpanPattern(r'try\{', r'\}catch\(_?0x[0-9a-fA-F]{6,}\)', re.IGNORECASE),         # Try-catch blocks with obfuscated vars, e.g. try{...}catch(_0x5f3b1c)
         re.compile(r'const\s+_?0x[0-9a-fA-F]{6,}\s*=\s*_?0x[0-9a-fA-F]{6,}', re.IGNORECASE),  # Constant assignments with obfuscated names, e.g. const _0x5f3b1c = _0x5f3b1d 
         re.compile(r'_?0x[0-9a-fA-F]{6,}\(_?0x[0-9a-fA-F]{6,}'),                              # Function calls with hex parameters, e.g. _0x5f3b1c(0x58e7a2
         # \s for spaces
@@ -20,6 +20,7 @@ class EvasionAnalyzer:
         # ? facoltative
         # . matches any character except newline
         # re.IGNORECASE for case insensitive, re.DOTALL to match newlines  
+        # try\{.*?\}catch\(...\) as LineSpanPattern: the same matches, but a try{ without the catch does not rescan the rest of the line (quadratic on minified code)
     ]
 
     PLATFORM_PATTERNS: List[Pattern] = [
@@ -27,8 +28,8 @@ class EvasionAnalyzer:
         # .arch() returns the CPU architecture of the operating system on which Node.js is running
         re.compile(
             r'(?:'
-            r'(\w+\.)?platform\(?\)?\s*[!=]==?\s*[\'"](?:win(?:32|64|dows)?|linux|darwin|mac(?:os)?)[\'"]|'
-            r'\w*\.arch\s*\(\s*\)'
+            r'((?<!\w)\w+\.)?platform\(?\)?\s*[!=]==?\s*[\'"](?:win(?:32|64|dows)?|linux|darwin|mac(?:os)?)[\'"]|'
+            r'(?<!\w)\w*\.arch\s*\(\s*\)'
             r')',
             re.IGNORECASE
         ),
@@ -36,25 +37,61 @@ class EvasionAnalyzer:
         # \' for escape
         # darwin  macOS
         # (?:...) non-capturing group, best performance, do not allocate memory to capture the group
+        # (?<!\w) \w+ starts only at the beginning of a word, same matches (a match never ends inside a word) but linear time:
+        #   otherwise every character of a long word (e.g. a base64 string) retries \w+ until the end of the word
     ]
 
-    def analyze(self, content: str, package_info: Dict) -> EvasionMetrics:
+    # Pattern lists scanned by the PatternEngine, by tag
+    PATTERN_GROUPS: Dict[str, List[Pattern]] = {
+        'obfuscation_patterns': OBFUSCATION_PATTERNS,
+        'platform_detections': PLATFORM_PATTERNS,
+    }
+
+    # Literal anchors of the patterns for the prefilter: every match contains at least one of them (case insensitive)
+    PATTERN_ANCHORS: Dict[Pattern, Tuple[str, ...]] = {
+        OBFUSCATION_PATTERNS[0]: ('0x',),
+        OBFUSCATION_PATTERNS[1]: ('parseInt(',),
+        OBFUSCATION_PATTERNS[2]: ('}catch(',),
+        OBFUSCATION_PATTERNS[3]: ('0x',),
+        OBFUSCATION_PATTERNS[4]: ('0x',),
+        PLATFORM_PATTERNS[0]: ('platform', '.arch'),
+    }
+
+    def __init__(self, evidence: Optional[EvidencePolicy] = None):
+        self.evidence = evidence or EvidencePolicy()
+        self.pattern_engine = PatternEngine(self.PATTERN_GROUPS, self.PATTERN_ANCHORS, evidence=evidence)
+
+    def pattern_tags(self, view: ContentView) -> List[str]:
+        """Tags to scan on the original content. Minified code is scanned here, after being unminified (unless it is streamed)"""
+        return [] if self._detect_minified_code(view.file_name) and not view.streamed else list(self.PATTERN_GROUPS)
+
+    def analyze(self, view: ContentView, package_info: Dict, hits: Optional[Dict[str, Tuple[int, Evidence]]] = None, stats: Optional[ScanMetrics] = None) -> EvasionMetrics:
         evasion = EvasionMetrics()
-        if not content:
+        if view.is_empty:
             return evasion
         
-        if self._detect_minified_code(package_info['file_name']):
-            #synchronized_print(f"Minified code detected: {package_info['file_name']}")
+        if self._detect_minified_code(view.file_name):
+            #synchronized_print(f"Minified code detected: {view.file_name}")
             evasion.code_type = CodeType.MINIFIED
-            content = self.unminify_code(content)
-            #synchronized_print("Code unminified")
+            # A streamed file is too large to be unminified in memory, its matches are the ones of the original chunks
+            if not view.streamed:
+                view = ContentView.from_text(self.unminify_code(view.text), view.file_name)
+                hits = None
+                #synchronized_print("Code unminified")
 
-        evasion.obfuscation_patterns_count, evasion.list_obfuscation_patterns = UtilsForAnalyzer.detect_patterns(content, self.OBFUSCATION_PATTERNS)
-        evasion.platform_detections_count, evasion.list_platform_detections = UtilsForAnalyzer.detect_patterns(content, self.PLATFORM_PATTERNS)
+        if hits is None:
+            hits = self.pattern_engine.scan(view.text, stats=stats)
+        evasion.obfuscation_patterns_count, evasion.list_obfuscation_patterns = hits['obfuscation_patterns']
+        evasion.platform_detections_count, evasion.list_platform_detections = hits['platform_detections']
+        if evasion.code_type == CodeType.MINIFIED and not view.streamed:
+            # The unminified content is not kept, the text of its evidence is taken now
+            for evidence in (evasion.list_obfuscation_patterns, evasion.list_platform_detections):
+                evidence.unminified = True
+                evidence.excerpts = view.excerpts(evidence, self.evidence.context)
 
         if package_info['info'] == SourceType.DEOBFUSCATED:
             evasion.code_type = CodeType.DEOBFUSCATED
-        elif (self._detect_obfuscated_code(evasion.obfuscation_patterns_count, max(len(r) for r in content.splitlines() ) if content.splitlines() else 0 )):
+        elif (self._detect_obfuscated_code(evasion.obfuscation_patterns_count, view.longest_line_length)):
             evasion.code_type = CodeType.OBFUSCATED
         else:
             evasion.code_type = CodeType.CLEAR
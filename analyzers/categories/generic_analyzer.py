@@ -1,41 +1,42 @@
-import math
+import numpy as np
 from models.domains import GenericMetrics
-from utils import synchronized_print
+from utils import ContentView, synchronized_print
 
 class GenericAnalyzer:
     """Obtain generic metrics from files"""
 
-    def analyze(self, content: str) -> GenericMetrics:
+    # Code points for which str.isspace() is True (all of them are below U+3001)
+    WHITESPACE_CODE_POINTS = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+
+    def analyze(self, view: ContentView) -> GenericMetrics:
         generic = GenericMetrics()
 
-        if not content:
+        if view.is_empty:
             return generic
-        
-        generic.size_bytes = len(content.encode("utf-8"))
-        generic.size_chars = len(content)
-        whitespace_count = sum(1 for c in content if c.isspace())
-        generic.blank_space_and_character_ratio = whitespace_count / generic.size_chars if content else 0.0
-        generic.shannon_entropy = self._calculate_shannon_entropy(content)
+
+        # Frequency of each character, from a NumPy view of the content (or accumulated on its chunks)
+        values, counts = view.histogram
+
+        generic.size_chars = view.size_chars
+        generic.size_bytes = self._utf8_size(values, counts)
+        whitespace_count = int(counts[np.isin(values, self.WHITESPACE_CODE_POINTS)].sum())
+        generic.blank_space_and_character_ratio = whitespace_count / generic.size_chars
+        generic.shannon_entropy = self._calculate_shannon_entropy(counts, generic.size_chars)
         ##no_empty_lines = len([r for r in content.splitlines() if r.strip()])
 
-        generic.longest_line_length = max(len(r) for r in content.splitlines()) if content.splitlines() else 0
+        generic.longest_line_length = view.longest_line_length
         return generic
 
-    def _calculate_shannon_entropy(self, content: str) -> float:
-        """Calculate Shannon entropy of the content"""
-        if not content:
-            return 0.0
-
-        # Calculate frequency of each character in the content
-        freq = {}
-        for char in content:
-            freq[char] = freq.get(char, 0) + 1
+    @staticmethod
+    def _utf8_size(values: np.ndarray, counts: np.ndarray) -> int:
+        """Same as len(content.encode('utf-8')), without encoding the content again: 1 byte per character, plus 1 from U+0080, U+0800 and U+10000"""
+        return int(counts.sum() + counts[values >= 0x80].sum() + counts[values >= 0x800].sum() + counts[values >= 0x10000].sum())
 
-        # Calculate the Shannon entropy
-        entropy = 0.0
-        length = len(content)
-        for count in freq.values():
-            probability = count / length
-            entropy -= probability * math.log2(probability)
+    @staticmethod
+    def _calculate_shannon_entropy(counts: np.ndarray, length: int) -> float:
+        """Calculate Shannon entropy of the content from the frequency of each character"""
+        if length == 0:
+            return 0.0
 
-        return entropy
\ No newline at end of file
+        probabilities = counts / length
+        return float(-(probabilities * np.log2(probabilities)).sum())
\ No newline at end of file
@@ -1,23 +1,27 @@
 import re
-from typing import Dict, List, Pattern
-from utils import UtilsForAnalyzer
+from typing import Dict, List, Optional, Pattern, Tuple
+from utils import ContentView, PatternEngine, BackrefSpanPattern
 from utils import synchronized_print
-from models.domains import PayloadMetrics
+from models.domains import Evidence, PayloadMetrics
+from models import EvidencePolicy
 class PayloadAnalyzer:
     """Analyze payload delivery and execution techniques"""
     
     TIMING_DELAYS_PATTERNS: List[Pattern] = [
         # await new Promise( (resolve) => { setTimeout( resolve, 1000); } );
-        re.compile(r'await\s+new\s+Promise\s*\(\s*(\w+)\s*=>\s*\{?\s*[\s\S]*?setTimeout\w*\s*\(\s*\1[\s\S]*?\}?\s*\)', re.IGNORECASE),
+        # await\s+new\s+Promise\s*\(\s*(\w+)\s*=>\s*\{?\s*[\s\S]*?setTimeout\w*\s*\(\s*\1[^)]*\)
+        BackrefSpanPattern(r'await\s+new\s+Promise\s*\(\s*(\w+)\s*=>\s*\{?\s*', r'setTimeout\w*\s*\(\s*', ')', re.IGNORECASE),
         # (\w+) capture the variable name (resolve)
         # \w* zero or more alphanumeric characters (or underscore)
         # [\s\S] any character (space or non-space). Used to match newlines as well
         # *? Non-greedy quantifier (takes the minimum necessary), stop as soon as you find setTimeout, do not take the following ones
         # \1 Backreference to the captured variable (resolve)
         # ?: Indicates a non-capturing group (returns the entire match, not just the group)
+        # BackrefSpanPattern: the same matches, but a promise without its setTimeout does not rescan the rest of the file (quadratic)
+        # [^)]*\) up to the first ), the same of [\s\S]*?\}?\s*\) without trying the tail at each character
     ]
     
-    EVAL_PATTERNS: List[Pattern] = [re.compile(r'eval\s*\([\s\S]*?\)')]
+    EVAL_PATTERNS: List[Pattern] = [re.compile(r'eval\s*\([^)]*\)')]       # [^)]*\) up to the first ), the same of [\s\S]*?\)
     
     SHELL_COMMANDS_PATTERNS: List[Pattern] = [
         # obj.exec(command, args)
@@ -31,27 +35,55 @@ class PayloadAnalyzer:
             #r'(\w+)?.?exec\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)|'                                     # Original
             #r'(?!(?:RegExp|re|regexp)\.exec\b)(\w+)?\.?exec\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)|'    # Explicit avoid matching RegExp.exec
             r'(?:child_process|exec|spawn|shell)\.exec\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)|'          # Whitelist
-            r'(\w+)?\s*Bun\.\$\s*\`[\s\S]*?\`'
+            r'(?<!\w)(\w+)?\s*Bun\.\$\s*\`[^\`]*\`'                                             # (?<!\w) linear time on long words
             r')',
             re.IGNORECASE
         )
     ]
 
     PREINSTALL_PATTERNS: List[Pattern] = [re.compile(r'"preinstall"\s*:\s*"[^"]*"\s*,?', re.IGNORECASE)]    # [^"]*  Any text between quotes
+
+    # Pattern lists scanned by the PatternEngine, by tag
+    PATTERN_GROUPS: Dict[str, List[Pattern]] = {
+        'timing_delays': TIMING_DELAYS_PATTERNS,
+        'eval': EVAL_PATTERNS,
+        'shell_commands': SHELL_COMMANDS_PATTERNS,
+        'preinstall_scripts': PREINSTALL_PATTERNS,
+    }
+
+    # Literal anchors of the patterns for the prefilter: every match contains at least one of them (case insensitive)
+    PATTERN_ANCHORS: Dict[Pattern, Tuple[str, ...]] = {
+        TIMING_DELAYS_PATTERNS[0]: ('setTimeout',),
+        EVAL_PATTERNS[0]: ('eval',),
+        SHELL_COMMANDS_PATTERNS[0]: ('.exec', 'Bun.$'),
+        PREINSTALL_PATTERNS[0]: ('"preinstall"',),
+    }
+
+    def __init__(self, evidence: Optional[EvidencePolicy] = None):
+        self.pattern_engine = PatternEngine(self.PATTERN_GROUPS, self.PATTERN_ANCHORS, evidence=evidence)
+
+    def pattern_tags(self, view: ContentView) -> List[str]:
+        """Tags to scan, preinstall scripts are searched only in package.json"""
+        tags = ['timing_delays', 'eval', 'shell_commands']
+        if view.file_name == 'package.json':
+            tags.append('preinstall_scripts')
+        return tags
     
-    def analyze(self, content: str, package_info: Dict) -> PayloadMetrics:
+    def analyze(self, view: ContentView, hits: Optional[Dict[str, Tuple[int, Evidence]]] = None) -> PayloadMetrics:
         payload = PayloadMetrics()
-        if not content:
+        if view.is_empty:
             return payload
         
-        payload.timing_delays_count, payload.list_timing_delays = UtilsForAnalyzer.detect_patterns(content, self.TIMING_DELAYS_PATTERNS)
-        payload.eval_count, payload.eval_list = UtilsForAnalyzer.detect_patterns(content, self.EVAL_PATTERNS)
-        payload.shell_commands_count, payload.list_shell_commands = UtilsForAnalyzer.detect_patterns(content, self.SHELL_COMMANDS_PATTERNS)
+        if hits is None:
+            hits = self.pattern_engine.scan(view.text, self.pattern_tags(view))
+        payload.timing_delays_count, payload.list_timing_delays = hits['timing_delays']
+        payload.eval_count, payload.eval_list = hits['eval']
+        payload.shell_commands_count, payload.list_shell_commands = hits['shell_commands']
 
-        if(package_info['file_name'] == 'package.json'):
-            _, preinstall_scripts = UtilsForAnalyzer.detect_patterns(content, self.PREINSTALL_PATTERNS)
+        if(view.file_name == 'package.json'):
+            _, preinstall_scripts = hits['preinstall_scripts']
             #Take only the first occurrence, there should be only one preinstall script in package.json
             if preinstall_scripts:
-                payload.preinstall_scripts = [preinstall_scripts[0]]
+                payload.preinstall_scripts = [view.match_texts(preinstall_scripts)[0][0]]
         
         return payload
\ No newline at end of file
@@ -1,29 +1,143 @@
 from pathlib import Path
-from typing import Dict
+from dataclasses import fields
+from typing import Dict, List, Optional, Tuple
+import hashlib
 from .categories import EvasionAnalyzer, PayloadAnalyzer, DataExfiltrationAnalyzer, CryptojackingAnalyzer, GenericAnalyzer
 from models.composed_metrics import FileMetrics
-from utils import FileHandler, synchronized_print
+from models import EvidencePolicy, SourceType
+from models.domains import Evidence, ScanMetrics
+from utils import ContentView, StreamedView, PatternEngine, MetricsCache, synchronized_print
+# Result of CodeAnalyzer.scan_part: count and matches of each pattern of the part (see PatternEngine.scan_patterns) with the statistics of its scan
+ScanPart = Tuple[Dict[Tuple[str, int], int], Dict[Tuple[str, int], Dict[str, List[int]]], ScanMetrics]
+
 class CodeAnalyzer:
     """Coordinates analysis across all categories"""
     
-    def __init__(self):
+    STREAM_THRESHOLD = 32 * 1024 * 1024     # bytes, larger files are read and scanned in chunks
+    STREAM_CHUNK_SIZE = 4 * 1024 * 1024     # bytes
+    # Version of the metrics computed from a content, part of the key of the MetricsCache (the patterns are already in it)
+    # Bump it when the same content gives different metrics
+    ANALYZER_VERSION = 4
+
+    def __init__(self, evidence: Optional[EvidencePolicy] = None, stream_threshold: Optional[int] = STREAM_THRESHOLD, metrics_cache: Optional[MetricsCache] = None):
+        self.evidence = evidence or EvidencePolicy()
+        self.stream_threshold = stream_threshold    # None never streams
+        self.metrics_cache = metrics_cache
+        self.stream_chunk_size = self.STREAM_CHUNK_SIZE
         self.generic_analyzer = GenericAnalyzer()
-        self.evasion_analyzer = EvasionAnalyzer()
-        self.payload_analyzer = PayloadAnalyzer()
-        self.data_exfiltration_analyzer = DataExfiltrationAnalyzer()
-        self.cryptojacking_analyzer = CryptojackingAnalyzer()
+        self.evasion_analyzer = EvasionAnalyzer(evidence)
+        self.payload_analyzer = PayloadAnalyzer(evidence)
+        self.data_exfiltration_analyzer = DataExfiltrationAnalyzer(evidence)
+        self.cryptojacking_analyzer = CryptojackingAnalyzer(evidence)
+        # Analyzers whose patterns are scanned together, in a single pass on the content
+        self.pattern_analyzers = [self.evasion_analyzer, self.payload_analyzer, self.data_exfiltration_analyzer, self.cryptojacking_analyzer]
+        self.pattern_engine = PatternEngine(
+            {tag: patterns for analyzer in self.pattern_analyzers for tag, patterns in analyzer.PATTERN_GROUPS.items()},
+            {pattern: anchors for analyzer in self.pattern_analyzers for pattern, anchors in analyzer.PATTERN_ANCHORS.items()},
+            evidence=evidence,
+            unbounded_tags=self.cryptojacking_analyzer.UNBOUNDED_TAGS
+        )
+        # Analyzer version, pattern set and evidence policy, the same content gives the same metrics only if they do not change
+        self.fingerprint = hashlib.sha256(repr((
+            self.ANALYZER_VERSION,
+            sorted(self.pattern_engine.patterns),
+            self.evidence.mode.value,
+            self.evidence.limit,
+            self.evidence.context,
+        )).encode()).hexdigest()
 
-    def analyze_file(self, file_path: Path, package_info: Dict) -> FileMetrics:
-        """Analyze a single file and return all metrics"""
+    def analyze_file(self, file_path: Path, package_info: Dict, raw: Optional[bytes] = None, scan_parts: Optional[List[ScanPart]] = None,
+                     cheap: bool = False) -> FileMetrics:
+        """Analyze a single file and return all metrics, from its content if already in memory (raw) or read from file_path.
+            If given, scan_parts are the results of scan_part for all the parts of the file, its patterns are not scanned again.
+            cheap computes only the generic metrics (no pattern scan, no unminify), for a file whose full analysis failed
+        """
         metrics = FileMetrics(
             package=package_info['name'],
             version=package_info['version'],
             file_path=package_info['file_name'],
         )
-        content = FileHandler().read_file(file_path)
-        metrics.generic = self.generic_analyzer.analyze(content)
-        metrics.evasion = self.evasion_analyzer.analyze(content, package_info)
-        metrics.payload = self.payload_analyzer.analyze(content, package_info)
-        metrics.exfiltration = self.data_exfiltration_analyzer.analyze(content)
-        metrics.crypto = self.cryptojacking_analyzer.analyze(content)
-        return metrics
\ No newline at end of file
+        # Read once, every analyzer uses the same view of the file
+        view = self._view(file_path, package_info['file_name'], raw)
+        if cheap:
+            if view.streamed:
+                for _ in view.chunks():     # The data of a streamed view is accumulated on its chunks
+                    pass
+            metrics.generic = self.generic_analyzer.analyze(view)
+            # Not cached and not carried to the next versions, as a truncated scan
+            metrics.scan.degraded = metrics.scan.scan_truncated = True
+            return metrics
+        tags = [tag for analyzer in self.pattern_analyzers for tag in analyzer.pattern_tags(view)]
+
+        cache_key = self._cache_key(view, tags, package_info['info']) if self.metrics_cache is not None else None
+        if cache_key is not None:
+            cached = self.metrics_cache.get(cache_key)
+            if cached is not None:
+                cached.package, cached.version, cached.file_path = metrics.package, metrics.version, metrics.file_path
+                cached.scan.cached = True
+                return cached
+
+        if scan_parts is not None:
+            # Patterns scanned in parts by more processes
+            hits = self.pattern_engine.merge(tags, ((counts, found) for counts, found, _ in scan_parts))
+            for _, _, stats in scan_parts:
+                metrics.scan.patterns_scanned += stats.patterns_scanned
+                metrics.scan.patterns_skipped += stats.patterns_skipped
+                metrics.scan.scan_truncated = metrics.scan.scan_truncated or stats.scan_truncated
+                metrics.scan.budget_exceeded_patterns.extend(stats.budget_exceeded_patterns)
+        elif view.streamed:
+            # The single pass on the chunks also accumulates the data of the view used by the analyzers
+            hits = self.pattern_engine.scan_chunks(view.chunks(), tags, metrics.scan, view.match_text)
+        else:
+            hits = self.pattern_engine.scan(view.text, tags, metrics.scan)
+
+        metrics.generic = self.generic_analyzer.analyze(view)
+        metrics.evasion = self.evasion_analyzer.analyze(view, package_info, hits, metrics.scan)
+        metrics.payload = self.payload_analyzer.analyze(view, hits)
+        metrics.exfiltration = self.data_exfiltration_analyzer.analyze(view, hits)
+        metrics.crypto = self.cryptojacking_analyzer.analyze(view, hits)
+        self._fill_excerpts(metrics, view)
+        # The matches of a truncated scan depend on the speed of the machine
+        if cache_key is not None and not metrics.scan.scan_truncated:
+            self.metrics_cache.put(cache_key, metrics)
+        return metrics
+
+    def scan_part(self, file_path: Path, package_info: Dict, part: int, parts: int, raw: Optional[bytes] = None) -> Optional[ScanPart]:
+        """Scan of the part-th of parts subsets of the patterns of a file, to scan a large file on more processes (then analyze_file with all its parts).
+            None if the metrics of the file are already in the cache. Streamed files are not split
+        """
+        view = self._view(file_path, package_info['file_name'], raw)
+        tags = [tag for analyzer in self.pattern_analyzers for tag in analyzer.pattern_tags(view)]
+        if self.metrics_cache is not None and self.metrics_cache.get(self._cache_key(view, tags, package_info['info'])) is not None:
+            return None
+        stats = ScanMetrics()
+        counts, found = self.pattern_engine.scan_patterns(view.text, self.pattern_engine.pattern_keys(tags)[part::parts], stats)
+        return counts, found, stats
+
+    def _fill_excerpts(self, metrics: FileMetrics, view: ContentView) -> None:
+        """Text and context of the evidence from the view, while the content is in memory (the evidence of the unminified content is filled by the EvasionAnalyzer)"""
+        for domain in (metrics.evasion, metrics.payload, metrics.exfiltration, metrics.crypto):
+            for field in fields(domain):
+                evidence = getattr(domain, field.name)
+                if isinstance(evidence, Evidence) and not evidence.unminified:
+                    evidence.excerpts = view.excerpts(evidence, self.evidence.context)
+
+    def _cache_key(self, view: ContentView, tags: List[str], source: SourceType) -> str:
+        """Hash of the content and of how it is analyzed: the tags depend on the file name (e.g. package.json, .min.js),
+            deobfuscated files have their own code type, streamed minified files are not unminified
+        """
+        profile = hashlib.sha256(repr((self.fingerprint, tags, source == SourceType.DEOBFUSCATED, view.streamed)).encode()).hexdigest()
+        return f"{view.digest}:{profile[:16]}"
+
+    def _view(self, file_path: Path, file_name: str, raw: Optional[bytes] = None) -> ContentView:
+        """View of the whole content, or of its chunks if the file is larger than the stream threshold"""
+        if raw is not None:
+            size = len(raw)
+        else:
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                size = 0
+        if self.stream_threshold is not None and size > self.stream_threshold:
+            return StreamedView(file_path, file_name, self.stream_chunk_size, raw)
+        return ContentView(file_path, file_name, raw=raw)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from typing import Optional
+import math
+import threading
+
+@dataclass
+class ExecutionPlan:
+    """How the files of a version are analyzed: in this process or on the workers of the pool, and how many workers"""
+    parallel: bool
+    workers: int
+    files: int
+    total_bytes: int
+    estimated_seconds: float    # Estimated time of the sequential analysis
+
+    def __str__(self) -> str:
+        mode = f"pool, {self.workers} worker{'s' if self.workers > 1 else ''}" if self.parallel else "sequential"
+        return f"{mode} ({self.files} files, {self.total_bytes} bytes, ~{self.estimated_seconds:.2f}s sequential)"
+
+class ExecutionPlanner:
+    """Choose for each version the sequential analysis or the pool, and the workers, from its files and bytes and the scan cost measured so far.
+        A version that takes less than MIN_PARALLEL_SECONDS is analyzed in this process (dispatching it to the workers costs more than it saves),
+        a larger one on a worker for each MIN_PARALLEL_SECONDS of estimated work, up to the workers of the pool.
+        In a thread where the pattern budgets cannot stop a regex match (see UtilsForAnalyzer.deadline) only the small versions are analyzed in this process,
+        their budgets are checked between the matches: a larger one goes to the pool also on a single worker.
+        Shared by the packages of a run: the cost per byte is measured on the versions already analyzed
+    """
+    COST_PER_BYTE = 1e-6            # seconds, until measured
+    COST_PER_FILE = 2e-3            # seconds, view and analyzers of a file whatever its size
+    MIN_PARALLEL_SECONDS = 0.25     # Estimated work of each worker
+    PRIOR_BYTES = 1024 * 1024       # COST_PER_BYTE counts as if measured on these bytes, a few small versions do not move the estimate much
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._seconds = self.COST_PER_BYTE * self.PRIOR_BYTES     # Scan time measured (beyond the cost per file) and bytes scanned in it
+        self._bytes = self.PRIOR_BYTES
+        self._lock = threading.Lock()
+
+    @property
+    def cost_per_byte(self) -> float:
+        return self._seconds / self._bytes
+
+    def plan(self, files: int, total_bytes: int, pool_available: bool = True, deadlines_enforced: bool = True) -> ExecutionPlan:
+        """deadlines_enforced: whether the pattern budgets can stop a regex match in this thread (see UtilsForAnalyzer.deadlines_enforced)"""
+        estimated = self.estimate(files, total_bytes)
+        # Not bounded by the files: a file larger than the share of a worker is scanned in parts by more workers (see AnalysisPool.parts)
+        workers = max(1, min(self.max_workers, math.floor(estimated / self.MIN_PARALLEL_SECONDS))) if pool_available else 1
+        small = estimated < self.MIN_PARALLEL_SECONDS
+        return ExecutionPlan(workers > 1 or (pool_available and not deadlines_enforced and not small), workers, files, total_bytes, estimated)
+
+    def estimate(self, files: int, total_bytes: int) -> float:
+        """Estimated seconds of the sequential analysis"""
+        return files * self.COST_PER_FILE + total_bytes * self.cost_per_byte
+
+    def record(self, plan: ExecutionPlan, seconds: float) -> None:
+        """Add the time of an analysis to the measured cost (for a parallel one, the wall time on each of its workers: an upper bound)"""
+        busy = seconds * plan.workers if plan.parallel else seconds
+        with self._lock:
+            self._seconds += max(0.0, busy - plan.files * self.COST_PER_FILE)
+            self._bytes += plan.total_bytes
\ No newline at end of file
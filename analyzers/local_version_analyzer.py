@@ -1,4 +1,4 @@
-from utils import synchronized_print
+from utils import synchronized_print, TarballSource
 import os
 import re
 import tarfile
@@ -24,11 +24,10 @@ class LocalVersionAnalyzer:
             return
 
         synchronized_print(f"Found {len(local_versions)} local versions for {self.pkg_name}", target=OutputTarget.FILE_ONLY)
-        self.local_extract_dir.mkdir(parents=True, exist_ok=True)
 
         for local_version in local_versions:
             try:
-                extracted_path = self._extract_local_version(
+                tarball = self._local_version_source(
                     local_version,
                     self.local_extract_dir
                 )
@@ -37,10 +36,10 @@ class LocalVersionAnalyzer:
                 #version_with_suffix = f"{local_version['version']}+local"
                 #version_with_suffix = f"v{local_version['version']}-local"
                 #version_with_suffix = f"posthog-node@{local_version['version']}-local"
-                self._local_versions[version_with_suffix] = extracted_path
+                self._local_versions[version_with_suffix] = tarball
                 synchronized_print(f"Added local version {version_with_suffix}")
             except Exception as e:
-                synchronized_print(f"Error extracting {local_version['filename']}: {e}")
+                synchronized_print(f"Error reading {local_version['filename']}: {e}")
 
     def _get_local_versions_for_package(self) -> List[Dict]:
         """Finds all local versions for a package"""
@@ -100,19 +99,15 @@ class LocalVersionAnalyzer:
         """Checks if the string is a valid version"""
         return bool(re.match(r'^\d+\.\d+', version_str))    # Begin with one or more digits, followed by a dot , followed by one or more digits and they may have something else after them
     
-    def _extract_local_version(self, local_version_info: Dict, destination_dir: Path) -> Path:
-        """Extracts a local version"""
+    def _local_version_source(self, local_version_info: Dict, destination_dir: Path) -> TarballSource:
+        """Source of a local version, read from the tarball when analyzed (its files are extracted in destination_dir only if needed on disk)"""
         tgz_path = local_version_info['path']
         version = local_version_info['version']
         package = local_version_info.get('package_detected', 'unknown')
-        
-        extract_path = destination_dir / f"{package}-{version}-local"
-        extract_path.mkdir(parents=True, exist_ok=True)
-        
-        with tarfile.open(tgz_path, 'r:gz') as tar:
-            tar.extractall(path=extract_path)
-        
-        return extract_path
+
+        if not tarfile.is_tarfile(tgz_path):
+            raise ValueError("not a valid tarball")
+        return TarballSource(tgz_path, destination_dir / f"{package}-{version}-local")
 
     def extract_numeric_version(self, version_str: str) -> str:
         """Extract numeric part of version string (e.g., '1.2.3' from 'v1.2.3-candidate')"""
@@ -145,18 +140,18 @@ class LocalVersionAnalyzer:
     def unite_versions(self, entries: List[VersionEntry]) -> List[VersionEntry]:
         """Combines Git and local versions into a single sorted list of VersionEntry"""
         if self._local_versions:
-            for l_name, l_path in self._local_versions.items():
+            for l_name, l_source in self._local_versions.items():
                 inserted = False
                 for i, entry in enumerate(entries):
                     # If the version in the entry is newer than the local version
                     if self.compare_versions(entry.name, l_name) > 0:
-                        entries.insert(i, VersionEntry(name=l_name, source=SourceType.LOCAL, ref=l_path))
+                        entries.insert(i, VersionEntry(name=l_name, source=SourceType.LOCAL, ref=l_source))
                         inserted = True
                         break
                 
                 # It is the most recent version, I add it at the end
                 if not inserted:
-                    entries.append(VersionEntry(name=l_name, source=SourceType.LOCAL, ref=l_path))
+                    entries.append(VersionEntry(name=l_name, source=SourceType.LOCAL, ref=l_source))
 
         return entries
         # I can't use packaging.version here because some versions have a suffix that makes them invalid e.g. 2.1.0-candidate
@@ -1,17 +1,25 @@
 from pathlib import Path
-from utils import NPMClient
+from typing import Optional
+from contextlib import nullcontext
+from utils import NPMClient, MetricsCache, prefetch
 from utils.logging_utils import OutputTarget
 from .version_analyzer import VersionAnalyzer
+from .code_analyzer import CodeAnalyzer
+from .analysis_pool import AnalysisPool
+from .execution_planner import ExecutionPlanner
 from git import Repo
 from utils import synchronized_print
-from models import VersionEntry
+from models import VersionEntry, EvidencePolicy
 from packaging.version import InvalidVersion
 from analyzers.local_version_analyzer import LocalVersionAnalyzer
 import re
 
 class PackageAnalyzer:
     """Coordinator for analyzing Git and local versions of an npm package"""
-    def __init__(self, include_local: bool = False, local_versions_dir: str = "./other_versions", workers: int = 1, package_name: str = "", output_dir: Path = Path(".")):
+    def __init__(self, include_local: bool = False, local_versions_dir: str = "./other_versions", workers: int = 1, package_name: str = "", output_dir: Path = Path("."),
+                 evidence_policy: Optional[EvidencePolicy] = None, stream_threshold: Optional[int] = CodeAnalyzer.STREAM_THRESHOLD,
+                 metrics_cache: Optional[MetricsCache] = None, pool: Optional[AnalysisPool] = None, parallel_versions: bool = False,
+                 planner: Optional[ExecutionPlanner] = None):
         self.pkg_name = package_name
         self.output_dir = output_dir
         self.npm_client = NPMClient(pkg_name=package_name)
@@ -22,7 +30,13 @@ class PackageAnalyzer:
             include_local=include_local,
             local_versions_dir=local_versions_dir,
             package_name=package_name,
-            output_dir=output_dir
+            output_dir=output_dir,
+            evidence_policy=evidence_policy,
+            stream_threshold=stream_threshold,
+            metrics_cache=metrics_cache,
+            pool=pool,
+            parallel_versions=parallel_versions,
+            planner=planner
         )
         
     def analyze_package(self) -> None:
@@ -34,16 +48,37 @@ class PackageAnalyzer:
         else:
             print(f"Unable to analyze {self.pkg_name} - Git repository not available")
         '''
-        entries = self.npm_client.download_package_versions_tarball()
-        if not entries:
+        if self.fetch_versions():
+            self.analyze_versions()
+
+    def fetch_versions(self, download_slot=None) -> bool:
+        """Fetch the versions of the package from the registry (network bound part of the analysis), False if there are no versions.
+            Their tarballs are downloaded in the background, at most DOWNLOAD_THREADS versions at the same time and PIPELINE_DEPTH more ready for the scan.
+            download_slot (e.g. a semaphore shared by more packages) is held only during each request
+        """
+        with download_slot or nullcontext():
+            data = self.npm_client.get_npm_package_data()
+        versions = self.npm_client.get_versions_to_download(data)
+        if not versions:
             synchronized_print(f"Unable to analyze {self.pkg_name} - No versions available")
-            return
+            return False
+        # The downloads in flight plus the versions waiting in the pipeline, refilled as the versions are scanned
+        entries = self.npm_client.iter_version_tarballs(data, versions, download_slot=download_slot,
+                                                        window=VersionAnalyzer.PIPELINE_DEPTH + self.npm_client.DOWNLOAD_THREADS)
         if self.include_local:
             #synchronized_print(f"Including local versions in tarball analysis for {self.pkg_name}", target=OutputTarget.TERMINAL_ONLY)
+            # The local versions are placed comparing them with all the others, every tarball is downloaded before the scan
             localversionanalyzer = LocalVersionAnalyzer(local_versions_dir=self.local_versions_dir, pkg_name=self.pkg_name)
             localversionanalyzer.setup_local_versions()
-            entries = localversionanalyzer.unite_versions(entries)
+            entries = localversionanalyzer.unite_versions(list(entries))
+        else:
+            entries = prefetch(entries, VersionAnalyzer.PIPELINE_DEPTH)
+            self.version_analyzer.total_versions = len(versions)
         self.version_analyzer.entries = entries
+        return True
+
+    def analyze_versions(self) -> None:
+        """Scan and compare the fetched versions (CPU bound part of the analysis)"""
         self.version_analyzer.analyze_versions()
         
     '''
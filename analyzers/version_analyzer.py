@@ -1,23 +1,48 @@
+from copy import deepcopy
+from dataclasses import replace
 from pathlib import Path
-from typing import List
-import multiprocessing as mp
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import threading
+import time
 from models.composed_metrics import FileMetrics, VersionMetrics, AggregateVersionMetrics
 from reporters import CSVReporter, TextReporter
-from utils import FileHandler, synchronized_print, Deobfuscator
+from utils import FileHandler, synchronized_print, Deobfuscator, OutputTarget, MetricsCache, prefetch, BackgroundConsumer, UtilsForAnalyzer
 from .aggregate_metrics_by_tag import AggregateMetricsByTag
 from .code_analyzer import CodeAnalyzer
+from .analysis_pool import AnalysisPool
+from .execution_planner import ExecutionPlanner
 from comparators import VersionComparator
-from models import CodeType, SourceType
+from models import CodeType, SourceType, EvidencePolicy, VersionManifest, VersionEntry
 class VersionAnalyzer:
-    """Handles analysis of versions from a Git repository and local versions"""
-    def __init__(self, max_processes: int = 1, include_local: bool = False, local_versions_dir: str = "./other_versions", package_name: str = "", output_dir: Path = Path(".")):
+    """Handles analysis of versions from a Git repository and local versions.
+        The versions go through a pipeline: the tarballs of the next versions are read while a version is scanned,
+        and the results of a version are saved while the next one is scanned
+    """
+    PIPELINE_DEPTH = 2      # Versions read (or downloaded) ahead of the scan, and scanned versions waiting to be saved
+    # A file of a package: path relative to the package and (size, SHA-256) of its content, as in the VersionManifest
+    FileKey = Tuple[str, Tuple[int, str]]
+    def __init__(self, max_processes: int = 1, include_local: bool = False, local_versions_dir: str = "./other_versions", package_name: str = "", output_dir: Path = Path("."),
+                 evidence_policy: Optional[EvidencePolicy] = None, stream_threshold: Optional[int] = CodeAnalyzer.STREAM_THRESHOLD,
+                 metrics_cache: Optional[MetricsCache] = None, pool: Optional[AnalysisPool] = None, parallel_versions: bool = False,
+                 planner: Optional[ExecutionPlanner] = None):
         self.package_name = package_name
         self.output_dir = output_dir
-        self.code_analyzer = CodeAnalyzer()
+        self.evidence_policy = evidence_policy or EvidencePolicy()
+        self.stream_threshold = stream_threshold
+        self.metrics_cache = metrics_cache
+        self.code_analyzer = CodeAnalyzer(self.evidence_policy, stream_threshold, metrics_cache)
         self.max_processes = max_processes
+        # Pool of the run, shared with the other packages (its workers analyze with the same evidence policy, stream threshold and cache)
+        self.pool = pool
+        # Scan the files of all the versions together on the pool, then compare the versions in order (see _prescan_versions)
+        self.parallel_versions = parallel_versions
+        # Chooses for each version the sequential analysis or the pool (None: always the pool, if any)
+        self.planner = planner
         self.include_local = include_local
         self.local_versions_dir = local_versions_dir
-        self.entries = []
+        self.entries: Iterable[VersionEntry] = []    # A list, or the entries downloaded in the background
+        self.total_versions: Optional[int] = None     # Number of entries if they are not a list
         self.repo = None
         self.comparator = VersionComparator()
     
@@ -27,146 +52,298 @@ class VersionAnalyzer:
             synchronized_print(f"No versions to analyze for {self.package_name} or repository not set")
             return
 
+        if self.pool is None and self.max_processes > 1:
+            # Forking the pool from a thread is not safe (the locks held by the other threads stay locked in the workers), and a pool
+            # for each package would not respect the workers of the run: off the main thread the shared pool is required (see main)
+            if threading.current_thread() is not threading.main_thread():
+                raise ValueError(f"{self.max_processes} processes for {self.package_name} on thread {threading.current_thread().name}: pass the AnalysisPool of the run")
+            # Without the pool of the run, a pool for all the versions of this package
+            self.pool = AnalysisPool(max(1, self.max_processes), self.evidence_policy, self.stream_threshold, self.metrics_cache)
+            try:
+                self._analyze_entries()
+            finally:
+                self.pool.close()
+                self.pool = None
+            return
+        self._analyze_entries()
+
+    def _analyze_entries(self) -> None:
         previous_aggregate_metrics = VersionMetrics()
         all_aggregate_metrics_by_tag = AggregateVersionMetrics()
         last_version = "first"
         count_versions = 0
+        # Files of the previous version and their metrics, the unchanged files are not scanned again
+        previous_manifest: Optional[VersionManifest] = None
+        previous_files: Dict[str, FileMetrics] = {}
 
-        for i, entry in enumerate(self.entries):
-            synchronized_print(f"  [{i+1}/{len(self.entries)}] Analyzing tag {entry.name}")
-            try:
-                if entry.source == SourceType.GIT:
-                    self.repo.git.checkout(entry.ref.name, force=True)
-                    repo_path = Path(self.repo.working_tree_dir)
-                if entry.source == SourceType.LOCAL or entry.source == SourceType.TARBALL:
-                    repo_path = entry.ref / "package"  # entry.ref is the path to the extracted local version
-                
-                # curr_metrics is the list of FileMetrics for all files in the current version
-                # current_metrics e.g. list[FileMetrics(package='example', version='1.0.0', file_path='index.js', ...), FileMetrics(...), ...]
-                curr_metrics = self._analyze_version(entry.name, repo_path, entry.source)
+        # Metrics of the files of all the versions, scanned in parallel before the versions are compared
+        prescanned: Dict[VersionAnalyzer.FileKey, Tuple[FileMetrics, str]] = {}
+        if self.parallel_versions and self.pool is not None and self.repo is None:
+            self.entries = list(self.entries)
+            prescanned, reads = self._prescan_versions(self.entries)
+            # The tarballs are not read again, each version is dropped once compared
+            read_entries = (reads.popleft() for _ in range(len(reads)))
+        else:
+            read_entries = prefetch(self._read_tarballs(self.entries), self.PIPELINE_DEPTH)
+
+        total = len(self.entries) if isinstance(self.entries, list) else self.total_versions
+        # Results of each version saved in the background, in order
+        with BackgroundConsumer(self._save_version, self.PIPELINE_DEPTH, name="reporter") as reporter:
+            for i, (entry, read) in enumerate(read_entries):
+                synchronized_print(f"  [{i+1}/{total or '?'}] Analyzing tag {entry.name}")
+                try:
+                    if isinstance(read, Exception):
+                        raise read
+                    # Content of the files read from a tarball, empty for a Git checkout (the files are read from disk)
+                    contents: Dict[str, bytes] = {}
+                    if entry.source == SourceType.GIT:
+                        self.repo.git.checkout(entry.ref.name, force=True)
+                        repo_path = Path(self.repo.working_tree_dir)
+                        files = FileHandler().get_all_files(repo_path)
+                        manifest = FileHandler.build_manifest(repo_path, files)
+                    if entry.source == SourceType.LOCAL or entry.source == SourceType.TARBALL:
+                        tarball = entry.ref     # entry.ref is the TarballSource of the version, its files are read in memory without extracting it
+                        repo_path = tarball.package_dir
+                        contents = read     # Read by the read stage of the pipeline
+                        files = [repo_path / path for path in contents]
+                        manifest = VersionManifest.from_contents(contents)
+
+                    changes = manifest.diff(previous_manifest)
+                    # Unchanged files keep the metrics of the previous version (unless its scan was truncated), removed files are not in the manifest
+                    carried = {path: replace(previous_files[path], version=entry.name) for path in changes.unchanged
+                               if path in previous_files and not previous_files[path].scan.scan_truncated}
+                    # Files already scanned in parallel with the other versions (parallel_versions), the others are scanned now
+                    reused = self._reuse_prescanned(prescanned, entry.name, manifest, [path for path in manifest.files if path not in carried])
+                    scanned = list(reused.values()) + self._analyze_version(
+                        entry.name, repo_path, entry.source, [f for f in files if str(f.relative_to(repo_path)) not in carried.keys() | reused.keys()], contents)
+                    synchronized_print(f"    Files: {len(changes.added)} added, {len(changes.removed)} removed, {len(changes.modified)} modified, "
+                                       f"{len(changes.unchanged)} unchanged. Scanned {len(scanned)} files", target=OutputTarget.FILE_ONLY)
+
+                    # curr_metrics is the list of FileMetrics for all files in the current version, in the order of the files
+                    # current_metrics e.g. list[FileMetrics(package='example', version='1.0.0', file_path='index.js', ...), FileMetrics(...), ...]
+                    by_path = {**carried, **{m.file_path: m for m in scanned}}
+                    curr_metrics = [by_path[path] for path in manifest.files if path in by_path]
+                    next_files = dict(by_path)
                 
-                # Identify obfuscated JS files and attempt deobfuscation
-                obfuscated_files = [f for f in curr_metrics if f.evasion.code_type == CodeType.OBFUSCATED and f.file_path.endswith('.js')]
-                if obfuscated_files:
-                    synchronized_print(f"    Found {len(obfuscated_files)} obfuscated js files, trying to deobfuscate it...")
-                    for f in obfuscated_files:
-                        succ = Deobfuscator.deobfuscate(
-                            path_original_file= repo_path / f.file_path,  # e.g. other_versions/extracted/package_name/version/package/index.js
-                            package_name=self.package_name,               # e.g. package_name
-                            version=entry.name,                           # e.g. version-local
-                            file_name=f.file_path                         # e.g. index.js
-                        )
-                        if not succ:
-                            synchronized_print(f"    Deobfuscation failed for file: {f.file_path} in version {entry.name}, skipping analysis of this deobfuscated file.")
-                            continue
-                        path_dir = Path('deobfuscated_files') / self.package_name / entry.name
-                        path_file = path_dir / f.file_path.replace('.js', '-deobfuscated.js')
-                        deob = self._analyze_single_file(
-                            file_path=path_file,
-                            version=entry.name,
-                            package_dir=path_dir,
-                            source=SourceType.DEOBFUSCATED
-                        )
-                        curr_metrics.append(deob)
+                    # Identify obfuscated JS files and attempt deobfuscation
+                    obfuscated_files = [f for f in curr_metrics if f.evasion.code_type == CodeType.OBFUSCATED and f.file_path.endswith('.js')]
+                    if obfuscated_files:
+                        synchronized_print(f"    Found {len(obfuscated_files)} obfuscated js files, trying to deobfuscate it...")
+                        for f in obfuscated_files:
+                            # The deobfuscator needs the file on disk, only this file is extracted from the tarball
+                            original_file = tarball.extract(f.file_path) if contents else repo_path / f.file_path
+                            succ = Deobfuscator.deobfuscate(
+                                path_original_file=original_file,             # e.g. tarballs/package_name/extracted/version/package/index.js
+                                package_name=self.package_name,               # e.g. package_name
+                                version=entry.name,                           # e.g. version-local
+                                file_name=f.file_path                         # e.g. index.js
+                            )
+                            if not succ:
+                                synchronized_print(f"    Deobfuscation failed for file: {f.file_path} in version {entry.name}, skipping analysis of this deobfuscated file.")
+                                continue
+                            path_dir = Path('deobfuscated_files') / self.package_name / entry.name
+                            path_file = path_dir / f.file_path.replace('.js', '-deobfuscated.js')
+                            deob = self._analyze_single_file(
+                                file_path=path_file,
+                                version=entry.name,
+                                package_dir=path_dir,
+                                source=SourceType.DEOBFUSCATED
+                            )
+                            if deob is None:
+                                synchronized_print(f"    Analysis failed for deobfuscated file: {f.file_path} in version {entry.name}")
+                                continue
+                            curr_metrics.append(deob)
                 
-                synchronized_print(f"    Analyzed {len(curr_metrics)} files")
+                    synchronized_print(f"    Analyzed {len(curr_metrics)} files")
+                    # Files scanned for this version (also the deobfuscated ones), not carried from the previous one
+                    scanned = [f for f in curr_metrics if f.file_path not in carried]
+                    skipped_patterns = sum(f.scan.patterns_skipped for f in scanned)
+                    total_patterns = skipped_patterns + sum(f.scan.patterns_scanned for f in scanned)
+                    synchronized_print(f"    Prefilter skipped {skipped_patterns}/{total_patterns} pattern scans", target=OutputTarget.FILE_ONLY)
+                    if self.metrics_cache is not None:
+                        # Counted here, the files can be analyzed by the pool workers with their own copy of the cache
+                        cached_files = sum(f.scan.cached for f in scanned)
+                        self.metrics_cache.record(cached_files, len(scanned) - cached_files)
+                        synchronized_print(f"    Metrics cache served {cached_files}/{len(scanned)} scanned files", target=OutputTarget.FILE_ONLY)
+                    for f in curr_metrics:
+                        if f.scan.scan_truncated:
+                            synchronized_print(f"    Scan truncated by time budget for file {f.file_path}, patterns: {', '.join(f.scan.budget_exceeded_patterns)}")
                 
-                # aggregate_metrics_by_tag is the aggregation of all metrics from the all files in the current version
-                # aggregate_metrics_by_tag e.g. VersionMetrics(package='example', version='1.0.0', code_types=['Clear', ...], obfuscation_patterns_count=5, ...)
-                aggregate_metrics_by_tag = AggregateMetricsByTag().aggregate_metrics_by_tag(curr_metrics, repo_path, entry.source)
-
-                flags = self.comparator.compare_tags(
-                    all_prev_tag_metrics=all_aggregate_metrics_by_tag,
-                    prev_tag_metrics=previous_aggregate_metrics,
-                    curr_tag_metrics=aggregate_metrics_by_tag,
-                    package=self.package_name,
-                    version=entry.name
-                )
-
-                # all_aggregate_metrics_by_tag is all aggregated metrics for all versions analyzed so far (NO last version included)
-                # is updated incrementally each time, using for identifying flags and to plot the evolution of metrics over versions
-                # all_aggregate_metrics_by_tag e.g. AggregateVersionMetrics(package='example', version='all up to 1.0.0 (included) + 1.1.0 (included)', code_types=['Clear', ...], obfuscation_patterns_count=15, ...)
-                all_aggregate_metrics_by_tag = AggregateMetricsByTag.aggregate_metrics_incremental(
-                    all_aggregate_metrics_by_tag, aggregate_metrics_by_tag, count_versions, last_version)
+                    # aggregate_metrics_by_tag is the aggregation of all metrics from the all files in the current version
+                    # aggregate_metrics_by_tag e.g. VersionMetrics(package='example', version='1.0.0', code_types=['Clear', ...], obfuscation_patterns_count=5, ...)
+                    aggregate_metrics_by_tag = AggregateMetricsByTag().aggregate_metrics_by_tag(curr_metrics, repo_path, entry.source)
+                    aggregate_metrics_by_tag.generic.files_added = len(changes.added)
+                    aggregate_metrics_by_tag.generic.files_removed = len(changes.removed)
+                    aggregate_metrics_by_tag.generic.files_modified = len(changes.modified)
+
+                    flags = self.comparator.compare_tags(
+                        all_prev_tag_metrics=all_aggregate_metrics_by_tag,
+                        prev_tag_metrics=previous_aggregate_metrics,
+                        curr_tag_metrics=aggregate_metrics_by_tag,
+                        package=self.package_name,
+                        version=entry.name
+                    )
+
+                    # all_aggregate_metrics_by_tag is all aggregated metrics for all versions analyzed so far (NO last version included)
+                    # is updated incrementally each time, using for identifying flags and to plot the evolution of metrics over versions
+                    # all_aggregate_metrics_by_tag e.g. AggregateVersionMetrics(package='example', version='all up to 1.0.0 (included) + 1.1.0 (included)', code_types=['Clear', ...], obfuscation_patterns_count=15, ...)
+                    all_aggregate_metrics_by_tag = AggregateMetricsByTag.aggregate_metrics_incremental(
+                        all_aggregate_metrics_by_tag, aggregate_metrics_by_tag, count_versions, last_version)
                 
-                # Update for next iteration
-                count_versions += 1
-                last_version = aggregate_metrics_by_tag.version
-                previous_aggregate_metrics = aggregate_metrics_by_tag
-
-                # Incremental save detailed metrics for the current tag
-                all_metrics_csv = self.output_dir / "all_metrics.csv"
-                flags_csv = self.output_dir / "flags.csv"
-                aggregate_metrics_csv = self.output_dir / "aggregate_metrics_by_tag.csv"
-                aggregate_metrics_history_csv = self.output_dir / "aggregate_metrics_history.csv"
-                flags_summary_txt = self.output_dir / f"{self.package_name.replace('/', '_')}_flags_summary.txt"
-
-                CSVReporter.save_csv(all_metrics_csv, curr_metrics)
-                CSVReporter.save_csv(aggregate_metrics_csv, aggregate_metrics_by_tag)
-                CSVReporter.save_csv(aggregate_metrics_history_csv, all_aggregate_metrics_by_tag)
-                CSVReporter.save_csv(flags_csv, flags)
-                TextReporter.generate_report(flags_summary_txt, flags)
+                    # Update for next iteration
+                    count_versions += 1
+                    last_version = aggregate_metrics_by_tag.version
+                    previous_aggregate_metrics = aggregate_metrics_by_tag
+                    previous_manifest = manifest
+                    previous_files = next_files
 
-            except Exception as e:
-                synchronized_print(f"Error analyzing tag {entry.name}: {e}")
+                    # Incremental save detailed metrics for the current tag, by the reporter while the next tag is scanned
+                    # The history is updated in place by the next tags, the reporter saves a copy of it
+                    reporter.submit((entry.name, curr_metrics, aggregate_metrics_by_tag, deepcopy(all_aggregate_metrics_by_tag), flags))
+
+                except Exception as e:
+                    synchronized_print(f"Error analyzing tag {entry.name}: {e}")
 
         return
 
-    def _analyze_version(self, version: str, package_dir: Path, source: SourceType) -> List[FileMetrics]:
-        """Analyze all files of a specific Git version"""
+    def _prescan_versions(self, entries: List[VersionEntry]) -> Tuple[Dict[FileKey, Tuple[FileMetrics, str]], Deque[Tuple[VersionEntry, Union[Dict[str, bytes], Exception, None]]]]:
+        """Scan on the pool, all at once, each distinct file (path and content) of the versions read from a tarball, so that the workers are busy also if the versions have few files.
+            Returns its metrics with the version where it was scanned, and each entry with what was read (as _read_tarballs) for the comparison of the versions.
+            All the distinct contents are in memory until the versions are compared: the same file in more versions is kept once
+        """
+        first_seen: Dict[VersionAnalyzer.FileKey, str] = {}
+        distinct: Dict[VersionAnalyzer.FileKey, bytes] = {}
+        batches = []
+        reads = deque()
+        for entry, read in prefetch(self._read_tarballs(entries), self.PIPELINE_DEPTH):
+            if read is None or isinstance(read, Exception):
+                reads.append((entry, read))
+                continue    # Git tag or unreadable tarball, handled when the versions are compared
+            manifest = VersionManifest.from_contents(read)
+            read = {path: distinct.setdefault((path, manifest.files[path]), content) for path, content in read.items()}
+            reads.append((entry, read))
+            new_files = [(path, read[path]) for path, entry_key in manifest.files.items() if (path, entry_key) not in first_seen]
+            for path, _ in new_files:
+                first_seen[(path, manifest.files[path])] = entry.name
+            # The tasks of all the versions are queued on the pool together
+            batches.append((entry, manifest, self.pool.analyze_files(self.package_name, entry.name, entry.ref.package_dir, entry.source, new_files), [path for path, _ in new_files]))
+        synchronized_print(f"  Scanning {len(first_seen)} distinct files of {len(batches)} versions in parallel", target=OutputTarget.FILE_ONLY)
+
+        prescanned: Dict[VersionAnalyzer.FileKey, Tuple[FileMetrics, str]] = {}
+        for entry, manifest, results, paths in batches:
+            for index, metrics in results:
+                if metrics is not None:
+                    prescanned[(paths[index], manifest.files[paths[index]])] = (metrics, entry.name)
+        return prescanned, reads
 
-        files = FileHandler().get_all_files(package_dir)
-        if self.max_processes > 1:
-            file_results = self._analyze_files_parallel(files, version, package_dir, source)
+    def _reuse_prescanned(self, prescanned: Dict[FileKey, Tuple[FileMetrics, str]], version: str, manifest: VersionManifest, paths: List[str]) -> Dict[str, FileMetrics]:
+        """Metrics of the files already scanned by _prescan_versions, by path. A truncated scan is used only for its own version
+            (as the incremental scan, the other versions scan the file again)
+        """
+        reused = {}
+        for path in paths:
+            hit = prescanned.get((path, manifest.files[path]))
+            if hit is None:
+                continue
+            metrics, scanned_version = hit
+            if scanned_version == version:
+                reused[path] = metrics
+            elif not metrics.scan.scan_truncated:
+                reused[path] = replace(metrics, version=version)
+        return reused
+
+    def _read_tarballs(self, entries: Iterable[VersionEntry]) -> Iterator[Tuple[VersionEntry, Union[Dict[str, bytes], Exception, None]]]:
+        """Read stage of the pipeline: each entry with the content of the files of its tarball (the error if it cannot be read), None for Git tags"""
+        for entry in entries:
+            if entry.source == SourceType.LOCAL or entry.source == SourceType.TARBALL:
+                try:
+                    yield entry, entry.ref.read()
+                except Exception as e:
+                    yield entry, e
+            else:
+                yield entry, None
+
+    def _save_version(self, results: Tuple) -> None:
+        """Report stage of the pipeline: append the results of a tag to the CSV files and to the flags report"""
+        version, curr_metrics, aggregate_metrics_by_tag, all_aggregate_metrics_by_tag, flags = results
+        try:
+            all_metrics_csv = self.output_dir / "all_metrics.csv"
+            flags_csv = self.output_dir / "flags.csv"
+            aggregate_metrics_csv = self.output_dir / "aggregate_metrics_by_tag.csv"
+            aggregate_metrics_history_csv = self.output_dir / "aggregate_metrics_history.csv"
+            flags_summary_txt = self.output_dir / f"{self.package_name.replace('/', '_')}_flags_summary.txt"
+
+            CSVReporter.save_csv(all_metrics_csv, curr_metrics)
+            CSVReporter.save_csv(aggregate_metrics_csv, aggregate_metrics_by_tag)
+            CSVReporter.save_csv(aggregate_metrics_history_csv, all_aggregate_metrics_by_tag)
+            CSVReporter.save_csv(flags_csv, flags)
+            # The snippets of the evidence of the triggered flags, taken when the files were analyzed
+            TextReporter.generate_report(flags_summary_txt, flags, curr_metrics)
+        except Exception as e:
+            synchronized_print(f"Error saving tag {version}: {e}")
+
+    def _analyze_version(self, version: str, package_dir: Path, source: SourceType, files: Optional[List[Path]] = None,
+                         contents: Optional[Dict[str, bytes]] = None) -> List[FileMetrics]:
+        """Analyze the given files (all files if not specified) of a specific version, from their contents if in memory"""
+
+        if files is None:
+            files = FileHandler().get_all_files(package_dir)
+        contents = contents or {}
+        plan = None
+        if self.planner is not None:
+            sizes = AnalysisPool.file_sizes(package_dir, [(str(f.relative_to(package_dir)), contents.get(str(f.relative_to(package_dir)))) for f in files])
+            plan = self.planner.plan(len(files), sum(sizes), self.pool is not None, UtilsForAnalyzer.deadlines_enforced())
+            synchronized_print(f"    Execution: {plan}", target=OutputTarget.FILE_ONLY)
+        started = time.perf_counter()
+        # Off the main thread the planner keeps in this process only the small versions, their pattern budgets are checked between the matches
+        if self.pool is not None and (plan is None or plan.parallel):
+            file_results = self._analyze_files_parallel(files, version, package_dir, source, contents, plan.workers if plan is not None else None)
         else:
-            file_results = self._analyze_files_sequential(files, version, package_dir, source)
+            file_results = self._analyze_files_sequential(files, version, package_dir, source, contents)
+        if plan is not None:
+            self.planner.record(plan, time.perf_counter() - started)
         
         # Filter out None results (failed analyses)
         valid_results = [r for r in file_results if r is not None]    
         return valid_results
 
-    def _analyze_files_sequential(self, files: List[Path], version: str, package_dir: Path, source: SourceType) -> List[FileMetrics]:
+    def _analyze_files_sequential(self, files: List[Path], version: str, package_dir: Path, source: SourceType, contents: Dict[str, bytes]) -> List[FileMetrics]:
         """Sequential analysis of files"""
         results = []
         for file_path in files:
             try:
-                result = self._analyze_single_file(file_path, version, package_dir, source)
+                result = self._analyze_single_file(file_path, version, package_dir, source, contents.get(str(file_path.relative_to(package_dir))))
                 results.append(result)
             except Exception as e:
                 print(f"Error analyzing {file_path}: {e}")
                 results.append(None)
         return results
 
-    def _analyze_files_parallel(self, files: List[Path], version: str, package_dir: Path, source: SourceType) -> List[FileMetrics]:
-        """Parallel analysis of files"""
-        # Prepare arguments for each file
-        args_list = []
-        for file_path in files:
-            args_list.append((file_path, version, package_dir, source))
-        
-        # Use multiprocessing Pool
-        with mp.Pool(processes=self.max_processes) as pool:
-            results = pool.starmap(self._analyze_single_file_wrapper, args_list)
-        
+    def _analyze_files_parallel(self, files: List[Path], version: str, package_dir: Path, source: SourceType, contents: Dict[str, bytes],
+                                workers: Optional[int] = None) -> List[FileMetrics]:
+        """Parallel analysis of files, on the workers of the pool (all of them if workers is None)"""
+        # Only the relative path of each file is sent to the workers, with the content read from a tarball
+        file_names = [str(file_path.relative_to(package_dir)) for file_path in files]
+        results: List[Optional[FileMetrics]] = [None] * len(files)
+        # Collected as they are completed, in the order of the files
+        for index, metrics in self.pool.analyze_files(self.package_name, version, package_dir, source, [(name, contents.get(name)) for name in file_names], workers):
+            results[index] = metrics
         return results
 
-    def _analyze_single_file_wrapper(self, file_path: Path, version: str, package_dir: Path, source: SourceType) -> FileMetrics:
-        """Wrapper function for parallel execution that handles exceptions"""
-        try:
-            return self._analyze_single_file(file_path, version, package_dir, source)
-        except Exception as e:
-            rel_path = file_path.relative_to(package_dir) if package_dir in file_path.parents else file_path
-            print(f"Error analyzing {rel_path}: {type(e).__name__}: {e}")
-            return None
-
-    def _analyze_single_file(self, file_path: Path, version: str, package_dir: Path, source: SourceType) -> FileMetrics:
-        """Analyze a single file"""
-        rel_path = str(file_path.relative_to(package_dir))
-        package_info = {
+    def _analyze_single_file(self, file_path: Path, version: str, package_dir: Path, source: SourceType, raw: Optional[bytes] = None) -> Optional[FileMetrics]:
+        """Analyze a single file, from its content if already in memory. A deobfuscated file (not planned with its version) outside of the main thread
+            is analyzed on a worker of the pool, where its pattern budgets can stop a regex match and its timeout applies (None if it fails there)
+        """
+        if self.pool is not None and source == SourceType.DEOBFUSCATED and not UtilsForAnalyzer.deadlines_enforced():
+            name = str(file_path.relative_to(package_dir))
+            return self._analyze_files_parallel([file_path], version, package_dir, source, {name: raw} if raw is not None else {}, workers=1)[0]
+        return self.code_analyzer.analyze_file(file_path, self._package_info(file_path, version, package_dir, source), raw)
+
+    def _package_info(self, file_path: Path, version: str, package_dir: Path, source: SourceType) -> Dict:
+        return {
             'name': self.package_name,
             'version': version,
             'git_repo_path': str(package_dir),
-            'file_name': rel_path,
+            'file_name': str(file_path.relative_to(package_dir)),
             'info': source
-        }
-        return self.code_analyzer.analyze_file(file_path, package_info)
\ No newline at end of file
+        }
\ No newline at end of file
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+import threading
+
+class BatchScheduler:
+    """Analyze more packages at the same time, so that the downloads of a package overlap the scan of the others.
+        At most download_workers requests to the registry and at most scan_workers packages scanned at the same time
+        (their files are analyzed by the shared pool of processes). Packages start in the order of the list, each one writes only in its own output directory
+    """
+    DOWNLOAD_WORKERS = 4
+    SCAN_WORKERS = 2
+
+    def __init__(self, download_workers: int = DOWNLOAD_WORKERS, scan_workers: int = SCAN_WORKERS):
+        self.download_workers = max(1, download_workers)
+        self.scan_workers = max(1, scan_workers)
+        self.download_slots = threading.BoundedSemaphore(self.download_workers)
+        self.scan_slots = threading.BoundedSemaphore(self.scan_workers)
+
+    def run(self, packages: List[str], analyze: Callable[..., None]) -> None:
+        """Call analyze(package, package_index, download_slot=..., scan_slot=...) for each package, an error stops only its package"""
+        # A thread for each package downloading or scanning: a package waiting for a scan slot downloads its first tarballs in the meantime
+        with ThreadPoolExecutor(max_workers=self.download_workers + self.scan_workers, thread_name_prefix="package") as executor:
+            futures = [
+                executor.submit(analyze, package, i + 1, download_slot=self.download_slots, scan_slot=self.scan_slots)
+                for i, package in enumerate(packages)
+            ]
+            for package, future in zip(packages, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error analyzing {package}: {type(e).__name__}: {e}")
\ No newline at end of file
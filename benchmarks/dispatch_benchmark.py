@@ -0,0 +1,84 @@
+"""Micro-benchmark of the dispatch of the files to the workers of the pool: bytes pickled for each file and time of the analysis.
+
+    python -m benchmarks.dispatch_benchmark                          # files of the fixtures, read from disk by the workers
+    python -m benchmarks.dispatch_benchmark --source pkg-1.0.0.tgz   # files of a tarball, sent to the workers in memory
+
+The legacy dispatch is pool.starmap on a bound method of the VersionAnalyzer (pickled with its CodeAnalyzer and VersionComparator
+in every chunk of tasks) with the full arguments of each file and the default chunks, the current one is AnalysisPool.analyze_files
+"""
+import argparse
+import math
+import multiprocessing as mp
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from analyzers import AnalysisPool
+from analyzers.analysis_pool import analyze_chunk_task
+from analyzers.version_analyzer import VersionAnalyzer
+from models import SourceType
+from utils import FileHandler, TarballSource
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+def load_files(source: Path) -> Tuple[Path, Dict[str, Optional[bytes]]]:
+    """Package directory and files (relative path -> content in memory, None if read from disk by the workers)"""
+    if source.suffix == ".tgz":
+        tarball = TarballSource(source, Path("tarballs") / "dispatch_benchmark")
+        return tarball.package_dir, tarball.read()
+    return source, {str(path.relative_to(source)): None for path in FileHandler.get_all_files(source)}
+
+def chunked(items: List, chunk_size: int) -> List[List]:
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+def legacy_chunks(analyzer: VersionAnalyzer, package_dir: Path, files: Dict[str, Optional[bytes]], processes: int) -> List[bytes]:
+    """Pickled chunks of pool.starmap(analyzer._analyze_single_file, args), with the default chunk size of Pool.starmap"""
+    args = [(package_dir / name, "1.0.0", package_dir, SourceType.TARBALL, raw) for name, raw in files.items()]
+    chunk_size = math.ceil(len(args) / (processes * 4))
+    return [pickle.dumps((analyzer._analyze_single_file, tuple(chunk))) for chunk in chunked(args, chunk_size)]
+
+def current_chunks(pool: AnalysisPool, package_dir: Path, files: Dict[str, Optional[bytes]]) -> List[bytes]:
+    """Pickled chunks of AnalysisPool.analyze_files"""
+    context = ("benchmark", "1.0.0", str(package_dir), SourceType.TARBALL)
+    tasks = [(index, name, raw, context) for index, (name, raw) in enumerate(files.items())]
+    sizes = pool.file_sizes(package_dir, list(files.items()))
+    return [pickle.dumps((analyze_chunk_task, (0, chunk))) for chunk in pool.chunks(sorted(tasks, key=lambda task: -sizes[task[0]]), sizes)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the bytes sent to the workers for each file by the legacy and the current dispatch")
+    parser.add_argument("--source", type=Path, default=FIXTURES_DIR, help="Package directory or tarball (.tgz) to analyze (default: the fixtures)")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes (default: 4)")
+    parser.add_argument("--repeat", type=int, default=20, help="Times the files are analyzed in the timed runs (default: 20)")
+    args = parser.parse_args()
+
+    package_dir, files = load_files(args.source)
+    if not files:
+        raise SystemExit(f"No files in {args.source}")
+    content_bytes = sum(len(raw) for raw in files.values() if raw is not None)
+    analyzer = VersionAnalyzer(package_name="benchmark")
+
+    with AnalysisPool(args.workers) as pool:
+        legacy = legacy_chunks(analyzer, package_dir, files, args.workers)
+        current = current_chunks(pool, package_dir, files)
+        print(f"{len(files)} files, {content_bytes} bytes of content in memory, {args.workers} workers")
+        print(f"{'dispatch':<10}{'chunks':>8}{'bytes/file':>12}{'overhead/file':>15}")
+        for label, chunks in (("legacy", legacy), ("current", current)):
+            total = sum(len(chunk) for chunk in chunks)
+            print(f"{label:<10}{len(chunks):>8}{total / len(files):>12.0f}{(total - content_bytes) / len(files):>15.0f}")
+
+        # Same files analyzed repeat times, with a pool started before the timing
+        names = list(files.items()) * args.repeat
+        start = time.perf_counter()
+        for _ in pool.analyze_files("benchmark", "1.0.0", package_dir, SourceType.TARBALL, names):
+            pass
+        current_time = time.perf_counter() - start
+
+    legacy_args = [(package_dir / name, "1.0.0", package_dir, SourceType.TARBALL, raw) for name, raw in names]
+    with mp.Pool(args.workers) as legacy_pool:
+        start = time.perf_counter()
+        legacy_pool.starmap(analyzer._analyze_single_file, legacy_args)
+        legacy_time = time.perf_counter() - start
+    print(f"Analysis of {len(names)} files: legacy {legacy_time:.2f}s, current {current_time:.2f}s")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
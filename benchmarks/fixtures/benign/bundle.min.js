@@ -0,0 +1 @@
+!function(e){var t={};function n(r){if(t[r])return t[r].exports;var o=t[r]={i:r,l:!1,exports:{}};return e[r].call(o.exports,o,o.exports,n),o.l=!0,o.exports}n.m=e,n.c=t,n(n.s=0)}([function(e,t,n){try{var r0=n(0).default;t.f0=function(o){return r0(o)}}catch(e){t.f0=null}},function(e,t,n){try{var r1=n(1).default;t.f1=function(o){return r1(o)}}catch(e){t.f1=null}},function(e,t,n){try{var r2=n(2).default;t.f2=function(o){return r2(o)}}catch(e){t.f2=null}},function(e,t,n){try{var r3=n(3).default;t.f3=function(o){return r3(o)}}catch(e){t.f3=null}},function(e,t,n){try{var r4=n(4).default;t.f4=function(o){return r4(o)}}catch(e){t.f4=null}},function(e,t,n){try{var r5=n(5).default;t.f5=function(o){return r5(o)}}catch(e){t.f5=null}},function(e,t,n){try{var r6=n(6).default;t.f6=function(o){return r6(o)}}catch(e){t.f6=null}},function(e,t,n){try{var r7=n(7).default;t.f7=function(o){return r7(o)}}catch(e){t.f7=null}},function(e,t,n){try{var r8=n(8).default;t.f8=function(o){return r8(o)}}catch(e){t.f8=null}},function(e,t,n){try{var r9=n(9).default;t.f9=function(o){return r9(o)}}catch(e){t.f9=null}},function(e,t,n){try{var r10=n(10).default;t.f10=function(o){return r10(o)}}catch(e){t.f10=null}},function(e,t,n){try{var r11=n(11).default;t.f11=function(o){return r11(o)}}catch(e){t.f11=null}},function(e,t,n){try{var r12=n(12).default;t.f12=function(o){return r12(o)}}catch(e){t.f12=null}},function(e,t,n){try{var r13=n(13).default;t.f13=function(o){return r13(o)}}catch(e){t.f13=null}},function(e,t,n){try{var r14=n(14).default;t.f14=function(o){return r14(o)}}catch(e){t.f14=null}},function(e,t,n){try{var r15=n(15).default;t.f15=function(o){return r15(o)}}catch(e){t.f15=null}},function(e,t,n){try{var r16=n(16).default;t.f16=function(o){return r16(o)}}catch(e){t.f16=null}},function(e,t,n){try{var r17=n(17).default;t.f17=function(o){return r17(o)}}catch(e){t.f17=null}},function(e,t,n){try{var r18=n(18).default;t.f18=function(o){return r18(o)}}catch(e){t.f18=null}},function(e,t,n){try{var r19=n(19).default;t.f19=function(o){return r19(o)}}catch(e){t.f19=null}},function(e,t,n){try{var r20=n(20).default;t.f20=function(o){return r20(o)}}catch(e){t.f20=null}},function(e,t,n){try{var r21=n(21).default;t.f21=function(o){return r21(o)}}catch(e){t.f21=null}},function(e,t,n){try{var r22=n(22).default;t.f22=function(o){return r22(o)}}catch(e){t.f22=null}},function(e,t,n){try{var r23=n(23).default;t.f23=function(o){return r23(o)}}catch(e){t.f23=null}},function(e,t,n){try{var r24=n(24).default;t.f24=function(o){return r24(o)}}catch(e){t.f24=null}},function(e,t,n){try{var r25=n(25).default;t.f25=function(o){return r25(o)}}catch(e){t.f25=null}},function(e,t,n){try{var r26=n(26).default;t.f26=function(o){return r26(o)}}catch(e){t.f26=null}},function(e,t,n){try{var r27=n(27).default;t.f27=function(o){return r27(o)}}catch(e){t.f27=null}},function(e,t,n){try{var r28=n(28).default;t.f28=function(o){return r28(o)}}catch(e){t.f28=null}},function(e,t,n){try{var r29=n(29).default;t.f29=function(o){return r29(o)}}catch(e){t.f29=null}},function(e,t,n){try{var r30=n(30).default;t.f30=function(o){return r30(o)}}catch(e){t.f30=null}},function(e,t,n){try{var r31=n(31).default;t.f31=function(o){return r31(o)}}catch(e){t.f31=null}},function(e,t,n){try{var r32=n(32).default;t.f32=function(o){return r32(o)}}catch(e){t.f32=null}},function(e,t,n){try{var r33=n(33).default;t.f33=function(o){return r33(o)}}catch(e){t.f33=null}},function(e,t,n){try{var r34=n(34).default;t.f34=function(o){return r34(o)}}catch(e){t.f34=null}},function(e,t,n){try{var r35=n(35).default;t.f35=function(o){return r35(o)}}catch(e){t.f35=null}},function(e,t,n){try{var r36=n(36).default;t.f36=function(o){return r36(o)}}catch(e){t.f36=null}},function(e,t,n){try{var r37=n(37).default;t.f37=function(o){return r37(o)}}catch(e){t.f37=null}},function(e,t,n){try{var r38=n(38).default;t.f38=function(o){return r38(o)}}catch(e){t.f38=null}},function(e,t,n){try{var r39=n(39).default;t.f39=function(o){return r39(o)}}catch(e){t.f39=null}},function(e,t,n){try{var r40=n(40).default;t.f40=function(o){return r40(o)}}catch(e){t.f40=null}},function(e,t,n){try{var r41=n(41).default;t.f41=function(o){return r41(o)}}catch(e){t.f41=null}},function(e,t,n){try{var r42=n(42).default;t.f42=function(o){return r42(o)}}catch(e){t.f42=null}},function(e,t,n){try{var r43=n(43).default;t.f43=function(o){return r43(o)}}catch(e){t.f43=null}},function(e,t,n){try{var r44=n(44).default;t.f44=function(o){return r44(o)}}catch(e){t.f44=null}},function(e,t,n){try{var r45=n(45).default;t.f45=function(o){return r45(o)}}catch(e){t.f45=null}},function(e,t,n){try{var r46=n(46).default;t.f46=function(o){return r46(o)}}catch(e){t.f46=null}},function(e,t,n){try{var r47=n(47).default;t.f47=function(o){return r47(o)}}catch(e){t.f47=null}},function(e,t,n){try{var r48=n(48).default;t.f48=function(o){return r48(o)}}catch(e){t.f48=null}},function(e,t,n){try{var r49=n(49).default;t.f49=function(o){return r49(o)}}catch(e){t.f49=null}},function(e,t,n){try{var r50=n(50).default;t.f50=function(o){return r50(o)}}catch(e){t.f50=null}},function(e,t,n){try{var r51=n(51).default;t.f51=function(o){return r51(o)}}catch(e){t.f51=null}},function(e,t,n){try{var r52=n(52).default;t.f52=function(o){return r52(o)}}catch(e){t.f52=null}},function(e,t,n){try{var r53=n(53).default;t.f53=function(o){return r53(o)}}catch(e){t.f53=null}},function(e,t,n){try{var r54=n(54).default;t.f54=function(o){return r54(o)}}catch(e){t.f54=null}},function(e,t,n){try{var r55=n(55).default;t.f55=function(o){return r55(o)}}catch(e){t.f55=null}},function(e,t,n){try{var r56=n(56).default;t.f56=function(o){return r56(o)}}catch(e){t.f56=null}},function(e,t,n){try{var r57=n(57).default;t.f57=function(o){return r57(o)}}catch(e){t.f57=null}},function(e,t,n){try{var r58=n(58).default;t.f58=function(o){return r58(o)}}catch(e){t.f58=null}},function(e,t,n){try{var r59=n(59).default;t.f59=function(o){return r59(o)}}catch(e){t.f59=null}},function(e,t,n){try{var r60=n(60).default;t.f60=function(o){return r60(o)}}catch(e){t.f60=null}},function(e,t,n){try{var r61=n(61).default;t.f61=function(o){return r61(o)}}catch(e){t.f61=null}},function(e,t,n){try{var r62=n(62).default;t.f62=function(o){return r62(o)}}catch(e){t.f62=null}},function(e,t,n){try{var r63=n(63).default;t.f63=function(o){return r63(o)}}catch(e){t.f63=null}},function(e,t,n){try{var r64=n(64).default;t.f64=function(o){return r64(o)}}catch(e){t.f64=null}},function(e,t,n){try{var r65=n(65).default;t.f65=function(o){return r65(o)}}catch(e){t.f65=null}},function(e,t,n){try{var r66=n(66).default;t.f66=function(o){return r66(o)}}catch(e){t.f66=null}},function(e,t,n){try{var r67=n(67).default;t.f67=function(o){return r67(o)}}catch(e){t.f67=null}},function(e,t,n){try{var r68=n(68).default;t.f68=function(o){return r68(o)}}catch(e){t.f68=null}},function(e,t,n){try{var r69=n(69).default;t.f69=function(o){return r69(o)}}catch(e){t.f69=null}},function(e,t,n){try{var r70=n(70).default;t.f70=function(o){return r70(o)}}catch(e){t.f70=null}},function(e,t,n){try{var r71=n(71).default;t.f71=function(o){return r71(o)}}catch(e){t.f71=null}},function(e,t,n){try{var r72=n(72).default;t.f72=function(o){return r72(o)}}catch(e){t.f72=null}},function(e,t,n){try{var r73=n(73).default;t.f73=function(o){return r73(o)}}catch(e){t.f73=null}},function(e,t,n){try{var r74=n(74).default;t.f74=function(o){return r74(o)}}catch(e){t.f74=null}},function(e,t,n){try{var r75=n(75).default;t.f75=function(o){return r75(o)}}catch(e){t.f75=null}},function(e,t,n){try{var r76=n(76).default;t.f76=function(o){return r76(o)}}catch(e){t.f76=null}},function(e,t,n){try{var r77=n(77).default;t.f77=function(o){return r77(o)}}catch(e){t.f77=null}},function(e,t,n){try{var r78=n(78).default;t.f78=function(o){return r78(o)}}catch(e){t.f78=null}},function(e,t,n){try{var r79=n(79).default;t.f79=function(o){return r79(o)}}catch(e){t.f79=null}},function(e,t,n){try{var r80=n(80).default;t.f80=function(o){return r80(o)}}catch(e){t.f80=null}},function(e,t,n){try{var r81=n(81).default;t.f81=function(o){return r81(o)}}catch(e){t.f81=null}},function(e,t,n){try{var r82=n(82).default;t.f82=function(o){return r82(o)}}catch(e){t.f82=null}},function(e,t,n){try{var r83=n(83).default;t.f83=function(o){return r83(o)}}catch(e){t.f83=null}},function(e,t,n){try{var r84=n(84).default;t.f84=function(o){return r84(o)}}catch(e){t.f84=null}},function(e,t,n){try{var r85=n(85).default;t.f85=function(o){return r85(o)}}catch(e){t.f85=null}},function(e,t,n){try{var r86=n(86).default;t.f86=function(o){return r86(o)}}catch(e){t.f86=null}},function(e,t,n){try{var r87=n(87).default;t.f87=function(o){return r87(o)}}catch(e){t.f87=null}},function(e,t,n){try{var r88=n(88).default;t.f88=function(o){return r88(o)}}catch(e){t.f88=null}},function(e,t,n){try{var r89=n(89).default;t.f89=function(o){return r89(o)}}catch(e){t.f89=null}},function(e,t,n){try{var r90=n(90).default;t.f90=function(o){return r90(o)}}catch(e){t.f90=null}},function(e,t,n){try{var r91=n(91).default;t.f91=function(o){return r91(o)}}catch(e){t.f91=null}},function(e,t,n){try{var r92=n(92).default;t.f92=function(o){return r92(o)}}catch(e){t.f92=null}},function(e,t,n){try{var r93=n(93).default;t.f93=function(o){return r93(o)}}catch(e){t.f93=null}},function(e,t,n){try{var r94=n(94).default;t.f94=function(o){return r94(o)}}catch(e){t.f94=null}},function(e,t,n){try{var r95=n(95).default;t.f95=function(o){return r95(o)}}catch(e){t.f95=null}},function(e,t,n){try{var r96=n(96).default;t.f96=function(o){return r96(o)}}catch(e){t.f96=null}},function(e,t,n){try{var r97=n(97).default;t.f97=function(o){return r97(o)}}catch(e){t.f97=null}},function(e,t,n){try{var r98=n(98).default;t.f98=function(o){return r98(o)}}catch(e){t.f98=null}},function(e,t,n){try{var r99=n(99).default;t.f99=function(o){return r99(o)}}catch(e){t.f99=null}},function(e,t,n){try{var r100=n(100).default;t.f100=function(o){return r100(o)}}catch(e){t.f100=null}},function(e,t,n){try{var r101=n(101).default;t.f101=function(o){return r101(o)}}catch(e){t.f101=null}},function(e,t,n){try{var r102=n(102).default;t.f102=function(o){return r102(o)}}catch(e){t.f102=null}},function(e,t,n){try{var r103=n(103).default;t.f103=function(o){return r103(o)}}catch(e){t.f103=null}},function(e,t,n){try{var r104=n(104).default;t.f104=function(o){return r104(o)}}catch(e){t.f104=null}},function(e,t,n){try{var r105=n(105).default;t.f105=function(o){return r105(o)}}catch(e){t.f105=null}},function(e,t,n){try{var r106=n(106).default;t.f106=function(o){return r106(o)}}catch(e){t.f106=null}},function(e,t,n){try{var r107=n(107).default;t.f107=function(o){return r107(o)}}catch(e){t.f107=null}},function(e,t,n){try{var r108=n(108).default;t.f108=function(o){return r108(o)}}catch(e){t.f108=null}},function(e,t,n){try{var r109=n(109).default;t.f109=function(o){return r109(o)}}catch(e){t.f109=null}},function(e,t,n){try{var r110=n(110).default;t.f110=function(o){return r110(o)}}catch(e){t.f110=null}},function(e,t,n){try{var r111=n(111).default;t.f111=function(o){return r111(o)}}catch(e){t.f111=null}},function(e,t,n){try{var r112=n(112).default;t.f112=function(o){return r112(o)}}catch(e){t.f112=null}},function(e,t,n){try{var r113=n(113).default;t.f113=function(o){return r113(o)}}catch(e){t.f113=null}},function(e,t,n){try{var r114=n(114).default;t.f114=function(o){return r114(o)}}catch(e){t.f114=null}},function(e,t,n){try{var r115=n(115).default;t.f115=function(o){return r115(o)}}catch(e){t.f115=null}},function(e,t,n){try{var r116=n(116).default;t.f116=function(o){return r116(o)}}catch(e){t.f116=null}},function(e,t,n){try{var r117=n(117).default;t.f117=function(o){return r117(o)}}catch(e){t.f117=null}},function(e,t,n){try{var r118=n(118).default;t.f118=function(o){return r118(o)}}catch(e){t.f118=null}},function(e,t,n){try{var r119=n(119).default;t.f119=function(o){return r119(o)}}catch(e){t.f119=null}},function(e,t,n){try{var r120=n(120).default;t.f120=function(o){return r120(o)}}catch(e){t.f120=null}},function(e,t,n){try{var r121=n(121).default;t.f121=function(o){return r121(o)}}catch(e){t.f121=null}},function(e,t,n){try{var r122=n(122).default;t.f122=function(o){return r122(o)}}catch(e){t.f122=null}},function(e,t,n){try{var r123=n(123).default;t.f123=function(o){return r123(o)}}catch(e){t.f123=null}},function(e,t,n){try{var r124=n(124).default;t.f124=function(o){return r124(o)}}catch(e){t.f124=null}},function(e,t,n){try{var r125=n(125).default;t.f125=function(o){return r125(o)}}catch(e){t.f125=null}},function(e,t,n){try{var r126=n(126).default;t.f126=function(o){return r126(o)}}catch(e){t.f126=null}},function(e,t,n){try{var r127=n(127).default;t.f127=function(o){return r127(o)}}catch(e){t.f127=null}},function(e,t,n){try{var r128=n(128).default;t.f128=function(o){return r128(o)}}catch(e){t.f128=null}},function(e,t,n){try{var r129=n(129).default;t.f129=function(o){return r129(o)}}catch(e){t.f129=null}},function(e,t,n){try{var r130=n(130).default;t.f130=function(o){return r130(o)}}catch(e){t.f130=null}},function(e,t,n){try{var r131=n(131).default;t.f131=function(o){return r131(o)}}catch(e){t.f131=null}},function(e,t,n){try{var r132=n(132).default;t.f132=function(o){return r132(o)}}catch(e){t.f132=null}},function(e,t,n){try{var r133=n(133).default;t.f133=function(o){return r133(o)}}catch(e){t.f133=null}},function(e,t,n){try{var r134=n(134).default;t.f134=function(o){return r134(o)}}catch(e){t.f134=null}},function(e,t,n){try{var r135=n(135).default;t.f135=function(o){return r135(o)}}catch(e){t.f135=null}},function(e,t,n){try{var r136=n(136).default;t.f136=function(o){return r136(o)}}catch(e){t.f136=null}},function(e,t,n){try{var r137=n(137).default;t.f137=function(o){return r137(o)}}catch(e){t.f137=null}},function(e,t,n){try{var r138=n(138).default;t.f138=function(o){return r138(o)}}catch(e){t.f138=null}},function(e,t,n){try{var r139=n(139).default;t.f139=function(o){return r139(o)}}catch(e){t.f139=null}},function(e,t,n){try{var r140=n(140).default;t.f140=function(o){return r140(o)}}catch(e){t.f140=null}},function(e,t,n){try{var r141=n(141).default;t.f141=function(o){return r141(o)}}catch(e){t.f141=null}},function(e,t,n){try{var r142=n(142).default;t.f142=function(o){return r142(o)}}catch(e){t.f142=null}},function(e,t,n){try{var r143=n(143).default;t.f143=function(o){return r143(o)}}catch(e){t.f143=null}},function(e,t,n){try{var r144=n(144).default;t.f144=function(o){return r144(o)}}catch(e){t.f144=null}},function(e,t,n){try{var r145=n(145).default;t.f145=function(o){return r145(o)}}catch(e){t.f145=null}},function(e,t,n){try{var r146=n(146).default;t.f146=function(o){return r146(o)}}catch(e){t.f146=null}},function(e,t,n){try{var r147=n(147).default;t.f147=function(o){return r147(o)}}catch(e){t.f147=null}},function(e,t,n){try{var r148=n(148).default;t.f148=function(o){return r148(o)}}catch(e){t.f148=null}},function(e,t,n){try{var r149=n(149).default;t.f149=function(o){return r149(o)}}catch(e){t.f149=null}},function(e,t,n){try{var r150=n(150).default;t.f150=function(o){return r150(o)}}catch(e){t.f150=null}},function(e,t,n){try{var r151=n(151).default;t.f151=function(o){return r151(o)}}catch(e){t.f151=null}},function(e,t,n){try{var r152=n(152).default;t.f152=function(o){return r152(o)}}catch(e){t.f152=null}},function(e,t,n){try{var r153=n(153).default;t.f153=function(o){return r153(o)}}catch(e){t.f153=null}},function(e,t,n){try{var r154=n(154).default;t.f154=function(o){return r154(o)}}catch(e){t.f154=null}},function(e,t,n){try{var r155=n(155).default;t.f155=function(o){return r155(o)}}catch(e){t.f155=null}},function(e,t,n){try{var r156=n(156).default;t.f156=function(o){return r156(o)}}catch(e){t.f156=null}},function(e,t,n){try{var r157=n(157).default;t.f157=function(o){return r157(o)}}catch(e){t.f157=null}},function(e,t,n){try{var r158=n(158).default;t.f158=function(o){return r158(o)}}catch(e){t.f158=null}},function(e,t,n){try{var r159=n(159).default;t.f159=function(o){return r159(o)}}catch(e){t.f159=null}},function(e,t,n){try{var r160=n(160).default;t.f160=function(o){return r160(o)}}catch(e){t.f160=null}},function(e,t,n){try{var r161=n(161).default;t.f161=function(o){return r161(o)}}catch(e){t.f161=null}},function(e,t,n){try{var r162=n(162).default;t.f162=function(o){return r162(o)}}catch(e){t.f162=null}},function(e,t,n){try{var r163=n(163).default;t.f163=function(o){return r163(o)}}catch(e){t.f163=null}},function(e,t,n){try{var r164=n(164).default;t.f164=function(o){return r164(o)}}catch(e){t.f164=null}},function(e,t,n){try{var r165=n(165).default;t.f165=function(o){return r165(o)}}catch(e){t.f165=null}},function(e,t,n){try{var r166=n(166).default;t.f166=function(o){return r166(o)}}catch(e){t.f166=null}},function(e,t,n){try{var r167=n(167).default;t.f167=function(o){return r167(o)}}catch(e){t.f167=null}},function(e,t,n){try{var r168=n(168).default;t.f168=function(o){return r168(o)}}catch(e){t.f168=null}},function(e,t,n){try{var r169=n(169).default;t.f169=function(o){return r169(o)}}catch(e){t.f169=null}},function(e,t,n){try{var r170=n(170).default;t.f170=function(o){return r170(o)}}catch(e){t.f170=null}},function(e,t,n){try{var r171=n(171).default;t.f171=function(o){return r171(o)}}catch(e){t.f171=null}},function(e,t,n){try{var r172=n(172).default;t.f172=function(o){return r172(o)}}catch(e){t.f172=null}},function(e,t,n){try{var r173=n(173).default;t.f173=function(o){return r173(o)}}catch(e){t.f173=null}},function(e,t,n){try{var r174=n(174).default;t.f174=function(o){return r174(o)}}catch(e){t.f174=null}},function(e,t,n){try{var r175=n(175).default;t.f175=function(o){return r175(o)}}catch(e){t.f175=null}},function(e,t,n){try{var r176=n(176).default;t.f176=function(o){return r176(o)}}catch(e){t.f176=null}},function(e,t,n){try{var r177=n(177).default;t.f177=function(o){return r177(o)}}catch(e){t.f177=null}},function(e,t,n){try{var r178=n(178).default;t.f178=function(o){return r178(o)}}catch(e){t.f178=null}},function(e,t,n){try{var r179=n(179).default;t.f179=function(o){return r179(o)}}catch(e){t.f179=null}},function(e,t,n){try{var r180=n(180).default;t.f180=function(o){return r180(o)}}catch(e){t.f180=null}},function(e,t,n){try{var r181=n(181).default;t.f181=function(o){return r181(o)}}catch(e){t.f181=null}},function(e,t,n){try{var r182=n(182).default;t.f182=function(o){return r182(o)}}catch(e){t.f182=null}},function(e,t,n){try{var r183=n(183).default;t.f183=function(o){return r183(o)}}catch(e){t.f183=null}},function(e,t,n){try{var r184=n(184).default;t.f184=function(o){return r184(o)}}catch(e){t.f184=null}},function(e,t,n){try{var r185=n(185).default;t.f185=function(o){return r185(o)}}catch(e){t.f185=null}},function(e,t,n){try{var r186=n(186).default;t.f186=function(o){return r186(o)}}catch(e){t.f186=null}},function(e,t,n){try{var r187=n(187).default;t.f187=function(o){return r187(o)}}catch(e){t.f187=null}},function(e,t,n){try{var r188=n(188).default;t.f188=function(o){return r188(o)}}catch(e){t.f188=null}},function(e,t,n){try{var r189=n(189).default;t.f189=function(o){return r189(o)}}catch(e){t.f189=null}},function(e,t,n){try{var r190=n(190).default;t.f190=function(o){return r190(o)}}catch(e){t.f190=null}},function(e,t,n){try{var r191=n(191).default;t.f191=function(o){return r191(o)}}catch(e){t.f191=null}},function(e,t,n){try{var r192=n(192).default;t.f192=function(o){return r192(o)}}catch(e){t.f192=null}},function(e,t,n){try{var r193=n(193).default;t.f193=function(o){return r193(o)}}catch(e){t.f193=null}},function(e,t,n){try{var r194=n(194).default;t.f194=function(o){return r194(o)}}catch(e){t.f194=null}},function(e,t,n){try{var r195=n(195).default;t.f195=function(o){return r195(o)}}catch(e){t.f195=null}},function(e,t,n){try{var r196=n(196).default;t.f196=function(o){return r196(o)}}catch(e){t.f196=null}},function(e,t,n){try{var r197=n(197).default;t.f197=function(o){return r197(o)}}catch(e){t.f197=null}},function(e,t,n){try{var r198=n(198).default;t.f198=function(o){return r198(o)}}catch(e){t.f198=null}},function(e,t,n){try{var r199=n(199).default;t.f199=function(o){return r199(o)}}catch(e){t.f199=null}},function(e,t,n){try{var r200=n(200).default;t.f200=function(o){return r200(o)}}catch(e){t.f200=null}},function(e,t,n){try{var r201=n(201).default;t.f201=function(o){return r201(o)}}catch(e){t.f201=null}},function(e,t,n){try{var r202=n(202).default;t.f202=function(o){return r202(o)}}catch(e){t.f202=null}},function(e,t,n){try{var r203=n(203).default;t.f203=function(o){return r203(o)}}catch(e){t.f203=null}},function(e,t,n){try{var r204=n(204).default;t.f204=function(o){return r204(o)}}catch(e){t.f204=null}},function(e,t,n){try{var r205=n(205).default;t.f205=function(o){return r205(o)}}catch(e){t.f205=null}},function(e,t,n){try{var r206=n(206).default;t.f206=function(o){return r206(o)}}catch(e){t.f206=null}},function(e,t,n){try{var r207=n(207).default;t.f207=function(o){return r207(o)}}catch(e){t.f207=null}},function(e,t,n){try{var r208=n(208).default;t.f208=function(o){return r208(o)}}catch(e){t.f208=null}},function(e,t,n){try{var r209=n(209).default;t.f209=function(o){return r209(o)}}catch(e){t.f209=null}},function(e,t,n){try{var r210=n(210).default;t.f210=function(o){return r210(o)}}catch(e){t.f210=null}},function(e,t,n){try{var r211=n(211).default;t.f211=function(o){return r211(o)}}catch(e){t.f211=null}},function(e,t,n){try{var r212=n(212).default;t.f212=function(o){return r212(o)}}catch(e){t.f212=null}},function(e,t,n){try{var r213=n(213).default;t.f213=function(o){return r213(o)}}catch(e){t.f213=null}},function(e,t,n){try{var r214=n(214).default;t.f214=function(o){return r214(o)}}catch(e){t.f214=null}},function(e,t,n){try{var r215=n(215).default;t.f215=function(o){return r215(o)}}catch(e){t.f215=null}},function(e,t,n){try{var r216=n(216).default;t.f216=function(o){return r216(o)}}catch(e){t.f216=null}},function(e,t,n){try{var r217=n(217).default;t.f217=function(o){return r217(o)}}catch(e){t.f217=null}},function(e,t,n){try{var r218=n(218).default;t.f218=function(o){return r218(o)}}catch(e){t.f218=null}},function(e,t,n){try{var r219=n(219).default;t.f219=function(o){return r219(o)}}catch(e){t.f219=null}},function(e,t,n){try{var r220=n(220).default;t.f220=function(o){return r220(o)}}catch(e){t.f220=null}},function(e,t,n){try{var r221=n(221).default;t.f221=function(o){return r221(o)}}catch(e){t.f221=null}},function(e,t,n){try{var r222=n(222).default;t.f222=function(o){return r222(o)}}catch(e){t.f222=null}},function(e,t,n){try{var r223=n(223).default;t.f223=function(o){return r223(o)}}catch(e){t.f223=null}},function(e,t,n){try{var r224=n(224).default;t.f224=function(o){return r224(o)}}catch(e){t.f224=null}},function(e,t,n){try{var r225=n(225).default;t.f225=function(o){return r225(o)}}catch(e){t.f225=null}},function(e,t,n){try{var r226=n(226).default;t.f226=function(o){return r226(o)}}catch(e){t.f226=null}},function(e,t,n){try{var r227=n(227).default;t.f227=function(o){return r227(o)}}catch(e){t.f227=null}},function(e,t,n){try{var r228=n(228).default;t.f228=function(o){return r228(o)}}catch(e){t.f228=null}},function(e,t,n){try{var r229=n(229).default;t.f229=function(o){return r229(o)}}catch(e){t.f229=null}},function(e,t,n){try{var r230=n(230).default;t.f230=function(o){return r230(o)}}catch(e){t.f230=null}},function(e,t,n){try{var r231=n(231).default;t.f231=function(o){return r231(o)}}catch(e){t.f231=null}},function(e,t,n){try{var r232=n(232).default;t.f232=function(o){return r232(o)}}catch(e){t.f232=null}},function(e,t,n){try{var r233=n(233).default;t.f233=function(o){return r233(o)}}catch(e){t.f233=null}},function(e,t,n){try{var r234=n(234).default;t.f234=function(o){return r234(o)}}catch(e){t.f234=null}},function(e,t,n){try{var r235=n(235).default;t.f235=function(o){return r235(o)}}catch(e){t.f235=null}},function(e,t,n){try{var r236=n(236).default;t.f236=function(o){return r236(o)}}catch(e){t.f236=null}},function(e,t,n){try{var r237=n(237).default;t.f237=function(o){return r237(o)}}catch(e){t.f237=null}},function(e,t,n){try{var r238=n(238).default;t.f238=function(o){return r238(o)}}catch(e){t.f238=null}},function(e,t,n){try{var r239=n(239).default;t.f239=function(o){return r239(o)}}catch(e){t.f239=null}},function(e,t,n){try{var r240=n(240).default;t.f240=function(o){return r240(o)}}catch(e){t.f240=null}},function(e,t,n){try{var r241=n(241).default;t.f241=function(o){return r241(o)}}catch(e){t.f241=null}},function(e,t,n){try{var r242=n(242).default;t.f242=function(o){return r242(o)}}catch(e){t.f242=null}},function(e,t,n){try{var r243=n(243).default;t.f243=function(o){return r243(o)}}catch(e){t.f243=null}},function(e,t,n){try{var r244=n(244).default;t.f244=function(o){return r244(o)}}catch(e){t.f244=null}},function(e,t,n){try{var r245=n(245).default;t.f245=function(o){return r245(o)}}catch(e){t.f245=null}},function(e,t,n){try{var r246=n(246).default;t.f246=function(o){return r246(o)}}catch(e){t.f246=null}},function(e,t,n){try{var r247=n(247).default;t.f247=function(o){return r247(o)}}catch(e){t.f247=null}},function(e,t,n){try{var r248=n(248).default;t.f248=function(o){return r248(o)}}catch(e){t.f248=null}},function(e,t,n){try{var r249=n(249).default;t.f249=function(o){return r249(o)}}catch(e){t.f249=null}},function(e,t,n){try{var r250=n(250).default;t.f250=function(o){return r250(o)}}catch(e){t.f250=null}},function(e,t,n){try{var r251=n(251).default;t.f251=function(o){return r251(o)}}catch(e){t.f251=null}},function(e,t,n){try{var r252=n(252).default;t.f252=function(o){return r252(o)}}catch(e){t.f252=null}},function(e,t,n){try{var r253=n(253).default;t.f253=function(o){return r253(o)}}catch(e){t.f253=null}},function(e,t,n){try{var r254=n(254).default;t.f254=function(o){return r254(o)}}catch(e){t.f254=null}},function(e,t,n){try{var r255=n(255).default;t.f255=function(o){return r255(o)}}catch(e){t.f255=null}},function(e,t,n){try{var r256=n(256).default;t.f256=function(o){return r256(o)}}catch(e){t.f256=null}},function(e,t,n){try{var r257=n(257).default;t.f257=function(o){return r257(o)}}catch(e){t.f257=null}},function(e,t,n){try{var r258=n(258).default;t.f258=function(o){return r258(o)}}catch(e){t.f258=null}},function(e,t,n){try{var r259=n(259).default;t.f259=function(o){return r259(o)}}catch(e){t.f259=null}},function(e,t,n){try{var r260=n(260).default;t.f260=function(o){return r260(o)}}catch(e){t.f260=null}},function(e,t,n){try{var r261=n(261).default;t.f261=function(o){return r261(o)}}catch(e){t.f261=null}},function(e,t,n){try{var r262=n(262).default;t.f262=function(o){return r262(o)}}catch(e){t.f262=null}},function(e,t,n){try{var r263=n(263).default;t.f263=function(o){return r263(o)}}catch(e){t.f263=null}},function(e,t,n){try{var r264=n(264).default;t.f264=function(o){return r264(o)}}catch(e){t.f264=null}},function(e,t,n){try{var r265=n(265).default;t.f265=function(o){return r265(o)}}catch(e){t.f265=null}},function(e,t,n){try{var r266=n(266).default;t.f266=function(o){return r266(o)}}catch(e){t.f266=null}},function(e,t,n){try{var r267=n(267).default;t.f267=function(o){return r267(o)}}catch(e){t.f267=null}},function(e,t,n){try{var r268=n(268).default;t.f268=function(o){return r268(o)}}catch(e){t.f268=null}},function(e,t,n){try{var r269=n(269).default;t.f269=function(o){return r269(o)}}catch(e){t.f269=null}},function(e,t,n){try{var r270=n(270).default;t.f270=function(o){return r270(o)}}catch(e){t.f270=null}},function(e,t,n){try{var r271=n(271).default;t.f271=function(o){return r271(o)}}catch(e){t.f271=null}},function(e,t,n){try{var r272=n(272).default;t.f272=function(o){return r272(o)}}catch(e){t.f272=null}},function(e,t,n){try{var r273=n(273).default;t.f273=function(o){return r273(o)}}catch(e){t.f273=null}},function(e,t,n){try{var r274=n(274).default;t.f274=function(o){return r274(o)}}catch(e){t.f274=null}},function(e,t,n){try{var r275=n(275).default;t.f275=function(o){return r275(o)}}catch(e){t.f275=null}},function(e,t,n){try{var r276=n(276).default;t.f276=function(o){return r276(o)}}catch(e){t.f276=null}},function(e,t,n){try{var r277=n(277).default;t.f277=function(o){return r277(o)}}catch(e){t.f277=null}},function(e,t,n){try{var r278=n(278).default;t.f278=function(o){return r278(o)}}catch(e){t.f278=null}},function(e,t,n){try{var r279=n(279).default;t.f279=function(o){return r279(o)}}catch(e){t.f279=null}},function(e,t,n){try{var r280=n(280).default;t.f280=function(o){return r280(o)}}catch(e){t.f280=null}},function(e,t,n){try{var r281=n(281).default;t.f281=function(o){return r281(o)}}catch(e){t.f281=null}},function(e,t,n){try{var r282=n(282).default;t.f282=function(o){return r282(o)}}catch(e){t.f282=null}},function(e,t,n){try{var r283=n(283).default;t.f283=function(o){return r283(o)}}catch(e){t.f283=null}},function(e,t,n){try{var r284=n(284).default;t.f284=function(o){return r284(o)}}catch(e){t.f284=null}},function(e,t,n){try{var r285=n(285).default;t.f285=function(o){return r285(o)}}catch(e){t.f285=null}},function(e,t,n){try{var r286=n(286).default;t.f286=function(o){return r286(o)}}catch(e){t.f286=null}},function(e,t,n){try{var r287=n(287).default;t.f287=function(o){return r287(o)}}catch(e){t.f287=null}},function(e,t,n){try{var r288=n(288).default;t.f288=function(o){return r288(o)}}catch(e){t.f288=null}},function(e,t,n){try{var r289=n(289).default;t.f289=function(o){return r289(o)}}catch(e){t.f289=null}},function(e,t,n){try{var r290=n(290).default;t.f290=function(o){return r290(o)}}catch(e){t.f290=null}},function(e,t,n){try{var r291=n(291).default;t.f291=function(o){return r291(o)}}catch(e){t.f291=null}},function(e,t,n){try{var r292=n(292).default;t.f292=function(o){return r292(o)}}catch(e){t.f292=null}},function(e,t,n){try{var r293=n(293).default;t.f293=function(o){return r293(o)}}catch(e){t.f293=null}},function(e,t,n){try{var r294=n(294).default;t.f294=function(o){return r294(o)}}catch(e){t.f294=null}},function(e,t,n){try{var r295=n(295).default;t.f295=function(o){return r295(o)}}catch(e){t.f295=null}},function(e,t,n){try{var r296=n(296).default;t.f296=function(o){return r296(o)}}catch(e){t.f296=null}},function(e,t,n){try{var r297=n(297).default;t.f297=function(o){return r297(o)}}catch(e){t.f297=null}},function(e,t,n){try{var r298=n(298).default;t.f298=function(o){return r298(o)}}catch(e){t.f298=null}},function(e,t,n){try{var r299=n(299).default;t.f299=function(o){return r299(o)}}catch(e){t.f299=null}},function(e,t){e.exports={icon:"data:image/png;base64,UvImZaYMEtKJGF2VDuiBNgkWb2sRPReNbA/TkB/yOaGglfIPk5VlDPk4C47bIkprJIoekk6P0K4uGpSSozBfGIy2EJAPnjR/rohtxlB3lex0XEw/yy6yxz4Uk0yGfuBXunJJm/oSHoNrKsFXJu59awr2qxPDjpLK4NFQV7FZmH+UzHQR1xfxRXmyqhAPu7NPpZP+rtJySLdi46tYBfB2WiucHX4PN8RJIb0/ZWTq338UKnJmjEfiI9Fu3YxHtGr8W67iYfU7JhUtJjuoOwN81JYuQ0gBJWuIXpyQUfMgsNuD856nrb0NdObex/PfrsyPZGVmZBp7omYPMBH8NXApHFeZDRoAkSaJGfJdnQYS3zWdYCaiQPRYml15Hx3ZfP76d3p7TxUkGr9XvUN61LEphAU08/OHXCWwi+oGwodM+qTdF7LYQoRd6CpbxTmIiseAVKI5nM/J/MLaMc490Wa9zTozhH5buwf9B8pHeEIxsZr0WHLO77n8WfT5XRQ4Gjp4MlY0e5/85pzXAHrop1jMpBXVqR7oY8i2wDN64y1vyqJVFs3y+Lhldma+8hW5KCv+IAcml+d3zqclnNOY+nmo71knjIwhBQPM+LmmGoa/7yNv/N8x0982B0A2SoA9w5ZTQotr1SEP6L1a5XWpldDnhGvT6uCAIYgmhoIE33DGLpsBxswmLCR5nrkejg9TroSHjnvIxhvijw4/MEYKxRmBc48HwuTpEHFTnPmBm4MzsUZzgojOeoHxP7KF4ODx7ULsj+TxM9dyI2ofZHFQEqs9bRI2q03IH+XGJ/C3pKldJEDiI/d3OL/zGGXifCn9qtU5KbRu/oNnVmsyW1EXuF0EVo11cLQEYlSEn0uD9RAc/OvJOvjgGhVDRQrnxy5FwSHRbNnprdHyQmcmieuDkn6zUxZHDsywLmzlEkTwBKIWzUIVm9s4EUPcH3QCVv6Nau3qRJ8hC4a1PfAc+ClDDC4z7k+gTofCNEpygKwtRVjNBP5ACQMEu4GN+jCDeT7vchuo0aZuqH6L1eNk+IFOsDf7Olcy1eG0uqIjZ/1Y+w3WIQMSoL3hQW4pDhWq12Hegav4SJk+sUsLdS8oRHIAQ132VPj8jFI+CPfhTzdbLgBVYRV5R4CnMz+BxgEXQ9EWJGaWCmQFTE2hOxWV9YfawCeo5LfI4Zhjw1O4/H4mSLmepCUL09W35IOgbbuzz4Ej6IbAgZHV0M0E06+VzOS2rvSxpDoVBwoio1z1GmDVc44MoASgiK4+fUMAdMwRv+6A5YkXqIYQvrx5QM8T2EM8usE0O72m+XV+2GETeumvScQLnaGkMhOZJVRBpr6xTZ+RIgN7D3xE+KwZsTesfUq1hEl2d3fEHv7kjDNP+hXveQRKdRPRgff+c/5EYzXq8u41E5QXJL+GQ/NcIZrRoYJH4xy0XTt/5eB8ZAYoAPN9rnNnTbokalhgUB7XVABTwFbWZR7w7TK2A+a9SkBfEGRj/96WE1zsbcFG2gxHGg3VqUmi7yY/+ERvglAwxV/I9G3iB8/CoWbp4PCNjDS4FAzuu2lzncAjpN5JfAzp7YwgK3hqV0hMQb29+adCZ6c9TXuOq2QeKqQpEzWA589/jDhz6FX/wnNtI4wxPhcsV44XUT1eQs+RM+MFv95pYmm+hjVgRVbAD39Hk/dcIK+Ah6HK3Nk3F0XlP2JmpXJu9E/Z0N/3BSAIbLXD5c1595Z9ABJk7u3t04fad/hyP8gbOScmhfiuG/HTuLOl2MPldRWNxgoAyCA7kesJpbdN9iCgQIeib7LDHBkSTIbxlTFjQjnKmQACiU3/dUf1UKXW4j55hjyMPwf1abSmTg4FMX/irKVrFEE6qmzsXjp+CLJWt2tcrmUyAcxKvdiBETR++DNPxNExO3c4Q8LjSxvzn36cL+U5fGrpqg7ymCXsZA02BvmYJGoNtQ8vZHPltuJQuxz/FO4qVDAvp++Gv3cIT6q5YNZf/FRxKxsAFEcUWWv04h+P9sI1YVvE0k/SzW4WDLR5Ml+K63IxUl285XkHoWk/z6DEZwpgCHYQzesPQTG/EOabVlxFVfX0nQtDv7ewUexGTAC4wZjqzqLy8RAG0zsbebf0d/TGYspA6W7QfiHtfy4Cze69TdKxxSabPFPcUXVcyMiYFIMyZMAoP2gQpgh7jYtTKfpt4hr8EkOfFTUYa3/9tfhyLDsianWe5Kw8v4nYxqrCH8fXS0tHkURfQbxCMnA/Lz48J0ji6JQwUxBlQP4+gYY7ps4Zp3b9CRoBeeLRO9dy6l8K4Es7HgwwmfnTlTHuE1+D3S1ymkLGx6ryARujmLWeWTcJXlckCzT/QQmZu6bpNNAC0VNorV8vnk8TNAjLfox7EGgZy2WpjCejiBenKWWyRWj8SKpOavQNT76R4ltqagTdxP/NXaQyZLpnNPEBb+YobB3SF2eT4l11xSkhAw2NJKTO6GUWkp/tXryBKyVZSCmFK+wRG2J9wM7K984yTSDW8Qv56XtQDZvtomMW57aesNPkKaPJ2zieZ53YMtR5LpA3CmbwhChiWx8mP/i50OUxCuKP18GsCarWUh5jmXSM2aDHTqZrTpU/bGOoXnKAcC0FAJ78fXc8csOex9F11i3PeWYbESBbbl0XzXGBgqgKCqIhFey7UMe4ghQNwIHlYKfzyCIG2xD/nbux0BwxIfvifUn0z+rLKq/JuO44ENVZnMFAKFLlnUbn0HQkQYD263o1l0OdgTxRXwkyLmcpou9HrVPlYCvKyEMdxIcMottc999zjoWUsOHlGkD+iaHbZLzMX0Ng/V6TJVxUwxRxOi2dvvUMS9GEQE+j9/vele2p5VC7AL8IOCZKnaBuaoNd5QwhfTqcpwsFDQCRWk0bhVuIOWmVTZYiNF2f1HkoIgPvzT61JnMYEKMl36rIRWbPQ/cCDqXSj+RZmKWUcZrvhLt+PyrnAAsPiAZnLzwoDunHGgOcjajwMiRpM4SbpIGlpGrQnCyCTxBMoAz+47nIereJAWDYb77pdxS9p3MsOf8aQjukCR9V5L/ssfHYQ7YNRKKNrW+vyeqF+ENLpO335DcV4YEDK0LnPNe+M/Eov+pTMeFjVJk9Yejaoeux+6rX+ol4eNaHsgHbBm/0uTuS4k7KNmSflROQ6SslCAYcG5/tKVj6JLMHBwojsaSiCrIRvAsQ25fDXTPR9NGI5KoQ4d7B6rbxYhs/NDQcCAjz2enPwKIW08ChoUl6GSEZysGlNEtRVmxCBVlB7kgMt8Je6VLE9pqAedlJnr4HyWkHb4TFGVh4tAyJkDe23NMXk9FJK28AhjNJw8D6DQFZfRh9scvTL/d+l1j11INCk/EoSNA28LM7fyoc8KLEFH3J/bKPyRqgU1sYZu1l5OO+FmzjpQZfNE1DbeaLgCth++KhO/F1IIiYwbDAmqUIWZRThSfe13Opjb1SK3ZwsMVBlDsgVXak4rI8gTFETcG009eeJ7kn+T+5U5qFWSk8U/QwQvn0uv4aKvaoGjJiJvsly027TG9GMhuj6RtHNOJjdggDZtrKb7E4gPuhS3YFJEGavGcBvT7o2m6zkpa/pWvYOqq4p+HgxqSzldo6rS6kH3RuUEKgsxnlaz7IZra2oShA2Wx7dAWf22iErKnu3y7kp1PHAmPUfej5GwlAizcpt8jz8DOEWRnYk3SKNLd5gwSjytRehVdpvfJ0Nf2vL2SDw+4fuvydW6MOQEZhZg8DE2vqa6CyrFqUQxs5Tb1m8PSG+Dj+zfVkdjYqIe3GEc/MojF4pI+4OdD2JVqqo9TRy9Bpd/9LwoymIMfVeFrI2TpEtGCvQPttrS97AM64zEdbPqdNUnp8bZ+jFajlXCftTdpiDhXTkOdTyPEjh9RYopUDqAI18xKnS0CbGZQk2jsvxnNYyCc152fKiCqc5LCb+sgXq+bkjMmi1kwyfrE2hxS91nCr4R2OHkNrO9MjeX6ODnt35ySzfT9/KoqZ3LwBKddSd7KQf6pL13dfbWv/9a0TLqNcoqUHBZwLrrzu/1TP+xiCe3zB5SQINrdqoCBWGNyoXVd5x4aNxek1SG9XbECNDdNKSlrTfmdVgPtF34FY+TSnfsoeVDFRtkwglvmiFsj/Cma5jeJni5IMZkwbAQsw0ut5m8SoD8mA6IucYJ0loKyysJjgrhU2CqqidaDDLBmpLt4Ja8YZ6u6nA17f0iPJT4+1QtxNL2sIUQVukKSU7+kNf5GFCtMexs9rk7LrZ3IRA65jmJf+8Kj7J3nFaYwaFaR4NuUmoANtAQKvqx/899sWN94fIXgERriRPnO7vi/sDF3Gv7ax2yW6whVLoI61f3Wr7uNB6fYNtwgCDwPipq/RnhRjT0+6mSr13NV8mw9QXvKTunB4rSol98wdXPSlKaHNanpix8lz8UXIwZFVSkcPn/mmtM3TmVXem7n6A9QmmdVPlW354z9gY69gmsXlO85zSLAAUkNEbCiW69DD48gKSdUkz+Pe/pIlRvnZzM6Mr8bpf1iIFYqNfMxhM8nAuO77O0+bDq1ld7U07UGWwALKYnWKFonOWsUQO2WUheVC4tWFUnqBljMwNjEXLs6zSlyTkFtnx4TbJj8L7P9+X90bX6F2yRQnUJgHWEeEmwUYCDT93t2QfJaRNkLsx0dtGPJyxJfRm/YhQdcJVjP+LmAVBw0Ijl7etHV88tjo5RDcmaNl7B609RdBUZA7pBb066uBZC5y2She9zz9uDgsCfFB8FoP543nB9brDELJg7W9pcL8ew4ZJVHBAfAyrb9MlpdwwqcaeFJfQWMfX3thK3A9ziTqreQDd7fpMcwJKO3VOBPvnt1f478jx3L1GO3tYtcFoBNz+FZS0jt6HaBdJFQ4vA4utnON4yVw3iZEa2k/JwZFktZLVc0qQn0bUXTnex0n+oMOoeXJq+w2j3rVSR5BwTP4XW79Qv897DwYY0pq5SkO1bn6SyT6owRxzoFXgiNxAMrV8YZJL1xvCuloN0aSLiPXLoXFOrYsMpkU1Bbjm7t+wkYsNCOcq7WgzzGVTjMCELG7hWjXuOoOhM9YVUjXo93yfhcDaOnDeiLfqkQ/L5DU/F0JKbNfk5jbAVuF7nL3hBIeW7Y+0dTd6VLHtt5hk8DlD0rfG/S7fnKDBofNiSIFPvcWOZ4uKhpPQI7R9AcEGO2yvTFCBNaZo5N2hT2zcRpZ3hi3LQtFH3d+lYDCRxwfH2fiI4qXOtw6JauSdr9lKvLTBPCiY7FrmNaahgll+PANxlxWZj3WVbdv1/uQzfzpUtBm2I8NU4Ql9a7vWj/ebKmhAl0bhy8RU24zgasFOSNr+GXG/+90ogvP+uL54goI3aSeROqtn0Wgis7sCZ8ZQB+FA2888wpJHE5YpSoeD5j19OuD5kQVd5eI7iVwH4Ih4kvqaJNJRj68Fr2LSdZ0nLGROKZiM4y1XXXkjE2cenjRTwc+VTgwg4ti+JVlA+xaKdzzPVKOU31FSOD8N0sOxQUojRGb31lwqA+EY9VwWrzDG4U5/fWtve8nalarWiOsM52c2UbS1oQYvdu+7ML+eUTIobWh6rQgad4aAWnEjJUef2X2/pImatnIR9+fmxxh2nOxdUm5WkpaZIaOmGKlUgHJvtn9f2FxTC+JTc0lb5NglDsW0utUUvjXm9Y+9VM0+G3k6fQCBgxBkOV/TOuJxk+Jnv9vhNOEuq9uY3ZbCpitWXPyAq0RhjoZaF+AZqaP7ZIn4TD2a3xmcMSf5v+WV7GHv9AXK1xRXfoT00+DLByn5EuwV9Lv/YLj+GuhKIZK0II1geQwaS4PoZCaG1qR/qGiuQqxaQLJAE61sI0B6k1l1xmWA6sHMix/xI2RRN+l5YiD/ySTMmmaHyUohMKCGwcZEyvyhX3Sd5xuzswPpgOvxZRSJLc8WkYrCESgGdvn8pUQWTFzn2IFDTjjZZXD9QtwDZ49PzkLKO6W2ixQAebd0HRNa5pA9eN++vMRPq1jrLeVOGlPZuC2fAXK3j4WLCtbYS8B+OFKZY9cHVWI32JVZ6YQ9h9s0+lZjT5jMHdIWDxvCEeqBlfOJz20IRcyRYvVySCOcXfWy849KF5aN7hnYKH1lDVM83mBNDrbc6wh8bT/QpjmcJb9Xog/Z5uCNiDfwB+tgxeK2kW8xcNiB6i3kSVPA2O1FrEtxtk7UjCp5BsRj+lczoDCTDEQt08WOUkg0bdmSFtn2Oh2xqDhoNzcIe9GLQddrcypsFnlaQaotLN2P//YZlrnoBkuSh1F6Zu7OLatCmcKmyluMsFNJ2G9Co1PoaPxLZDWOpF/t4VB7G+rr5NZ7wAc1cPGp0nmCuDalZuyDPk+rhwJylE1xupYv+kWarG+ZP+/ndQ4R4YXWfLzbHHuV7GAvbDU1qCgc4INrbI0bayD2O3HIH3DMAvzs9POj0Isiyn4x6M8i0I/9g8rW1hpFzOiTyMir7R8q3s8tD0Bg7FxIu+kWbJMIuK1JJaQPVWh0B6MbMLwK62qJ5n6dtbEZ9Q0HbBKA1x8NAsP5UdNMhyzT3L2HClTcXeRXEorjhILAnf9+sB8Fb+3VPq9kEMbpX30b30wyItSAlvrF6RJoJ3vu6ezQKc+FCO/BwbGZdYlS14v9qOG2OXtrisayLjUT76dU2EvpdNbUTpeIo3rXtbUQD0OChuRzaDr0f+0Z+cM8Td+bH+7KP5MmpSgFCSwOikjcaP4Zhb6CtlwejA3uV8ACNec2tXJgmwkSBKpDoO1a+NWEHACqvTTLee5KmBLAXHNkKxZkTJ4FYpShHVt+IjooN0n+Wb2m54Uz88Pua1Um6hMkJJr8157qKUjTN1Xh+KiB9kwOK29crAVJamUX46U8Wpchz2QcGVCHTou9+MzjL8cONzWQKYYMIerQLV9Oo11OYqSshy8g+iWkRTZaK0SzHAi3YCMgbbWwfIdoP31uIMaddSvZIsr9/UxkHnGFyNfxp4OZzwMXwoDs5j0NnVMHrUibejjFp/93zOQHeq63lorXb7XV83DvK4C00EfPV+DvIbyW7h9C9GaWhlbjFPNmhwI7OmsPkFaMbFyBdb9lHAdygV8HBLMQi8mje5K36+rYdYkluBAif+wws5E8nEDBlf+JnyAe98IzNYJEy6e0aWtmWTXefcosdhyZDrf9ZyEE1xUhzdP5CGWnws2K9FcundUk3dj71pQAVWUe1U6BT914PybC6EluqskRWJFEID9Q1uRkoeV9CP9sgjqj+fFGN8zxm2ikqIZXMpIy8s838vwJK4STfbDV71cgtqiPlnfjLdnVQ+0VqtS4v3Ie4Be5D7PPP9ZJiI0AePeq3RncmWRxU3tK5YQJE24TkC6ko2o7/dXEuswlewUlS1NlFr8d1v4xrBtuN7sEdZ8UeYsRuVBiwXCKqBEPLQFNwxmcjPkmkjdgKUZMj27DvYhmQwUEs/Q4JNXuCIBMEWJpOADo1LsBzZSU96/BqZ8Z5ytzFYsDt1qywsWoJxVxn78mWZB8HbfAwbsUZCn/FAOap21udVUKBcEJzUkh8TXF1vQXGxYia6W3Y4nqPuak1Q6vZ5C0LZ6wwjGpU+mxYz6tHSPR1yFh/BGIUACjnkZp8/G+lwm/aA6ZsH6F+8HnyIfD4uANI7HLkLwm128Juct3rzb68cphwdZx7U+cfvcfzai6VjmzGN1NlLK5wYbqLsDEM6l6Was3VkPOpBgaOjrYPGooNw5B0AFQ7VvPTtaNFPCbKRHTOH+fzf7kcooetzv3sRE9MAi0kxIFlQBfN/kPylRrpyY9HM2lA3iyDXZ4rxcC8fG3XAub90j/u9MrwbOHCb56QIi6U0mgLxaGMArdq5lF2pWpOuqt2XhVfrlCJU8M8qgsAMJIoGYO5Nushq6BQz95FEQ4Bwe9Xz4IoZtAC05r4oloryLgP4ch1rWf/XrE1n4N9r3+OI5uxJFtC0DQ0QR9wsyggxoyo7zXEQCU7AKp3SLSIxUsGn7/t++t0RmbFGKa2L5JmPCYuFozSTl/6IBPZuA7f1BsZy6YP090zKpHRbXnsgI6LcMZ7GOU6+lcYyrUHT4kwB5v6XaeIJXl4v+YTzTocq+3mBathBk+YZEnKit01ISoMyLqjnsnMNDQ+jXedu4WYWWepI4/yQQ7cGHXYY0hyvQXT2sLCfSqXUto/LT2+Sm3ukLUmFc1d3RbR9oJ7NAYBpdW6nNhYVNc6kWRmVK/3KxHHOiervMLMKEJgGuIV19hak8n16FV81hQASOMwCSQg6XLU63i0bqUkE9Q9VwF4aiftsWMyBs9cpKnsdf6wu3cWBdCrbAS/hobqWbz0FaPWLZlCHsnjH6+Nq2lF8QqjRU3BIUwXJhZIZqf+/mpMHKBhuXkHbvdrPWb2r+eS3jEHBlfSKDwNMCqzu9M2aKCuyuS41UxGPFdR4XONkTktEDGn8W2cA3kHQO0q4ztlV73A6MsL9q15Uj/2jRDN+gJVJVMIT7AS/9iUaFQxZQYkGp20yOZYLia64NTk0/3WHNb9uKQU4zIQ01iaZf7naofbWVJF3uzVczdOu0jqkNulACiBFo85DSUglGOMtwSjO1Nc35l5x0Z++6cTTgNA4ub9ujHwwj3OES0Jh/LgPsuI+8zCp/OKy4rL9LzTaI1iglx+q3NIQZdxgzyBfzDGo5qNVBtOdxr2wn3g7ssiIKKNZyS8I735XMUbSPuCdP6UJTjNc2JvLMqvo7ZPkIU2EnpEo5p4uxFzJ2JrovblWtZh0J1FofqOw1/6fwhoYSSn1ZBMDIf+Pu6RczfEfdTZmVisEWMyN4RcTkw9jnOpTsTAiUmRn3AFgx8SaoTAwsVVlzez9Uvl0tHMnUTM8RuY90GL+NHMkpmGR2CQgKg5QYaaWyIWqT1loTX7qpuylcK6nxF1QB16Xf1npNJkIYG+E9HSd/RYmKHlN3PimRiQqBQV3zMkhnjjT8IOg9ut+IgD3jGAMb8Q19ysqzkjWwvjoWwCsn10P/B2xkn4QcSpHjHhWplDc7PpjGyIO10Q/SPhKZVvsZCjeexbEs0E1XFc/CdpfrLgJR8O5pyWgIFsk+JbuCrSomzFjFIzQy7DivVLX5Ef8AyuF6CX+Gx1ToEcCaohAy3aAM2F3JaRemt/hZlSnN936sxb5/IkLUse9N5w2+d9XJza6XKm9i06PI8N6DTL/1l4in8qEdEffIyc1AwNbYOz0ylnWPPOB+k+jur+O1DGSpyGXLoK7G8VfTYWfyFjqnrNbKVqmY59Ztyk4BTH2aBPMc4M95a2maTHUlVYs2FVpk2HeeCEpVFv5FL7PjcWipic49HjeuoApg0uUvY0VV9SZcKjlZ49Cc4eT1ZE5/UfTggcr9mzDb1PcpZIYCANosGvE+dJDPqEC8Wq0Z/I283MCDqmAi7cDkQKpqE4OfVHFE9UtcTqm1oa9g8IXPrQ/op39+XbH5BA7g1eOuHo5gck/Ag+Qmupu/dQjyU3sjAfPv5EUkMJbrk4IL/2Qsv5ak+0egwz1KxYsGa4z6aKYVzvOto2F+9vm1XLDnR1Ip1ZN+0wzLiFjkIzOEzuAPKU69hSuuT+gNlkz4Ysb3XPaxL0VP5PF5Mp5S7XBnG65CXGRRYsv2eEQcNO3on3OA1mijKMfkUAsmR8GJeKmP2atpwBNGZFy36mWHz0nZoR9Cc8UDCojTspFOWprwXEP7PuIR4IwYwJqt1GnVzrYc7k4qpS33uaK+sR7GZ2TX8Mq+1ldmZH/OVlndL7bfJIi8hWmr7eZJIjZWrhDsaRGAANqSqjyTbmc2krpGyditydrWISY4q9nBPYAf5UjmCL740u6mYeBJIaW04LRinOVGthHFmprTgkWbNuc5TxhcrZH5480UXAWzhBIf1vRTNwB1ocMjckaAD/pyl46YzggKidN3HHs5S6HvV/ZUh5E6N47L0jVI1vnPk4m2BznHLAfPgURsXxD0oUa5FpUcZmOD9JZoOare4f4OzV/2iFSo/EASpHqTIm50+K7htZ50MFedMBxnKkjCMRO85YQEcMcyyrS+MsVDM4/Bs9b5S7/J8gXrvbicuAQQWjRqA9XdpLi/oYlDjlqgKZChUP1aThoLvSywWmvmB822dMUaVxvbJ13H4nh8/RXpVstReeXS+SDZG4eQQIJjNVpAqAXw6DG1R/LQ+4Rvxru5YinP5ddvIiMDHDa6lYhhBwLQ1PnJFnbHCzTjkojpEttSVp+P4nZ8xKPnNAE+NOdaYeEaGZfgIPEzcHSSleuir7TpcMIRkbm4Ddx4K2amrNy2/T23pnix4XibJB7of5lhELM9zPzjOgFkkMm+0jmivb2lCT4Y6PkzzQAJdwxmPfDu9TjGrAvujqOT62lDCid3BHrB9BrC+eG1GC8kzocpnYNSG4LJ9ONh6uEAEtkHjqXSFYCPnpyYysyJE7QNqYudSnVlqwGPvjUGL9SBz9Z1NR+1prw1q237HJz5FouFWq0YFro92eHZ+xkWXkZNT8NLJX6bk/pVxDEBFBMLHa6xxJk2hWJ0+2jsnJOmNerCu8DLFOkF1g+3ugerriLZ6W7N4A4unvFLcUG0IkDJTNhZB1NhGClxKfvyp6fuecOf1sD+wMBTRs0/A2mJBVc7i+Jb69BUAMXFxj3jV8sUiCkaCdPZUGygVl0QiR/3dSk2hw2mqYk+8Opo7umEsMb3oRalNjdJwejiA7ZCbrce/fItnHCdryqw8r5IwGQ/V0H1Bxew3TWkQp72p6S9lySnEZkRsWRNExC6EYkDElwTJI4cuH6l+IKw4EbrxHMt5hlBTWVosrAscf264Bjc7nVXUtU0B2PUyDkb2jXNWatVR58C2DAS5xYoyKiplk+pQy4LJHsY1vsOYkGmFpGVOQ8QSwNE2u4h7/ZaXYq4LSNeybxAXl0qhakc3z/oyypJwmHuwwc5pjHiOMNi2l09pOR4Q94BDBmpYNZePEgHeHB8HRx1jrZ9F2cefHrsLOg7bXAPHjARRFxxeD3vVo4OEoI4e743kJze//bt22AcD/Fuhg49hSuC3VA2GRV6Q3fs8nXIuyETznOhURk0R6nKXBEetPt5e0EuggKgp8+D5wakeK+9CImlO8V/qpojpl0lY83j8lK9CtvbXqjnpi6zOgSZdea5FHM32QlJcPkj1jFNv1CVM/AQZgatKgNc8ns7EHpfgtryvn2s/Taf5zcx1XgzT//IdEU5+fbBUghoLVdpq7UFkV/FKT3T1gAnm89Cm3R5j4y2YiNCPY8eRvVqJukj/4UilFLiwA4qO2wqFJXRc8poQOORqTncJvS+RPfxtmgYDW/q0Rr3BOdKEknA9yzeI2sSh2DZTM6pp7SDlR1yPn+oh5auzV7mhfaOMW8Tl+VAkmEu3LH0QaQ8aV30hkGt0hKzvQ6frng2rFPM6wJxeVetwrX0peMud/VTyfg7+m4W9fg1imhm9iLmvztevLVcYal+xF0g/zijN+FEHAmCIuJnnWulE3iVdPFVk4pbWLTCb1Asz3uxBK2txylkXh32ocRK1YykNKI/tJf3xDJexNlNpkEp0hCZdNmq4MSWCzLlA5iIabmPRQcRzAHWLBWyPwEsOixD5rbJ/DwEBh0V7xb4MiZ4VRKFWVFKar9630JVDu0VQylDFxCfDbL5QyHK3rpUV4B9JDCa7f2Pzg3AJ9axbGJLtwQ6T8wSzXgYEJYmMMu1c813ytA7nxfTqXiQbyMDMe6VNxvXonU9wEKAbIWIVLkOBzq5BjiDSjajt7B0nTHmLzT8T/6p5kIhKA85dsVW07S3rvWzy85PZVCFuE4OxptQFksMU4M8JizuoeA+dgcyUh7IgbeF3lyvt3mHT8YTG6gRn2NvexFAzauDOHNR2nrwtmvFtF+Icsftue9Qng0axHQWo+xHIgnb+/HojiEQd6+eCEyoEdrAqcVXb4UVJWSyGLf2vA0ISejEqyKHG7MSUCnRiJrVaCs9LGPDzm21Vlwf5D51+I0dF0LxvfDkuOdieTn0L5rPScJ3ZLczu8khvzHq9X0b3tCDVs0/B0GDeND9sib52p1SUCy6vtlXrjCoaw7SANw7k1gCycNBmwrmCfP/UzrZUdHhRPNdTV+eWmRgSBzxOgPorWnBosXjkcHpPtHrpM0N/eO6K8Em0E5AgadTYW/WTiI9irZWq9IOWOXYLNlR4MYj2/D0vt+tiqfpDMve14z6dPJWeMh2yL/e1ja6V1w/EBkeU+IG58sGOl4SnRF/vQ0y3HajZk/NevRgT6Oh4+WTeFHmWLvWT73fWpLqG5mW/9TlhBF7cmoD4fSqOjU1XIpc7fWostwfp+qRCHaXkW4GtyFt/xcvhkrSg8m+Wxk4y76azQ44XeLx/rxuKGGjtRPuajNTTf1Ug7v4L32LwIACq98kmvRg/9SP5ssqLgTppo3hwhzekVwN7A41gQXmgNnmtua29DeCdu4njzYkJ6FwzQdsIpqwQppGO2s3g6B3DRfGAc1X57cqv8g8iUE7hNIsO5os598z+ZW4uBy/draYtTdF1tZs7IINffEAcd4W3hHly4+taiRRdSujN/+LVmjEuD7/Mjop3mhbnm9NTymiN3IVJDGWUB+BSy9qetdwxPmXfHnxRniEMniXgiWAKzsSWrNi9xFnGVq7bFVatLDXZKUmd93VkowBCtnIunpagqG2661m826eTCiNp6m/vAHzryWgXa3aZspTl5KtOFfN8SiMjWemLkkdIuXnzPkGnVLOenB+Rl2F5QVZjIjK7VOj8HodVUFjnJuQydtCBF7MYxFcz+mgiQNG5FVJ0n4p8LBgBRMxNQ+8ziMlTzo4Dm9DH7v4uOjpG/IkjY3s+RbF7CZv1jEKv3/bumJsF6HftcAtmCD6TQkVDikfCQVTtbGhKxx2KRsuMptbrPD4Mlwe+ttvU2RoQHI7e/kG/qy05iwqLuQmy1mgvKcPcoefrucIyHCMyuKTA3Nw4QWZolapZYLxJdwM6smPhCR/LLBiKLClAYDN7Mmzg/AB2MxcarSrMJFhuqloVfV69JTt+p0pUOVgMET+5zbKqsmd0gH9lLBTUaTBj0PNnFYoktuLffNG2+z9FX3u1MELJm3CFZJq6EuWgW207gEWlsYiGmBG4B2b329x4bnPQRS6cqZeGAl+1bhMNhCnQkfIXjTrgvGA/4ZtxJKxzqXCR3Sk3VFmrvOyefUeC7/WJc+tSw2a/d2KvL3wIVqj2WDbP0LQgQhxegYWFNnK5OIIN3aZeOC3FLpKV9fumy/0IqXQwh6lL9aAQlYqKejuOXnbyTlAQukPOCno/5xN+P7FEKFiiJ/a93E2GWrpeM5Qrg++YjundnvSh/Yy7EIpha8ejVFn4yrqI+Z4eH7uRJBeGY1/w/mWVClX4hheYfUc+/gjf5VI91Rik4wtUMUHUTR1H/RIdKFekMfy8K+yXHvz7aIyi/XcqqssXDCaMExL+LU+tfmWEGsCNY0SNIOBqR7A1jyrHK9J7Rn9Ma2UtqoARAz5bRb4R1DlkbECg2pZ57WWiNMuA5Iz/C3n1TkaNe4fRJXhvYP0Uqz3Ymf+sgYRmNSy+2wc1L/kRYMlbV3eqQX0Bv4N/m2fiKdiKV+5XY0iW+vmXkGLJCkoJiYclsvNHyhPgJGTGI9/aXaLwAO6DjxsIzzswQE95dJbPcYX1XqWY21VecMKOPmr/tUMc/yAPewJmuwuMhFCFcZUwRZWphRswU4Sg8fvcj6vJyxOblPu6Bu0g23tKpYLfx/92LylvijRoMoOSIEKVQwahb6/tzCCZys6qzVuQql0Fz3ndwCzOallGTJoFomvSf5dVT9EqatUOAlmarDYbhEnFRIOizH9Q+ugGWGArn1AMRmr7H6Qz3JKEO+W0OR5ICQRe28gqK8Gsi+U/Pm4C8q3ys0THM1SPQ04lfK5RFkrstRdaLbTRin6cHAtACEXi7lu3Tyj6Ceo30K3HR3OYRerOAAnCt9aFd9O/5dR2Oi/yY/d75Zx+PSkyPLWkIgyT4Q0e7pWIF9ago+W/TieR6iAIIAFa26qmS8LiEtGHsWgtHLHX4R5P7Ts34KKYItKS2bUtQjRQXtSu642unPcW7VOdFwWwVy7pzXTO/vIbqe8rUGiXbEERYwPV1xoCG/2m4bjq973Ts3LOldWeBu4y7y8L3waXjJF5XwLtiHlVtlr3vVwSWsnUCf5pC62KFpHD+ys2j5UCdos5A1tbDEmxchfgh4c50VwgmX+mP1B/AVkYy9hyAK8Xx3CUlUgrQiftzA0BZSskpw7SxkztdrZ6D07eJbFk+FSHwmSU4Sk2ZoXgnUfPDZwT/5q6lwD5jodVPxmPafbbD5Vlj1gogmFy4zPTUR4xrZ6d/wDDalhdjqZnyzHmdd4jPRjKMz0GvpCwsC/cPD+4BdPdt82sQARF+cXL14BbmmBdErrs1mEXvu2KxmCh34dX0rcijU44GNb2VWanY+QRkjCFZ70t17XHV2o+4ikUyNUrNgdVilqBfTlXDhmACn/qTKqiHJcZ0I7LMq0dSrU6l/Quw4HYDjj9VKuZqwKf4t4zTKKLBGlLLEvQs+lgCKznMUrqILeUEqMiCK3e7udHCJGT02tM4v5ncnH8JLVOKtxvtRRkSDA2l1+coz4KtIPp+8bFJyfCJfvsPiDuiVEztgRLefT84UFBJ7jOnAW1NOwdIg93C4zUOaiVpoGIVZfEOgSBZ+4Hgwos0qrR0zrvOcW3jT99nCay/hHje0Bzw+7STpOF/LsqY17nJnc4iRhs4p2YMnOdNQy8PQ4R0W+9NSCPyKxTmULORg3cPTKXnaCWYB8Bp/AxL7M4LVbZjUoWH+76ajuZyiGwyds6y94+IE1yfIyp7g/WpLP5hhDRlmiH3tIYJeU1zdQb84A38xNQcvUI42NmZCg5SCzxitKrNwYyfitb9B3b9WstvNvMNkZJ2ksguUmUTik3W9jRyYZLriT1zApeZaJMXClgHzWGQT67t8zcQnjxKWRGolvN9nH/E6hupg68JIspVhfGnrOEPukKLBOJ0CMz7vNGQ/Wkt7lDDI/NBVBQNUWQ30uQABM6nY5Xz7J4LlpHcE53QIdVL8bc7J9xwX+OTVZCVDBY2mm7ohkOU9qEp7yzoO/cK1vlcSH1MF5Ri3TaOfk0mg2qQyPN3bzk+c+/o6C3R4Ur17m4W76AgNCoHyhKNcxeNEh30xvtqK67jQkpGSoAKhLBWFxuFOFmDtWESAMqxRJC8pLTsuLsM4pHRe7pBH+70wGx7nqXrQtnWWigL1q5R8ehXZMfPdxYhtv7Dph+DNSeqW21WBkhMGOR9UclgqmckPf7DMncGPDnEZcJ5qEK2wm8EXl1jwfjwRqFAidcanqyk3plnC1wxAa7MwbZ02Bt9EEz2BdIMx5FgQGJoA4oxTQF40xmoQSI0rS+GpwQJY9UNb2DJC++RiL8ahoTpgO3BwZbRCSsTeW1rjcR61/Si+TbwVIdJVTTIxGo6SCFRjNhH5XOl4dUYLVgEq4Tl8/aenkg0aY+5nkPf1v8XdB8tDbnM00Iv+MpSDPz44DFEHdtCxcQrCd7TFmdiy2phhMqc0aL3mkpoevawvlMPX1ZGSvbDJfqrKPvfmmSWeokWaDZTBj8yT3g8dW/o53CdYUPa6+E7eO8CzVXOHIROTJdXlVT5le+8zj1y/Yi6stKxYn5JGHNnpW3RqGJyS3jTn62c9U+NlJTRVENGXrA/JvOGF3A3DcoWDJABj18jpnQD0Glxl2tWuUqoEXP3JJNvgOX5L9COLXH8PZlwWgtpbP4rJ8jCXQZiflinZEWGYpMBe1+5LJx6mgVZlv7DHPSpGuUwztgF+BGglVQbS+7vGlQqlG727HhnJzdnfCkVHrHLCeLM8dP76vreS0IDUiNX6qVTDzVf+6cnvLC6HWLND4DixyExFzBwTie75pgfQWaTvZI8cMlmk8Vk6hfWplDqXhgQJSCZvJ/24zOFX8AwYY1w7abNvWfbJ+91/WGZVglFAD9WKgQmie9RB/ioZgGn0ZZ6gaf7tuzIGZBh27mXjexPzYwk0Lm+BrqphGq+sA03nl5T9Zk3dgGkugwpqdDVROizzt05Fm6eOQzP6oB2514Y2iupT3JZ+7ek2i54gLtEryqgMlUrXgsw/Dyj4H6aUqzEM8u2HWOb60t4f6m8VTnZYk9M7H0fMZP3CE4mLzWCfNcizYjvbGSe9eBIdFy34N7x8p1tcAZdWMru2/EFNUEidhIu5NirMKlOAf2s11gcAkfNLW0h434/Anz0465wAN3unTQhjlxC7FcKKF1c78+lP61SHrL1C0rmSvJdmtkXJGzkCaii4indxf4yY+sbIFrN8fM8dOxAFOUhm9SOvFrXfO0IoocRsXWWbhLik1Eu7AARfoqmYVID90qQ3f8Wigcx0HZVczPZbJb7ZYyHSIXLPZIOBiEUprSEq9HjZvU3FIMN3go8t7TWGf6xbwHnMQkXHcbUF+QmUaO4CzxKQogm4w/QF74WHV1vbkV2CkH46iub0V7GSoJ05pgyBJU3LUd0np3ufG7ZZ6nPafIyzrQaOA3wRptf3MBkbZidF/X+DU3zZtwAV3/mm6MrLMrrsXFqP6/jhPYDNqX5Op46/xdKJuXWMbORFOhB2Vv3LC++9pqVmSa6ErPfCgl4GK/W1UQGJQ/367cgn6f5CCNKkN0CgOWEzIFOM3PH/HTHHmiWiIEwq7ECyqNbAXYSfrh9G/TVwRJI1Tp205HwsUfFMI3LxnoLpHX3L8O0Qvdy4o0MN08rfmWMLOIpi2p89kw48QME35XKxGiDyjzxmOVWI7ntdRAwJxsN5uyKG4X01/O5K0OEw1uaJZj8J6klvQsvzrYBX83QKT4MAHlouxY6HFpVB/NW/IpoyZwTV9+wl4xeM3U3jHALFCSqqwwyOiwnHNu5+r2DRIiH2ZL7roMvxPZVcFGEtZ6roxkyUsabtJHV/AliX2GE1AwoNpRaTidPDkSMO/rbLrj1dBqPP49LoDOFQ6UscyzG5D5VcGutWlT0gDg+b0RSM2XR2jXlcegi5tQBaU7HJ/Tl2GhMbSuQpXa+ufykOPLnl/VOkiPuJCm7AZPOw/4z8IMrOGPCGJrtV+Wdx/X6oOMaqgO2yE+3kwC7ZXChVGWR58JoOH4yz0y6EYhJ8m3GAgTTeVw1V4FO56VsllNfXFWAX3feR9MzKLgPD4HrDZdcb3vzmZwxlW9SYaMMiPuaRRXK8UaRrAigtM7qBizs12eEXPV03Qi9QGMH0tFDTbWK2UbDD5uvIQ9KsVh7TYugubIASG7Hxw8Jip0EBG6gdp7JBFhwpFInb+Nb3cNT4lB+WiqqyVRSF8aVzy5QBva7IOgf/8Gn/0ldfZu98KZ7IifsV9LCXHg2fN4CGA4O5rR0QVPR117aVdkRnj2YKIgy79hDcjBBdUO1A6HwxrLggX63p73uCosuC6NsJoTcC6ojQkjq6YdsZ4KgpYjtM1zVX65x67NXAbHrm/vlWlhcfxhJSPJeuvpQynRJYBfpPBa5INIVRtoGsRbj2PhFyEZCVtQl9M+JsXcARSuB1lfnIslx5dCT2QAybfDfC1Sd53rFLoDujkPNarPXJB07Lfy+d4cWMdOy/Mzt3K210dWZfR/LS3yXXqJfcPbLs3EbnPcaqUecnk7+7DnSEZspYCa2g/gO23uv8fljpwVzeS5FMXcJzQ2C66uIRU9/G68xBT35sEHEBp758so4BX1whyH1KPNCvdTomeJub6g0RB6ZWvRnLIuSdLQ7NwNuibKpYxcSHgNrlVLGXRwk5n2nn7ZSfGXecMbNPrpUAt+uqGVa40YftF0yIg4ulc/7LRdYOGmDQjLaRW/K7Fi0MArLW/bi8R9kIXNhvSS4x/U5k//ErTR8lYrcqyyQ2yvuKQp6gdkgsFKpBC3YcU0qGV3W4xPX37i8DOV3QL2ftOQf3ZxB5lp8dbyOONTLUZvzLzztr6mqS1rlJIRkWcFjv8xwsVnGFZky+nb1buRD+gKt2h9aiEgkstk9/lHI0sBz1eg4N5Io3zumvklHcqCl/UFgSmUdYkBpoPyC8gTUvR2d2w9xuBryjL5GimJ4qoS1EsInIqcmcuIE1iIo1SjT1nXszJFodUm+503b/rGMPAiY3JoJLeHpFBnBgm4FRS3WgEiRkZLrTvy2vL8uFCUQ4lv8JGsR9fWFemJ+zUdHWnzwtWTVK1gxm+UOEOWraxh2ev3FvCjY6XXHNGI+ISzd5OoBWxMaj2bgoKz+2HSI3qii5p6Y6JFyLrPxquI/SscaSfztSxAO48DTkCuTzBx+0nYIjhxSYo2ofb5sK/k2X3es9HAfXWyDuuUE2Pu8h87MwIXW/hIK+fcyGQmc6ph1T1pgG25fi2tH2N2YwmAlZ6ttTSZV+R/gemfgvqH3gTFpFmUjtCp3KlFHHoidbYj+5xlE6HmopYfPnZ9Py6N9NuE2kfgli2IIps6/yq1TX1PTg9OFcFZkZJDgOHa0zrrMmPY5i6TMK8krChtit4dHbbSWYKGHfynVIvotyB4QfauNDufd4sO0VevJz8mhxUAZRa6lljmcAc8tjiVlTot1TQTiQtyvcFltnT3BB2ivu7UPs474AaAF83/2iIQvRUQIgGE/KIQ7KPpFwSk47vtfJh4JNB6dLBBFhqBvFLQQReDJQPPI21h6d1GJjrVhKIskFZGST1E73/yMzZdXPLPPgt7beIz0bvhFf70bp5q8fXQGiej5LZ0TIV2/oGionbkw4lzOzTcFcvaGnYl0ttMQCuF9O2iyEgQXHOl9yt4bcstgH8wQaZ2F1RBA9uQzw9lhv7czXuE6OxOhs6ORlwlfwcU29Q/nnvKctmeLMoUmHLci+JGa2gGHOP634aEr89q8te2iAVnK3CaXj6eGCvI5zdbH8v7nZJjBjlmf7ljihUXzmYodC9PD9ysNH/22SA8H5viabJ3SQ0OljV+1QQEk4eeS6+dqH37uGrdwBnEpQJhW4wBvuG8KEgM8HbWGlT9TVbpp4xiu5DM8fnAfE/9FK+4diADgmqTAOctc/zGwbH9mP5htVrv3Bb/dbrBOqivJ+zcySWCSjU1ay2oXZQkkTE692IdwVJV+RZBBHF+hLncdDJAYZq2xzJuXrP1soXyuIeRANjF+DXiNShhPQ8Zds4Hq9TmwCw+4RqscX3zZGUKvyHxqLtovYCFS3AOzksU/9XZP3cD1hvqiCA/9N/MrNNhQHEM1b7aTS+c7Pv4ztPCtlWvGOSOmjukWITFxgbT4offAzdtxa7sZ0INAm4INPinoc6npBrZT1EWCak3Vahde7/LHJD9oJ3D9tNN4o6e03o55Oqo5SVysmNXaYAu/uKyrogEhz+OLyooyHYBSl+KQGKQl1h0TR7ANBCrz7bUyJqQ1xTUiUEgdZPvJh+qQCmOxTmeHWoNNXRe+QiH/GAdI/9HgFRL56KrDCgmp7PYIcRqAQy1pLd2OdME+LEHStxWB0zkNz40e7V+mFH7zJCZ5IdrGo7QGFpGWzLhy8pIt1HJqOpoySGx9qywP01fojzKzQ9LyVkE3hZseJRp6kW+jgQl+2HBAasGJOQ9ZnBFBrFXj3vlmuH9ldf8rplkGyPiv/Wsfwpxa6J6LfNo+31C/hMwjQ3KpFlcOg7bsh4OLy1En3JbWm0RLlN/fj/b8y8Q7Wr3X6y8Atyf1uABqd4KYjVTkwafXsTEuErcHH4WXqARodWY54idQSgjxb4XUgmWsdRUr5pfprL0gEmIfc05145ZlRiIfeQcJWThPYKpJeY1tQ8VbAJuPUkiP+VkBHmvk5faqR9SGDrgV4zRoTkOzh8RS18vvuMHfI1eMvdE/1qgciwtkHLEh7E4xlbftA5eBTk4HpeQdom6X8gDNQpst8zkn/cmiY5ekR3ARtlQ7jrubk8gtmcSNwb9EqY2gxA36Iq6T2kI52D6pX0dSJ4AiQ1t8mJWE9J1e7wDexR/HYROmNBcydBx77f5x0jP4H59zfj3nMqGlB0UoRgyS4vJ0f0/GcDxZx7GBDAFWz+7Ck5veAaOjwMUhanE8Vj9/iFWhm3sgjRhCCKghl5lL9y1lMX1FOwFh5mG1YNPEOYoo73DPhV3VofoMrNw9J59P4+mX0eNjexIQGcIp/E27AC9QIT+SxDkkM13eocGMpW5T2P+5vUAS6bMp1rxYGECR0ZOC2nDBS9G0lAu8tgi2ZbefYIlOk9EZBz2g5erW92k2H8mqNsLg2V11KVeQO2JgXegUJQiJl/0t136aEXSR1BIYIHiN05YsPQfz1bVEAi1k3mrfBfP08SlqGfBgbb4q1MVp1xQ65MKWBdOskWrnWVyRodN4RB2whNo6WSfex8jbPra3gEhFpICHYN7/J8ZABSWvUyFp8Egox5W+0/wykWZAdfs2GYGqeegAsJYnOF1QSaJQtYH63nFovGKjG01uz/3eml9s75FkR29c9pV6wkLt2UtFsBHhDvjtj0xp5w4PAam5NTLsBU6SbmdrUL5ajZpTfnJMQaE8nelIpg71x9/BRStOgsyfvVirrmJH6KU0GpTLU4dZBG62tOtoo6KShLe12oYRHDRXr4D0TgxaJOGxUYfCbe/8ZSDP+0855te82qNYWVLhKyeCCpT0raHZHRgtW1d34gYvKNpwWsWWEKQf6C6BKnXih92j1IcM4dpiia+72nREvV0IrVwdjWOUECaV5cjhPD4JKvRH1vi4LhcxENWxKvJYgPf6tC1znNqw9XBe+f5rL4VkaagzMaGVtKE4qAH/R2wz5d9Eba7t0NuNiZ2z4RrvOxpTZj/GxPm16Gyd5d5YtTNgLJx46luqeUE34TMOa4XYB5//kDMZOiNQ9Rj4O9hCghwt33XtPtyiLyWrcwjHfT3873ocqrji3eVhFTe9u+yDNKe/6JDw0PdlO6E5TzLFv+Y13aEYg1oeNwjHXR9Y1Gp4awev8kNCWHgRXMZ24LD2jv5yPb4rQL+qaMJdpCgGsbwXZvtmtTZ82F2kcP84MwtCHHjOxZMbhYClit010u7fBM6242UYmIHkflq31porVUSjl0lY5at52n+W1rFUsceyVZL5wu4qnAVzvo1zvMPtUudiSzrr+UwUAVzxKsfm3dm8Ooi3C9F9ldefLuXx2jEhZmxhDd519PX/6D/UAFNdwgEK/igjz0X/b333TxKtZuBtshMflf30mdRJ5QbyNslCWqjH5GMx9H3m2TleDES9OTpkYK1BM11aUnjsVTDhQnfO+FwtGmNGAvg04xzQw7N6IjCIIV+7WKf1scg3lR8PtktI4Ja7GBjQti4rWU4FgLSPAvxe+o18Ng7poNjaoziggivNsp/ZCBBGMF1So4p/ecHP2PqG+FLQNo9cp93tv7CjbV8nkVNx9nyxOWlHY4CrN0LGOwe54Vtm3zk0t3rgtlXuSA05bDjpk9Qn7oD/ge8yVWh9IDrXzWn82VdO5lSstup9aKn983CPoDPXaaGIfXIBYJ4Zc5FyJfwMOt7GnKmAaNXPK7gRyKanYvaS+wthzHsXHtoMIXi3taXxicF4aKweGx3ZkuXL93zjN6Jdt4LzRVnIP6uj1yak3U3X9kA2tmOeB7b7R4XNupv37FAzb2WUnJi0n1KjTuEBc0Wyft2ReEJAqqReqCUiyqTjDn/3GPO9WYHByphQKlmRbNjHJPjL7knS7ox5uHLmkvFbS+zyYQh2oJSPp3w9+Cj+W+BcOHRxGezmBDeROHtaomK3rWzCkCULrZuPyiXenzjwnO9CEzEgiyww4pMcBDAbIfNltQFYF4IVhxvRx+x/eC1xIrfuoQ5TyQqoYoKzdSHzi4MlWdBlMRxF6S79NcFlzYSYFaofw97LLwZ5e49JVDIzlM0MDUBCah0ItEthVUAXqDeo6/xhL+gidC6ZazQnw0KTt35Z5dv+EAvPdERI3AAvjuuqHWHLSE9X54q8JKguiOn3ISK9F/4iFNQ7Yc3GbhBRLN1kE/CM2KrzF3ZObxzer+9vVSkiq8hqv3Zp5/hIKJN/NCftgo2FayRrATgqOSLqqEAepxS/hvNFl3DxNJQXTSJghMzJjMad4gQYPub1+Hc6rz+4tYrgIcFgG5Q2kbE9LOP4/1pK3JMcC1tlHVhuYTudUKyRWUPrDbVzog3VPOvXCQLSIXPep5FAOOCx1zqiJE478gWL+9y9pQwIqT/Q2diWOC+ZpCSvT/T6hr2lD4puThwrAeLq/97bmWgfbZ2htJmV7JucZbrMUQG3rhRJKb9WVTdCGJz5av43FISEbmL6IcitkH6z0gtFwE59ndifpR/klNfxHYPzeA/AOZQNd5kK7DJ9IfglTsFyMfshrfzOPhmAqYzX7XPKacTBzRZhR4Cx70XTgg6s/BswuVGGylyyXAqkusfDtmevc2Yt/9oaew0Z8sD1binsf5gzWXmH6+wY2IQ0c3hM42dQFkhane0bgmNYeCtJW1lA9154L0sHXhAYQCyAuubR6+QmlQSVo3ffVLdv8+u09fibOA7FEoxaFK9dRgheAczdlRsSR5zplqcFlcdsK6auRk6oDEXC3mXiMBDjNRV+otqnl+IbanqGk5P1GvAVNGBtTWNcG34MFL5kM/smclAPfjpwWMOg0USN1sovu8JZ6XpBPF+Dq/yc/8vyguPz0SCtmNuRQ2MNosCev9yhZJJ/gRKKojFmGfzk0Z2MkAi0nM41a/CgkZjLkggbzD+DJgR7A2zdmztB0nILnGCZd3ukEow4m37a8GMkAKeaNcsXMCKdbM5ZBc4YQhpmrs+qa+hHXE/n32CDCMf2k1Vc5kBzjbT8y/N+KtdDnYgyAVhDe+GcfmY3Mq6vW0m3+nF1jYHAeSLmfY402pJcGNkZXAmCLP/yWUkpghMO4XQ7THucWqmUHufP/ETaNm6PYWTMYOA/WgUYjnEkhruasV3tET5YKXy+gdouTB8ItXhjXOJS0432sktVnv+o4u9GFtvKjIABRrDwUdIe7PLx39TJOGUoY9B4UcMa0xZwoXlHq2X8z/ywyaLhQTlo2N9QbHZBw9ioNb7vpAtAaad0G0b0yGjWAOkGQX02sh/Btm0YGTwEfPZbwCYQ62uzM+nTsEkTH2LE9a7bweBeDg+RcZ81ny85341xHwmnLX2wcIMMempVPGUSYCFQOFZZuGr2st+5FZ+DdAL9FV9cCs5nDya/N3nx87E5FHyCzt5npcjOB7kLXl1OXptt1yfj4BkORPNNTbCmai81ZDa7yKJfvf/oZba/WH9CWG1pBbMvPKyHxVw8HraZ9WsQmMNiGWdaoPFy7t++5htiLab1wP0ZtBOpc3PKNT7MsDi7fMlRp8wmtVArJaaIV9VTH+4Fex2C7POstSfVx/+dflHms50gOufR10ovSZ7r9njn4SGrLAW4SbKp3g7wpvMUV6Xf8tI8pEx8pQVpntVAT8PBZPrdlTGjKskuPE+T/OzQzCe2s3Lh9xPmu82ZOVIRhJIhC47fTBzngG9ib6cjSyQfowTaB3mPKE2cYyhwxQ76vy8gEM4nwbI56/LW4G1g+rQPUxlO+Yfvn/zexWWBpG61cQiey17g+ptfKDmzy+D5hbOCYUkL5Kc3gfAo8cQ3NDV+Bbnqy/wdGMb0FztW46W1bHD+JjTMS2qzczAiyvRsYnVHX+ELi1UqbCuNj0I33pIW/6RqZgqIcmhoVLGg/CoY636bEXZeLbcgQkIfEEP41FhSs694Z5AHwJfPab4skRZqeNglWJO9fMpMnwJK7J6m4dJ9IeUUTrasr897LBuWQOhjjIog5SirqRCLfcV5KbtLxRYUyusOcDXimGo3th1sVFwElkZJ2meCdX+jqAGLsmafAGRGKiktEXSvo0luB1UQcRP7BW8aYlLDp8IkXrkFKwUYQkwEafqxVqqLR7icJP72JapNkFOn2mnQF+0ypylnS4f/5fHDp2sTagVA1LRWTunkh5SxKTC1+W8ij7ZSFdOWArgHHXSJWsh+L+Eq0GBBxvT3siJG47XXa6tfeu+hJrs6TvIXicJuIF4kgj6iom5v+yCsPcEb2eSwUbvEzL+VJRAEq7F/+znktdllQ4z8/3ZF3KODL/t22XcXhPzrkm+9Z4ONoYZkNsuM3W+FzBX7TU0yTr9vS6iPVjLgFXhk9axgAn/glOde5KBLRcysgCrMusVnzNFyfUkcKwesGPKc1sflB5kXytvOS8elWVxjVgrqzTYAHmsfC+xxth81nbbuSakgjBi0jthBDt5MuSNv9cuWe4C8Bya54eMdqL4Ce43Tebf3aD+V3Jfc51bft8oDz5uOjeLT3FCmGdmMOQpr1TTJmtMV7WyNh+laS+/xpHOgFP5QWGE6U51MTjqWJ8/GNjcrrw1D5czmtJXetXJ2k02aoPLv0UysqPgqSOTPDDIt/PYed/yTjDQB/ah6SAcrujqC/6AMFbtJNHLwyKDVO4Q5q9/FzxvjC/pGAyCJXXE42ylGqvxIys6GwChvdrnZJoWug85WiYLALTnyhp/pLJ1Nghetg2TzFAGwnLG01EUYfd8K8sc0kQXxOjUVrJq4gmSgtslH+5GiLYDFGrVRBG7CewGSlnaLYO7hbeWuDgCOjvwPijdJVQgoGn73/9Ze3Wyk3kZ5CtiPZYWFZu3mbmNRVa6sq5MKZ6OEgclJjFPh2ffKQwPaWirdc4ezuPTe1U9OTY3/HKR2TudbgzunWg830Xx2SHMsPYsk2GfJQNMLCig2XN+rh/vuRDfkBImbwM+O/zuD9+3lzqE/KN4MUSHpgZ9q/0eMDKdGn7+xrfnFI0idyWFnPf0e60GtGoQHKBDYurldoEOs8wctAoF9ofjpm9Hb02n7fqlw4TVespr6JhOMEHGSLbLPmKUHRXdoED3IfBQF0X0g4BJthm8yr/ds4pHbyD4P5SnxLs9/QVI6bWwa179eT7JZm4jegd5VTZ2m8Ig33ZIWEMQRkIQTSDI/DtK081Wqj5OrAVb4Qavl1ISsLyJGvr+YBFmAyh5ksTr8kimA1IXdXFbR77Uo5I8Rvu9WCOsB26cqfpBdiwZcMsMc0YZRFOi9cbUNlhajb+xbvcbQUu6W3sm47cWOSaUwsF+KpMrwmlps3yzyeg7NJHIIfys6rOGFAr3KQXTubvnkdofJiAdPANTczk3bl6kejyTOIzv4uL3AvsOAimbB0mpPhYKGMD0mbX1L8TcoGJHfyu7fqb4hSQ5sILvB23qFwywcB0rxwqI+j1/6qouPvYzUl5r9OJ8GyyphWBX2i0IV0TKqh08ySMeYsZVboKNm/vuhsloYekMjLDoISMZJ3CL556Zdbenq4+z1Vj4dwNlnqGg+Zu/QDuG57Xx3S2Smdzfg1sFOTUZcJSMspRJBNCUViF/8CGgTHZUv+4kcsLlyKzrHwhZObBDZwOwv5GaC+OgZhNHgNVEl5qvFbIVbEYLut2y+pBLCVZ+J3r/rQGXrCWdh+H69f8GN+ZbVFrwZS2dmrdJsPD6LOukCi+mvIMPruwJs7hRLznxFCs9NuVFvm84qTIql5CdVSWQ87paiHmLjdshdsl/istSgMMzZHWnnxlpMyri6+u3hV5VPAFxiiN2VsiG5glYFisfN/k1BT3kPczZlr8fMNgR8VU94aJ2E8ZQOSYqxuXAmisYZ1n9rdxcRm20+CTFvMEVvBNMSTQEGcUOdEDOm03mfsNJgKTSTbh5sDGQXdnLGqWtS5IplpwgLY8wm1Dv7WBLg4tWeqRDDvZY3iPCV0eLrTfJxBE6DsYzo30izFoz6Az4r5RzQ9QMxLg/pmowVljdlKQsLqRPelNKWZXq7C66Kd3gcl0HNOjvFR5sRJMfi9rRIa5ZrZ66W1prhBXzy1Bq7dwfXFx2wfwOga/Z3VP4f/O3oiB+48ATmaRiHANCt4nJhqU40WEYb932EpwK3Cq1KDDFAP5bBvwOQJIAF2+febnWBkakhef0UGKWhFxYOO8xhl6RBE1WzjRSG/AZLujGgrTpSCvtxw1aqvbU0MKh1hYrY1oZF5YPOyesd7/cVUrd4Bdhd26XqyuqC1tinJF/unFXYLzKpFgVzONFu7SsTnTOZFlniIjF9Slo6WlC01vwzuGtVJe/YHF6K0f18ayDGJU9APnaKutb5mATAte4zTUWJihd2zNIgV5ZvlAbpueWkubrOVnaQAdIANx1Xp3oHFKB+0atwB65cEMfVKzeQ+ShDi+pUyjPPxuF/9LvhpvSjs21QeszkdG/7540CrLwQaqlg3ZdqHvmoRsG9IViBNaU37FeJgv56wV1XenBwItZ2nEdiHVgXau0YhtVCYE2bQuKuGZCoZKuaEcgfkJv1Tf+S/cuItgKrMYsjpo0/LLcB13G7fRJrvlXFW34zglQx/Il3A9MHAcM7O5sbzCrxEiOAwflaEUI7dEjG3uD9Fip/DT7YE+SpAPdLTBqsChr4McdFjr+GALI8jz+sK35U38i2+EJ6V+LH3LY/DJSUBv+OU2NUhr1KA7TrntRoJoW3j4P1LSsPBf7EsocAaqcIa98YzP9Yf8Pq7mQopmPRDtZGnAWFDsL/6Jd+X1pfwcmm5EOifPgWuEccLgIUz2cvv6G06Figilv1UioVtrVdS4jmG6vZKTst5jMSVQXXJTtQN1xHaG9XoytAURjSCRt4gKu95ygm33UdswaGtXh29dxDd2oLiE/Qa/XINbvYl+8pQ7a3Tv8/zUkaiPhRq5kK3t4T7DxjtBqLbfSEeYh8bBCAXXPoaZPk9O0o0uvYEtaREtO9eiWWcWw0u6wF6wli8lbZs6pUw8xKo9IwP4jYwo7ICrezY7uzWd3GAasd7Cjq6pN7f3yehSbxvtOv6FWH0wiD4ufXEkSTwHu7MEbpw2aPy1Z0Jmens2JAQa3VJdw0v2721eZoo4IxJpzeCx00bRaurvOzENOSFmpr6Lh146tgY4iZtzag0jo8YrL6jMK8KLb+x0DjSYI1GydV4HkApe2kRpKR7Dam6lJwff1SdYOj4o2I93xyAHL+y3s4zUb2u9b1UYK0Oj3jdIR+YP1aLrrSPdbC3Vwk9EPoAFg4i6jBo2akLMokAsDsl431VrySF9krRLsRoVtaqPZUV2P6W5auoTWpyVpzj1d/SUCk6umhiKtwv8HmFq2SW3i36X6KBK4lKby8VoHR7flO6al2TTQ4xOb8cpmnsctu3La+SVhPnxWV+wBJBtnopqxc87gQZuuJ0wrtoukFMiUYWKxf854vRpDmsmP5jArWGaLezJM7cLWInJWaVll2Xw4VtJlLGWkVxI6ul9QXhMBzFxs+mxA12jHheYh1a7jA2nvQAcC1bRRt6BFrY5om151RFP2vR3F+fnAQ7pmq34criG6V9ZP/SX5x1GIsWd6vM2/WR1xcqSV+r+bldyRSpfRpffRkIs5dfNEpFuTVEAiR6Z1HP1SfYFR5Tv4HCFXq3oStHBrUxJtRtWLhpDtDH0kmZQ7jfp4NpeigDNAp2N4wcujmsGMXhTngOKeDd91nX4KdAK7v34eF4VizhpwckVK645UXPsizD93VVVAfhjy+CzGMWENpnu1kRTiJtg8yX48pBqVs2mUbpcrm2sMGISt2xaXjuEGRKNCitUSEdMEF+Iasb5f4b7jJBmAox70KiFpoObWRgvsjYhFhFICAqLahaS7B09wYBzSp8FbvPLTq2fHuKMxkMjv2Ne5zldCKr8ch7BQKruYg3ZaU1uUa6yyD/5e1HAFTk3UwGHRJ+eJeQoGT9EWOPNlmlmjhIqDrk30J2WDs6Al9GbAElJBmmWnFe8xK18bzdWF6BAdaLtjYcSlXqqXXv/ftqpy5k8/+JOW36m+dLQO43xTUstpWrtbSxuIEHKe4+SFhr+qMm1xDHDPw4JK3gJrIBpBZYSmvELIw3OgZDsWrSScrJCViGGpbDDmGRVFVRGObVrxQFmPeNDYyoGFDRj44i0OhZnSdBl5HtXBgrrKodgQy8IOZKm7ti3w9uJ34Kqqg4tTzyUtGqeN1oRKN1VqqVMQHix3/ckAqEfO7jnxcwc8k9i24EzUmNZ8vRv+OX+guiPfYGpgOjKbh/rR8zXSIJc7rD+KjdBxjERG6boS/+D0lGBK76jr9dwfoWDIF0991ghW+CoTz0pPG3flcgS7i7HhDE3fNvVHM4QOvh7u5bkAoI+Z72hqotyRpIvh+hYOBUJvWvFTW+ExCDTebFRzjr34goz8c9z78eSvLMZ25boFr+7VFY9YG5Fvc+upFtMbL3PL8vNiJodxEydSPx0sYV2cZf8kdxJI06+zITRFvdJr4eBZmXItMamOvEAv0dioUflC+rHVG0GZCcNh37v5QRGGL5Qwt6pYJgpPyGs4JWL98eDd1o15xyfFlcfpmonGjDW4up2p83/NqJ43zzDzWqY3WSmYpU2djVJsC1POxqbYq9zQPxmYppnqPhvuFZ14GU4Oawndng4o4Ib/XkcLI2agFhCqhbInWdUYZ0Ucjbtn1fOoSOX+WjqcF1siqmsi1SrXfS4dnycb2eQch0DeGVLkSoUhquzg4b9f3qrnWvH+/c2OQK4kfayiWFcZndXPj4QylfcCkdmkG91AiGJu6CISP1S6GDn7kNYHFPPFhvNr40sZLRMDYEWGd5NgzVzvvjJyJk5I7QeYhZ2hVDDOl5NWUXuME3fS2GhjwvP7K2cKPXzhe6e1nFUnNQnpLoHAWCjsiSLrPLPyg/WEPpZV1bolwDfzCUWH3/9cKkS/aJwyW45DD6TxfeHZwS4Tjvx9EYjSktzm+Kpz3NiTaqJB6kQ21+6omoj+wqA2qkvSA4rFT4U3EmRlEWoSknRg1JVNZRsG+af7wDN7N01Yo1CMIRxAUPspDrHH9iS+R900oxuWYNJ4oJp+fAOhL9jUiCZckO2uBR/+k89cqcB2hkW6DwV4GXtqw0JmO64NFf2zm+blm2aKxbmgfu/Ucq0vJautiAsaDuCyAoOxBYa6ZAYRFkprPMfnuW7spu3kEbfdxDyYBo4Z5iOZK3rozupRCnqkrjLbcFfDbu4Jne4OTpBzlcSFuoj3FwGJShX6qfRTkohzW+UPj86sO9qPCRt2Z+3nj43bSyuX182QYeGu/M7GJhAS3sv/Ln+xAIepAoj3jSVIpN/k/4v9wJeXuXhsKQT9OYURsn64yH65ueDsIP1Lkp9isL4jub6fIhO53kiM7x3mdjiHla+dnXQoUHUX4rYzaY8faQDEMPIan08ZWI4IwTXP8xv9/us4imzbED+wQD/V54mXCtwRrKeehFU3TdudSyBGaKGKll3gE4bVVqTgTcVAIBg12CXsCGaoX8VFSTrAk+HaS1aR6Ie8uUxJTesKc7pcz6VEFUb0VivvxMWtKkk43tSLr97haelu89TFw0Pc/LqR43znmTEJ6PT8jD0HL1+zrskMkOrtfSUgdz7xrRU7SsAqIccin6BRsJmxKf7oiCeKg+e5Ae0BOhPnPKl8uMIv8yiHArpBhe3jdjuYgo19nA711/BQyEVM6Q1cb5zQNvjHmlbMZZqbiNp4ZcFjmodYHMJ5DiT/brbRmsD387oONuEuSaRvoLZtwOZ4fmZLrnmNMHbcTHZwkl7ZICTV/jtPinYYqiL6yRMLqmj41PiGrIP1uui143KMcKEVPpC8loKXU0PPbbX5C56xGYyslfD+FYgv5TiRjvBbhE7rehB7/XtVI2rxQc88JCiR+revqgPg75xYbEzB+PpqQFZLxLkpmoP3T1IDPYsIr+PRCn8QEdazKm8KaR+ml0j29SI7JGHmC9AFjpBvfgKUY9H6ob8CLnKt8dXTnYHaeZkz7DDbjV99Bmk4QgM+/KyjC9V4/uY6KIKB7Y2aMp+A+wxpxEhldoji8jKcw7I/emN+Cgx/F17yydV4/ASVr+gLUEFuSNIyGyauRrU3SO0LOg2k8SYrJW3284XO+d/vgG6WpCZ6UKsy1U2cHFNrwE4namUZs0MyBskph7SHq7B3BKq/MdI1peY2YjwKVM8mhWOHI9kkUr9kG7UTkTR5KLVRzHllgIydxBGONA0pgF/BpTOW93B3aESDwYJ2zRfwlgUszaHF1QJJk8d/bY+5/EJLTmehlREDH1TgHNDqB2xay7P+yOMiYjP5pK7WAvtSMiB/0FM53uDc4fXUJ6ZjNiDOeSAWnUhcC3wPrcYs/pkjk3MYXTzhSw5quQfa4VnJb753sf/B3vSbJPThmzSM016D07vQTPFmFk5oLtNHx30xyvGF7QAnNQsPoAD1VTI5Ze1ofsrcw4n2OEEQ0ApZtizu7JA3T/uBUVTP54fZ1QYGgP215MifS4OXOlLPjXF7jS3RUUjU4hASJuSQrfdOXchLoPpZuxy6l7iKowf8roHotewp6OPgxsyH+n+iOp1bkIqYOX7jmdxzQAftpkARQI7d00HZcKkY2gX3OInANqhb+fKh2W2QSLku6KTuO+FFrVm9D69qfgJWdxMeeJS1frjFW8/acLy1jMkKj8sQU1pao1i0HXyCdJXUYIeDXF7redwp+7y7tx6fpkF/Q+uk13XyVRIIXPCrolAd8ggm40pkqa1DuaDE3zUx1LYastY485FcHQSxXkWJSQEhw2QYRhz3QDSI+3m+4tS+qeKBvRXsK9jywwdJeTKh6nLTDQpZaNc7sc/P//jiDY19i6xtoft/zT1PIskojU9OedqCTxxqSc9ekRuazcrWQ1SF3kBNqxBDE96M+PCnb1OzGaLbZdShg1YKC4khTVpVGMa/p0qMxeCe7HAf629lcdFclI2RQoosVxetUpCFTIumeRAeDvYCthwPy05K+LJPAiZy+/ud0VsFvVr3O7tp7RHObAMYgU17ImKnOIj9cs8rPhnRsstmUU+/r3w91rUe3DSL8175YtcwTu+g4vvLZx137syuoE36jmSW8tfzk1xt7BhsXxwgYWfz7XhYPxAXrWt0o3n2rA9Y3dgQTTNRrWKAUIbxCTRl0LG6Vg4FGCVZ50SbnFF41hNO7rQrmFmto+M8DpLR/2rAtxz6pAnwUJKGSUwA2Lzt+7qfZeRJf5g1yTwRwmTyYD9LKpGrOXYof+ZYFLxTBrCVQNBp0v04KI4DLMIu8gGL+9sl6bLrEdJ5a5m6at3vmWQr4rfiK/B7SzIn/TOQD6sHjX1HopXN/JOSwZPvu0t+xnBm1oy0uwQhQJOEMNVVj3x2+py5dmVfJhfKlZJDBd0B/Pe+JnujhnucTHV8ycsENA07xWOvT+2jP3ZDE2z+sszLTIU2PolynoRjS+aqHkrtW+DJlYXKnxhikvYlABMWuASdY0hKq5UcvjuptiryZuNM8KvVPj9FrzWGFi0MwmnWdmYKoUyG4DXNFGBA/2lBpNtMzNPKhmW0fLxeFeOMrPg2/v36FUxLYDq25q64tclgcoZHs4hHB89XFFqeqgx8M5tJZRAadtiz0M/AWNBvLlKzK+vFXAAab4wtT6O/+CWrWdhiC9+aEvpagpuk+X95GdJ2HRfOJvz7CJ/e5ADiXWiddoDNiYpf8F5p00KDdNSF1ngGiCZIDgxiEW1FAPRf16j5ORmsNHWPan0OZ7Qd8FBfM/szgzO6DZbrYrezI8q4X4MA6IJF/SVOHNtmR7j7uOByNpIRX92Hz/XlrW1Y5LZlaxPhPO/BJ0qN6p2+QvY/T9S8ZV0zJI+pVyeleF/5uNQyuRoUFmvfSjJo6VM8f7Mqv5jgvaYHT+/8Ka6BF11Wx0F/9gZbKIgi90gxO9CkmieAEOAJ2dTUQgWMzl+sGP2wlUkFDTqhayvzVBANFQgVV3/YWXMdT3yV6u+SDV5CcH4ZerGUORICHWYNZTJd+LHtqJmOtc479ovmavTLFT8jMvkaMO9tEvFEEKD4xMBdPHaK5PZRCk2g45rgkPnwSsndxJyumCVLwNiHYrdMSJSuoYz8DF7j1jqCP6EsVgdHTx59535WZK8maHKEKYM6IZymlSObTqGWCy3pWVmh2k6haF+ekEA7MEOzar8NfGTs0F3hUQctBJrclJiHZibJrVbxGQnHjSBo1Ah4eJu7Q2h7kJIj2fEA1hzpiaZOOi/xqSro4vx4zqaprDcT7ob/Y5sOIr41Dhw5fRVTDGsk15SS/6ZnvMZDk8bHIZ+IYdIUB+s33ER0eatvEJC1PAHiDwKB3vzHYk/19/9mRc75m4FYLOey4Ji8uPJxF5/ukd2KJoTaYr6hj8wcYcpFMVNUKsFJqGFgCIU4Qg2IO7/6+f2M0jdrloR6fijsQYJAyNmG6JZ+u94yXJTAs8pArGL02OEEwvr0ajN/qSj/Z5rIEZ5vuU6j8yjn3W/W6MCszdEL4YXtg0Dwdr+ErIc1II1I9m2YY/aiTzDTOmG/jmGQgO6w8r5+2qnmFkXeMuV6Jds6oyRxfYEeuJyyAcxUj57lQKocEYdTESY4kDqgB04luN8vA1UTMGIJ2zrkUoQ1ZxtnNQwc5HP72zkE53chWu/yHQetLFfLY7Au7SV7pr0YuBZIacNcphw6GBHSvSgN+DiMR+mXohfo7aphGauAqldoYUcoTPt+qg4p89ZCcuEIYDiQX0CdH6xQoqC/ugewBBpmFY5Ozrm/3yHJ0t9Xdg5XUC9Im/5K7zDXDIbgvkD40gYXt62jS/8RHDAb3YCx5O7PYrh3Dk84vxVIs6ctr3utJMnXFFDqzyuGgZMC1HU0rYBPYDHgcwoU7GqNXq+DivP4DNPohgpJvA0kCG2UIz4/1+0ZIfAHhJ4Fh3eu1N1LIMv375y+qFmfLZsdqE0llBPVt1ArcsDFzNiRLwZCPn2lZ3vpqwx+DRS1y75KAN00Q0z/RMkmKkYPdet2NBJrCVUg86/+gmOtFMf82AXKqEUO4jrTCfpXOf3uVaCiaXjVYh4Eozxa/ZxQdrN/by859voTmoTXTnEf6DDFruP6snHYEyCDn57HVTE3m3n2ImPxsa6n4VRcU/zhszvkgj8DCbYxP+MwFI2IL6Uut7SLADmJ/w5MbCNUXwJVSke/kQO8e3X4/NDf7R/4Q/DbX6UVv5uEASo8Quo+IEz7rG5oic0PnYNbKEtk2VZEIy1UfhSitlm/IMsJM299bCrGuRgMh/es1kDT95pEMvVbjGth4G27vDP328m2bcNbvAqZ3aB8PIELbIKihThIXlrP6HZqhu9sI1LJg16KiHZxihs63YlA+1+DV6o0IjPmL3s3Tp//tCRRM92QA3/Z7i6eLY3V+B9j1X9UOIsvx644Soa1Da25hmKERYZWzhXw7bEWrFgXj/w6SZ7Oi1wxkKbvCXVg76NUraUWlBqjNCHKyf12FPP3cfhF9I73r9kzvieg+4Dbbg6X3kmTX1h0sg1UiW2X5deBeGCQN1NpYnZdqMd/vcJjmyLMnfB1Et9qkWnZQTznTpUgUBvpQSh1TbvthwTVw41443txPKl/vO9tZEthyaIUPF491pvRDMUiZVsps8/7Aye2RQviEog/4lB0besRXcxKGbumt+VfUQNWa18ZghllGCeRrYjCaZOhEJuBcCigE0p80Qfj6Kq6qJ0vk5beMRgle9BlyCLoDXYe/On0RPSG5dyPhtL/NzIRW17lowJBL8cEzM7y53JwBZcKXH8qSo/zKCWfd8VvLoYxsSFt9IKtfGYSv92w4ZSjlGRDhA72t6FjBnGgGUwwG5YuIHAXSm6SQj3waA4L7ScMD/pEj6o3BwNI4atrvf8Ebq/GySlD6AEmAWVu6noAAN/JhQM02gNUvQxLNCbGgqhXCS1pw4hwzK2/YpE/nMkqQX/w4yvHcirva5ulfliZtHmEEyL2YtV67zHtD0FYpSYfmEqELL+dXR5I/sntAOu6Q8jLJAR8UjE2Je6SBusD87FNIM6L2mAmTLjkpfqROm5PSaVG2wCGpNnlNV29o3vMOQ1BpWzZ99/kuqBd1++0g83fewNMzJ/MKNicSjs7y9MnU3yEvpeoshRixvkeJ40pNZtxtULc6kjlTlqzKQOTS43oJ6usXdVp+drD5YpCbtpVflhk25Xd5/j+T93emq30kPZLDnPqypMuFrgzetchupmfFzexiEhZzwId9vZ43J8Qnat+OtiM04RI9Xrk81thl26DdUFq9cbbabv3wx5eG1EpIkwmDn7roP+bR3JqjyAsQlEKX1OyrF4ITZfS54xwRf+RdZ+MKePSpvyjSiYVmJOPOWq8N8Krpmo8/XnQESTuNO4p+IAnIKE0eczyGQG+0F0nYvWmPfZAXRd5jC02GYznXRM1w0nfBoLekwq14L4JDLtKpRa1XOZJB7OaygIigBFKKU6Hfx+g9kuBMcxGBJS1gar3j1N5vws233mujCZXRDLDK8vUPJm5jhMswxBorcy5OQV67zIq8bpx2zUtmG4uI4DRbEjcfr7mcn1c8G0BpXBncECzDmlQXu0ZOr0oOHCDKLmJQNBDpQwwY1rSrFfVaVQoCtnad6Uihwx7skCcbvwWJHwLkkOBm2wVWD+0Wyqm3DiqXCue1TiMYin3pF1DJIpOG64F+mGuGVdSxPAxLyNEe2YN/7Rmyr85zurONVTkjw7KGNBPID6z2TF0QpSxFKj30SoAaDc+iLlQXlNX8sw8Wzq/NkT2M947g5mPPEjDR10IitR7wzFS/HbYT2hggTZqAOYurWLXQd85CTLHRkv9qWTd6LfNkoHUbT5tqQuzAh3k7ZOD1g73maQsB6esty4iJEQ9Cp5vqYpDlJND0zzbr2CmB37sAcNZkA8lQ4Ga1Soz4O74WCzKvbAF96iFAhrUoyIsTczBNIem8vMfPJ4rtCrLExoRVJfvc8XmJ1H4ufChMX6+KeavJxYMP0desmsmmethbMtpF7TaYe+gCi1Mq+k/HkL4SAEdXGY1IjBUVq4hBdl2QHoFHQ6Lt+9MYdJ8I59shqlFE/ZV3UDbctEYE5KqjWZfpkmRlNRGnUw/IdRUwMbid+8DzBpr0s7DrRL1XB8sCtCPGFR5g+iGnJSNlvJ3O6ZPXvZe1+aerkGFD6JPasz69Od89RRH83lTTmUszH76HODQ5fyy0+Gcn1otg95I5NOTM0nJzn++CiXqwSvLxGVqYKE/VfnaxLSzi777r4s9F9hJ6GUr67L6LdE0j1WwMv3mOn22FLKnrLcbMLIsnElcCfqUfem8wigqFweLjGYR9qMFLfb8sI6ZRUZ2y+Xk+uYt34hW1z/ON5zBkkl3HzlRTCC/232RGJe3yDyCrxOXKKhAcQIVk953BYBJ3fLF0+ds45tnbVESUIW4qrUQeo0nXarf2Lju7KVbwZwZJnvIexMXJom8HuZiDUI95LLfDkqXs0IXsM0N0rTR7fAxsqQDT6/CQGYbQPThFXGsiNWb3eK8CauM2+cZSztJoA4mO/F5QIcEJIuaV4H6kAtpqwEEPV1SU5ZqPKhI58hynheUM5RI5WB819q7QsiX1LaiW4bD5U/DjogWYdRKKtNuAsLEyVG0vTgqsk6Layx6ROlrFk4z9bJ11J3DLk78WTksKXCnTJbV65YJJh1iRUVF8mqqm1tNVbyl0p+isd9hy/W/ozCteRfTGTpL+hI8ZMtSyclFVEX77OiDEF29FpeuhELILh39VxLLWcxvYpOPNjv/6Q4x3huJRGO0WSd+MO6rf7Ez3PTs2EUqswc11n46w/6Aizmfn9njp4+l+xCB+Fkc83GTbig+maDG5YvxSQ64AsK0A2xTL9ezOAzEOBToznxY46a3akOUypujY6qOmJAEhji2xKO40870rRvl2M8vlRoPQWISUeRi6tIVR67skBCa/IPZ7tDZLfk5mpejbttVBf+9UwZCYUAu4oOnz5J72kUaO9dCDCyi6WqcAac4ZhCmXk2N2asT2drlJNoNYJPFjP7SGzAVCzYEEvgylNsZx1fk7RHQjMW/QjveHj3zm6rQU36IXeU0zATwdeYzDiXxob3/3pW+AxzUQQCdidaZur5hYX1ZynqYpoDBQ0UtlIIWDhkb7zrKDywASOzXrIbI0jt/N3u7/3SYotNs/sfWaSQWvpVuVBPFIbPg8MyAsWDHwUji0cqCfU5UTWGfkPZ5/AC5E2eOeO/QV/u3A1TsyAwdNAW7SYkheSTHzYdLkuF5XHRe2mrtCRkA5IQ18vnsysns1RhTsnsI2l2trkV6grxOYiktXK236fSH6rh/yf1qOI6FhVmayXinNuBSBdxFCJ3iZ9eZ8d4ZaKMssW1NWqPK8/eegpyNG0wFJi5n3sZ/YPjky+vWBIluvJFTmKUHzPXCZ7b0NWDmRwzZtsU9BmVzuQAD2NoCu/D2v1rCEJdc/lgQLlPpvwe695ivKuJy9pa9QAGX0axoPaGceNplWEJm9EFEumz9DgH8gE6UPslEsQM3ouLZvHMOsAyr2J4c78ycusDwGZJkjlYSGRlHqcQxiDz2BRbMuRhmPM2dWO4stRJdYxgFMZno5L+40Xg9CB8qd6tpA+QXdotFPhHaXwC0e4vl8dyFtVZdXamt6mF4dlUsThi1IWsYxjf7U3+Ln8+NUBJz8qvrz4Qa4Xl7vXbOSDxKA4Q/09SW/Q/COewmeys0YWSaSeVPLHxj92qODtY/pydTWI2st4xHCqiU2e6eALfO769xg8E/s9Gyr8ASzkAux7esIr/45cWokIr0bDLAznkkdBwgb30ZY9RicMJsvlcmba1QxmA/TAaWGtrMxb7T3Zad1PGgT7mWNk2S6IicxZt4u3C9L2p6J9mFyuTF95mNcQVFaVwXhQoNnyNiabX8SdSODtpD7kwVAhfAAsdBIlSdMTof3wOFkol9bO6+k+/nDx8WMdvtm5SSHQn/gZs4aX5ovovYRivnTSLHIcAGFUuzPKHLjune+OK/zIecpXtiHKj/U25IiDH67mxt3GPMPSo2TBGduIma2lg95+ZP4MZnuWnWJoYSGY24Js97VbfNX0ES0aWRgt5f0rIwfdBF9IzYXpym0/27hs6INN878v3BxNh37Ura0AtPxKswn+C+okyrsfDdmYBXZnrBRNbxkV2M4ggQNbx0k03UiEPu+QM1HsM6SVbSVkHc3/C2fe48YCY+v5NXFHeRLWahHecH1V+ufe64Kyfh9ywfGN/0rIXMxKX64BoTAF/Oy39pD8d+nKKDkyKXhh10lgE687YTL/0OVRdJVarVT6p0E56C0QXl4U5+UPsFfM8xTgJKMZqX3OLmBKNPq4lncJ479pBJJdG1QNh6G/ha2hM112P1e4g5qFUr0fGatH0/3cXXJYGQmJp7HhrpctY5d3v1rvBf8lMuvAXzr2+yw7qpQ2wSCKrU110gkBEG2kmXnUZA8vLcmpyR0xA4lDymRy3iW4it2WSYc/+umLDZwZnWe8didQAKZzskFcEJtWy1C97XcJw26KmhIOp5cr19wqeb20ff4xY09UIiwWyNtHMso7jfXTIsm3ieHxP0odHCijt2s2N+/armYhCbR9K5YhAyyq4hwS3gpLeDCPIiKySU2bsLH6vxK8XWU5twSmv87OGsRgHhNuzCqQ+2U0ufxoYi22NI7ZVyljmHQXN2QfeM4vkeGdI8lVOk4RGhvZnjf1aZpLMfIEsWY3Y1ewNAzOZv8FmgcxnCbiWKGF5oTMX3T/JQWVsyaSKL6dFPQ7FIqZX/4VDrGY9x8VChsPk2TIqRLpGSgxFb1oTxzujU2I0rpLPZzJW3QGFVaIx3N02tHcJtcYEPmRaiopyAYF+1qcd6LjpSJkVsnYDIUp1FisycTYjRP8aNaJxEZqIrNQhYNmmXz0Vom6/nwlcsrqbT2bQ+e7b0eQP8GtniPdi+y8YlmMePCoha0v/AWIP99es36XC6SWV8b0leIbLLuCxAAnvHwg/o2ISVsFMblIin9d3Pznmz2KrjoBxzcICWpKDzTpWVloc90LGR5GwmSWkJyn5PKRdFZzdmsIlnDf2UohfI+IC/he7djyNOdU2EisSjBglXbzvlMeCC/aXRy7+OSlSxj/PS045xFhxl/+QjrpZR1sG75KlUIY1Vmjw8rmZnLedC4OLVrNO3W/CvAy4/NAEFcUdeGXtmfJhv9QVD6WpHgFsKCF+TasNzopoF1I+mMcPSxeU/91OovjRWe6+PsIvev7t6kJSNu1LFto6o91zGgLc2DlixUcgu4BQkyqOxtz1CCW1i9qBhas8gsyMbkxCMMW5wzbTMX65A0AGwY1/Ccuf7yL9xnAFObB0OTb/JHmVhFfZBUj2+F1LnAmoR2peupg0ET/nwMfIvjT9LQ1yr1HbRi1Sae8zKOxheOrUt0AfmmO/Olf4RJoVk6CfaVMzw1KTUasfH5fUJ3s3slw8/dC1qDZl2MrwXlTjzDKhlo1a56KrcqUT7190dxocARu53nit4Aj4xUGcMySS4gXIGS4SrkzDcOEyUbCAwvXVX4u6wXnLibqSUTKT79MjPxBbnQI4md8d7XHNLyMdRuNjVL71ybxklnt7daYrzwowaopQRUkv5TcHybvuBW5pLEItaE6bX4Tit4ZAfWegsi2vXi5woxAMTraSzJpuRKASV5IiJ24BUvZeu/zvElEdxcXaBqA4CLdGrV8TcAaSiy/5OIEFrGbKHns7JQTW17g6aoE5lA8KJ4unzbo9MaE3uYePWVt/ggCqp29UvH2/cMD6bzslfSzDS2WP4g/ATz8l/onVM+rSaxCCW4+/NNUTZG/xo+CWkJdUSDEMsM8P5qYEOmwvCp07Y7UOWiX2yhhj4ceonqMAQleMmaU+uSG8/4JTHaggcDj9YjpSCP2m7bGc1S0ciy1jeX9HNyG/JPYLCm3kIv8HIRjms+2lJliDzukLXWsO7tkNpya2emBZdBFa1qXK85aSaqKOE4BFkUFS9tBMhRc8Q5XZx2p/P1Ptiy2wsi6A4oBoaGtXhHjCISseL9V8KQQ/b9IggDJiXVvlQpyiR8ij2oJDAFtwT7NJzk/3AwSZg6NhCnEW0fNvt4uwwjje9pWLhyMZdGBxMAbFBauYIreUmt+H2WFgqV3ShwVr1Pm52gHkNP8HG3Xy6FyfQvCZQ2YRNUL56S6sFRhkJ9P+zul0cWfyI0nM7sEaN7qrEuRDWyo73L7kn2JlfwHeUrm07i8xe6DFKVncIPOt1a/Fm6voCl8mguNzOtvsVPw9hl7y0uy+2y9r0XH8LlZcylWxTp3mO5sAut7TVJfSw9rv2767vblc0YLx4OvL4UBSv+vbF68vL92hjJH0elSWEOImeeKxzv5tTaf0CTjvT0hOM2V8sXqQfO23Vy8kyyJTDWbg5WS9XbpFywFsZFhUhaLZvCyoszh5w/GNtY/s/mmIdrg/XTXjUIM2s6A7kdm8FMB/+MOH/Z2wh4p6j1fPT6hV+ILVcbyMg6um/M+VjP3PUYKb+JQRc9p10zyS+4AT2M7fentYYk4L8olVepSEalKppY6ViEAbyAb8ps8AHISbRzG9GVOFDKwoQlRYpVy089V19BeOQguyqpxaJ5viLI5lRT5srR/y8F4mgFCio8NNW1xExqenT4B/1aH/joj5UlnQNqRoReXm27kP9ywvPKzHXrEnKiLKz90s0LJZi9GTQtXufyTdZHFNstJuw/iIYYk7SkWWdwxLuM30NnR9dpmVAmH07Uc2dHzhsB6/rk6bH0OwnSAd07sEIOEx0EyBROMvx3GspELiFkkdWRjOrHKzsvLoYWpdXdyzyhP6agKc9FRpZMwSNYaKUsDKuImxIBbs6hgOndGykLqfBjjTyajCCT/97mpqtdw4O0JffjZkCE4kkie7hGB70Rsz6vqi4oTkRuFqmelbbHKAz+zrZpza1RH2tQAepEUVFYDhe+RcyxZ/oBxWhenmP7jNAAz81fLjlqYFw7aun4ABgXHzBEIPWK2Xw+VTCyjORsI6x45hRbfpVwN7Oo2fI3J3FRFjMEfmzA89jaNrrPJqjws/iCcbsD0n7G0s+/UOKHwISwf01nblK0VQWM9XzKIjTYd366aLRu4iXadgpuUATm4a2J+XoKxP+UEzOWX6JVbl7paC3yao1FadtZpFIYEXoKrGZD4swT2L06DyGI2GARfuoTzKw2J8bj6ftY8i+nzXrK+vWXAOLq1yOZe0V6c73CAP0HtOV/dXLkEu1fN0FYzUHvuOsqI5H6tWW0QtjTIUBvuGY+nszggpwMvmcnCZX3GfTk7JP0LpIKSpf7V1astu",isMac:navigator.platform==='MacIntel',x64:process.arch()}}]);
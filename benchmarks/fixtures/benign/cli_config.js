@@ -0,0 +1,31 @@
+#!/usr/bin/env node
+// Loads the user configuration of a CLI tool from the home directory
+const os = require('os')
+const fs = require('fs')
+const path = require('path')
+
+const configDir = process.platform === 'win32'
+  ? path.join(process.env.APPDATA, 'mytool')
+  : path.join(os.homedir(), '.config', 'mytool')
+
+function loadConfig () {
+  const file = path.join(configDir, 'config.json')
+  if (!fs.existsSync(file)) return {}
+  return JSON.parse(fs.readFileSync(file, 'utf8'))
+}
+
+function listPlugins () {
+  return fs.readdirSync(path.join(configDir, 'plugins'))
+    .filter(name => name.endsWith('.js'))
+}
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms))
+
+async function retry (fn, attempts = 3) {
+  for (let i = 0; i < attempts; i++) {
+    try { return await fn() } catch (err) { await new Promise(r => setTimeout(r, 2 ** i * 100)) }
+  }
+  throw new Error('retry failed')
+}
+
+module.exports = { loadConfig, listPlugins, sleep, retry, arch: os.arch() }
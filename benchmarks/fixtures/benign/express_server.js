@@ -0,0 +1,28 @@
+'use strict';
+const express = require('express');
+const path = require('path');
+const fs = require('fs');
+
+const app = express();
+const PORT = process.env.PORT || 3000;
+
+app.use(express.json());
+app.use(express.static(path.join(__dirname, 'public')));
+
+app.get('/health', (req, res) => res.json({ status: 'ok', uptime: process.uptime() }));
+
+app.post('/api/login', async (req, res) => {
+    const { username, password } = req.body;
+    if (!username || !password) {
+        return res.status(400).json({ error: 'username and password are required' });
+    }
+    const user = await users.verify(username, password);
+    res.json({ token: user ? sign(user) : null });
+});
+
+app.get('/files/:name', (req, res) => {
+    const file = path.join(__dirname, 'files', path.basename(req.params.name));
+    fs.readFile(file, 'utf8', (err, data) => err ? res.sendStatus(404) : res.send(data));
+});
+
+app.listen(PORT, () => console.log(`listening on http://localhost:${PORT}`));
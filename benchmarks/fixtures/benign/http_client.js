@@ -0,0 +1,23 @@
+import axios from 'axios';
+
+const client = axios.create({ baseURL: 'https://api.example.com/v1', timeout: 5000 });
+
+export async function fetchUser(id) {
+    const { data } = await client.get(`/users/${id}`);
+    return data;
+}
+
+export async function createItem(item) {
+    return axios.post('https://api.example.com/v1/items', item, { headers: { 'X-Api-Key': process.env.API_KEY } });
+}
+
+export const ping = () => fetch.get('http://localhost:8080/ping');
+
+export function openFeed(onMessage) {
+    const socket = new WebSocket('wss://feed.example.com/stream');
+    socket.addEventListener('message', (event) => onMessage(JSON.parse(event.data)));
+    return socket;
+}
+
+const pattern = /(\d+)-(\d+)/;
+export const parseRange = (value) => pattern.exec(value);
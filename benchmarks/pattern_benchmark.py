@@ -0,0 +1,161 @@
+"""Equivalence check and micro-benchmark of the detection patterns.
+
+    python -m benchmarks.pattern_benchmark            # check the fixture counts and benchmark each rewritten pattern
+    python -m benchmarks.pattern_benchmark --record   # record the counts of the current patterns as expected
+
+It also checks that the streamed scan of the fixtures (PatternEngine.scan_chunks) finds the same matches of the scan of the whole content
+
+The fixtures are snippets of malicious and benign code. expected_counts.json has the number of matches of each tag
+for each fixture, recorded with the patterns before the linear time rewrite
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Pattern, Tuple
+from analyzers.categories import CryptojackingAnalyzer, DataExfiltrationAnalyzer, EvasionAnalyzer, PayloadAnalyzer
+from utils import FileHandler, PatternEngine, UtilsForAnalyzer
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+EXPECTED_COUNTS = FIXTURES_DIR / "expected_counts.json"
+STREAM_CHECK_MARGIN = 4 * 1024      # characters
+
+PATTERN_GROUPS: Dict[str, List[Pattern]] = {
+    tag: patterns
+    for analyzer in (EvasionAnalyzer, PayloadAnalyzer, DataExfiltrationAnalyzer, CryptojackingAnalyzer)
+    for tag, patterns in analyzer.PATTERN_GROUPS.items()
+}
+
+# Definitions before the rewrite, with the rewritten one and an input where the old one is quadratic
+LEGACY_PATTERNS: Dict[str, Tuple[Pattern, Pattern, Callable[[int], str]]] = {
+    'obfuscation_patterns[2]': (
+        re.compile(r'try\{.*?\}catch\(_?0x[0-9a-fA-F]{6,}\)', re.IGNORECASE),
+        EvasionAnalyzer.OBFUSCATION_PATTERNS[2],
+        lambda n: 'try{f()}catch(e){}' * (n // 18),                                  # minified line, no obfuscated catch
+    ),
+    'platform_detections[0]': (
+        re.compile(r'(?:(\w+\.)?platform\(?\)?\s*[!=]==?\s*[\'"](?:win(?:32|64|dows)?|linux|darwin|mac(?:os)?)[\'"]|\w*\.arch\s*\(\s*\))', re.IGNORECASE),
+        EvasionAnalyzer.PLATFORM_PATTERNS[0],
+        lambda n: 'var s="' + 'A' * n + '";os.platform()==="linux"',                 # long base64 string
+    ),
+    'timing_delays[0]': (
+        re.compile(r'await\s+new\s+Promise\s*\(\s*(\w+)\s*=>\s*\{?\s*[\s\S]*?setTimeout\w*\s*\(\s*\1[\s\S]*?\}?\s*\)', re.IGNORECASE),
+        PayloadAnalyzer.TIMING_DELAYS_PATTERNS[0],
+        lambda n: 'await new Promise(r => s.on("end", r));\n' * (n // 40) + 'setTimeout',   # promises that are not delays
+    ),
+    'eval[0]': (
+        re.compile(r'eval\s*\([\s\S]*?\)'),
+        PayloadAnalyzer.EVAL_PATTERNS[0],
+        lambda n: 'eval(atob("' + 'A' * n + '"));' * 4,                             # packed payload
+    ),
+    'shell_commands[0]': (
+        re.compile(r'(?:(?:child_process|exec|spawn|shell)\.exec\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)|(\w+)?\s*Bun\.\$\s*\`[\s\S]*?\`)', re.IGNORECASE),
+        PayloadAnalyzer.SHELL_COMMANDS_PATTERNS[0],
+        lambda n: 'var s="' + 'A' * n + '";await Bun.$`ls`',
+    ),
+    'scan_functions[0]': (
+        re.compile(r'(\w+)\.(get)?homedir\s*\(?\s*\)?\s*', re.IGNORECASE),
+        DataExfiltrationAnalyzer.SCAN_FUNCTIONS_PATTERNS[0],
+        lambda n: 'var s="' + 'A' * n + '";os.homedir()',
+    ),
+    'scan_functions[1]': (
+        re.compile(r'(\w+)\.((?:read(?:dir|file)|scanfilesystem)(?:sync)?)\s*\(([^;]*);', re.IGNORECASE),
+        DataExfiltrationAnalyzer.SCAN_FUNCTIONS_PATTERNS[1],
+        lambda n: 'var s="' + 'A' * n + '";fs.readFileSync(p);',
+    ),
+    'data_transmissions[0]': (
+        re.compile(r'(\w+)\.(post|get|put|delete|request)\s*\(\s*[\'"]?(https?:\/\/[^\s\'"]+)[\'"]?', re.IGNORECASE),
+        DataExfiltrationAnalyzer.DATA_TRANSMISSION_PATTERNS[0],
+        lambda n: 'var s="' + 'A' * n + '";axios.post("https://h.invalid/")',
+    ),
+}
+
+def fixture_files() -> List[Path]:
+    return sorted(p for p in FIXTURES_DIR.rglob("*") if p.is_file() and p != EXPECTED_COUNTS)
+
+def count_tags(path: Path) -> Dict[str, int]:
+    """Matches of each tag in a fixture, preinstall scripts only for package.json (as the PayloadAnalyzer)"""
+    content = FileHandler.read_file(path)
+    return {
+        tag: UtilsForAnalyzer.detect_count_patterns(content, patterns)
+        for tag, patterns in PATTERN_GROUPS.items()
+        if tag != 'preinstall_scripts' or path.name == 'package.json'
+    }
+
+def check_counts() -> bool:
+    expected = json.loads(EXPECTED_COUNTS.read_text())
+    ok = True
+    for path in fixture_files():
+        name = path.relative_to(FIXTURES_DIR).as_posix()
+        counts = count_tags(path)
+        for tag, count in counts.items():
+            if expected.get(name, {}).get(tag) != count:
+                ok = False
+                print(f"MISMATCH {name} {tag}: expected {expected.get(name, {}).get(tag)}, found {count}")
+        # The rewritten patterns must find the same matches, not only the same number
+        content = FileHandler.read_file(path)
+        for label, (legacy, current, _) in LEGACY_PATTERNS.items():
+            if [m.span() for m in legacy.finditer(content)] != [m.span() for m in current.finditer(content)]:
+                ok = False
+                print(f"MISMATCH {name} {label}: different matches from the legacy pattern")
+    print(f"Checked {len(fixture_files())} fixtures: {'counts unchanged' if ok else 'counts changed'}")
+    return ok
+
+def check_streaming(chunk_size: int) -> bool:
+    engine = PatternEngine(PATTERN_GROUPS, pattern_time_budget=None, file_time_budget=None)
+    # A smaller margin for the unbounded runs, the fixtures are shorter than the real one: enough for the long spans of long_span_loader.js
+    engine.stream_overlap -= engine.UNBOUNDED_RUN_MARGIN - STREAM_CHECK_MARGIN
+    ok = True
+    for path in fixture_files():
+        whole = engine.scan(FileHandler.read_file(path))
+        streamed = engine.scan_chunks(FileHandler.read_chunks(path, chunk_size))
+        for tag in PATTERN_GROUPS:
+            if whole[tag][0] != streamed[tag][0] or list(whole[tag][1]) != list(streamed[tag][1]):
+                ok = False
+                print(f"MISMATCH {path.relative_to(FIXTURES_DIR).as_posix()} {tag}: streamed in chunks of {chunk_size} bytes")
+    print(f"Streamed scan in chunks of {chunk_size} bytes: {'same matches' if ok else 'different matches'}")
+    return ok
+
+def record_counts() -> None:
+    counts = {path.relative_to(FIXTURES_DIR).as_posix(): count_tags(path) for path in fixture_files()}
+    EXPECTED_COUNTS.write_text(json.dumps(counts, indent=2))
+    print(f"Recorded the counts of {len(counts)} fixtures in {EXPECTED_COUNTS}")
+
+def best_time(pattern: Pattern, content: str, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in pattern.finditer(content):
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark(size: int) -> None:
+    corpus = "\n".join(FileHandler.read_file(path) for path in fixture_files())
+    print(f"{'pattern':<26}{'corpus old':>12}{'corpus new':>12}{'speedup':>9}{'worst old':>12}{'worst new':>12}{'speedup':>9}")
+    for label, (legacy, current, worst_case) in LEGACY_PATTERNS.items():
+        worst = worst_case(size)
+        corpus_old, corpus_new = best_time(legacy, corpus), best_time(current, corpus)
+        worst_old, worst_new = best_time(legacy, worst, 1), best_time(current, worst, 1)
+        print(f"{label:<26}{corpus_old * 1000:>10.2f}ms{corpus_new * 1000:>10.2f}ms{corpus_old / corpus_new:>8.1f}x"
+              f"{worst_old * 1000:>10.1f}ms{worst_new * 1000:>10.1f}ms{worst_old / worst_new:>8.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the detection patterns on the fixtures and benchmark them")
+    parser.add_argument("--record", action="store_true", help="Record the counts of the current patterns as expected")
+    parser.add_argument("--size", type=int, default=10000, help="Size in characters of the worst case inputs (default: 10000)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Size in bytes of the chunks of the streamed scan (default: 256)")
+    args = parser.parse_args()
+
+    if args.record:
+        record_counts()
+        return
+    ok = check_counts()
+    ok = check_streaming(args.chunk_size) and ok
+    benchmark(args.size)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -24,7 +24,8 @@ class CryptojackingComparator:
                 curr_value=curr_tag_metrics.crypto.crypto_addresses,
                 prev_value=all_prev_tag_metrics.crypto.avg_crypto_addresses
             )
-            crypto.change_crypto_addresses = prev_tag_metrics.crypto.crypto_addresses == curr_tag_metrics.crypto.crypto_addresses and prev_tag_metrics.crypto.list_crypto_addresses != curr_tag_metrics.crypto.list_crypto_addresses and prev_tag_metrics.crypto.crypto_addresses > 0
+            # Same number of addresses, but not the same ones: the digests cover all the addresses, the lists only the evidence
+            crypto.change_crypto_addresses = prev_tag_metrics.crypto.crypto_addresses == curr_tag_metrics.crypto.crypto_addresses and prev_tag_metrics.crypto.crypto_addresses_digest != curr_tag_metrics.crypto.crypto_addresses_digest and prev_tag_metrics.crypto.crypto_addresses > 0
             crypto.cryptocurrency_name = UtilsForComparator.calculate_change_metric(
                 curr_value=curr_tag_metrics.crypto.cryptocurrency_name,
                 prev_value=all_prev_tag_metrics.crypto.avg_cryptocurrency_name
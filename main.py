@@ -3,8 +3,13 @@ from multiprocessing import cpu_count
 import sys
 from pathlib import Path
 from datetime import datetime
-from utils import TeeOutput, FileHandler
+from utils import TeeOutput, ThreadOutput, FileHandler, MetricsCache, HttpSession, PackumentCache
+from models import EvidenceMode, EvidencePolicy
 from analyze_single_package import analyze_single_package
+from analyzers.code_analyzer import CodeAnalyzer
+from analyzers.analysis_pool import AnalysisPool
+from analyzers.execution_planner import ExecutionPlanner
+from batch_scheduler import BatchScheduler
 import time
 
 def main():
@@ -16,7 +21,30 @@ def main():
     parser.add_argument('--local', action='store_true', help='Include local versions from other_versions directory (default: False)')
     parser.add_argument('--local-dir', default='./other_versions', help='Directory for local versions (default: ./other_versions)')
     parser.add_argument('--delete-analysis', action='store_true', help='Delete previous analysis results before running (default: False)')
+    parser.add_argument('--evidence', choices=[m.value for m in EvidenceMode], default=EvidenceMode.FIRST.value, help='Matches kept as evidence: first distinct ones or most frequent ones (default: first)')
+    parser.add_argument('--evidence-limit', type=int, default=EvidencePolicy.limit, help=f'Distinct matches kept for each tag of a file, 0 keeps all of them (default: {EvidencePolicy.limit})')
+    parser.add_argument('--evidence-context', type=int, default=EvidencePolicy.context, help=f'Characters shown around a match in the flags report (default: {EvidencePolicy.context})')
+    parser.add_argument('--stream-threshold', type=int, default=CodeAnalyzer.STREAM_THRESHOLD // (1024 * 1024), help=f'Files larger than this (MB) are read and scanned in chunks, -1 never streams (default: {CodeAnalyzer.STREAM_THRESHOLD // (1024 * 1024)})')
+    parser.add_argument('--cache', default=str(MetricsCache.DEFAULT_PATH), help=f'Cache of the metrics of the files, shared by the runs (default: {MetricsCache.DEFAULT_PATH})')
+    parser.add_argument('--cache-size', type=int, default=MetricsCache.DEFAULT_MAX_BYTES // (1024 * 1024), help=f'Maximum size of the cache (MB), 0 disables it (default: {MetricsCache.DEFAULT_MAX_BYTES // (1024 * 1024)})')
+    parser.add_argument('--max-tasks-per-worker', type=int, default=AnalysisPool.MAX_TASKS_PER_WORKER, help=f'Files analyzed by a worker before it is replaced, 0 never replaces it (default: {AnalysisPool.MAX_TASKS_PER_WORKER})')
+    parser.add_argument('--file-timeout', type=int, default=int(AnalysisPool.FILE_TIMEOUT), help=f'Seconds a worker can spend on a file before it is killed and the file gets only the generic metrics, 0 never stops it (default: {int(AnalysisPool.FILE_TIMEOUT)})')
+    parser.add_argument('--http-pool-size', type=int, default=HttpSession.POOL_SIZE, help=f'Connections kept alive to the registry (default: {HttpSession.POOL_SIZE})')
+    parser.add_argument('--http-connect-timeout', type=float, default=HttpSession.CONNECT_TIMEOUT, help=f'Seconds to connect to the registry (default: {HttpSession.CONNECT_TIMEOUT})')
+    parser.add_argument('--http-read-timeout', type=float, default=HttpSession.READ_TIMEOUT, help=f'Seconds without data from the registry before a request fails (default: {HttpSession.READ_TIMEOUT})')
+    parser.add_argument('--http-retries', type=int, default=HttpSession.RETRIES, help=f'Retries of a request failed with a connection error, 429 or 5xx (default: {HttpSession.RETRIES})')
+    parser.add_argument('--metadata-cache', default=str(PackumentCache.DEFAULT_PATH), help=f'Cache of the registry metadata of the packages, shared by the runs (default: {PackumentCache.DEFAULT_PATH})')
+    parser.add_argument('--metadata-ttl', type=float, default=PackumentCache.DEFAULT_TTL, help=f'Seconds the cached metadata is used before it is revalidated with the registry, -1 disables the cache (default: {PackumentCache.DEFAULT_TTL})')
+    parser.add_argument('--download-workers', type=int, default=BatchScheduler.DOWNLOAD_WORKERS, help=f'Requests to the registry (metadata and tarballs) at the same time (default: {BatchScheduler.DOWNLOAD_WORKERS})')
+    parser.add_argument('--scan-workers', type=int, default=BatchScheduler.SCAN_WORKERS, help=f'Packages scanned at the same time, their files are analyzed by the same workers (default: {BatchScheduler.SCAN_WORKERS})')
+    parser.add_argument('--parallel-versions', action='store_true', help='Scan the files of all the versions of a package in parallel, then compare the versions in order (default: False)')
+    parser.add_argument('--adaptive', action='store_true', help='Choose for each version the sequential or the parallel analysis and the workers, from its files and bytes and the measured scan cost (default: False)')
     args = parser.parse_args()
+    evidence_policy = EvidencePolicy(mode=EvidenceMode(args.evidence), limit=args.evidence_limit or None, context=args.evidence_context)
+    stream_threshold = args.stream_threshold * 1024 * 1024 if args.stream_threshold >= 0 else None
+    http_session = HttpSession.configure(args.http_pool_size, args.http_connect_timeout, args.http_read_timeout, args.http_retries)
+    packuments = PackumentCache.configure(Path(args.metadata_cache), args.metadata_ttl)
+    metrics_cache = MetricsCache(Path(args.cache), args.cache_size * 1024 * 1024) if args.cache_size > 0 else None
 
     if args.delete_analysis:
         FileHandler.delete_previous_analysis()
@@ -26,7 +54,8 @@ def main():
     log_path = Path(args.log)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     log_file = TeeOutput(log_path)
-    sys.stdout = log_file
+    # Each package analyzed concurrently captures its own output for its log
+    sys.stdout = ThreadOutput(log_file)
     print(f"=== LOG ANALYSIS STARTED {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===")
 
     try:
@@ -37,8 +66,16 @@ def main():
         print('NPM PACKAGE ANALYZER')
         print(f'Packages to analyze: {len(packages)}')
         print(f'Worker(s): {args.workers}')
+        print(f'Concurrency: {args.download_workers} downloads, {args.scan_workers} packages scanning')
+        print(f'HTTP: {args.http_pool_size} connections, {args.http_connect_timeout}s connect and {args.http_read_timeout}s read timeout, {args.http_retries} retries')
+        print(f'Metadata cache: {f"{args.metadata_cache} ({args.metadata_ttl}s)" if packuments.enabled else "disabled"}')
         print(f'Output directory: {args.output}')
         print(f'Include local versions: {args.local}')
+        print(f'Evidence: {evidence_policy.mode.value} {evidence_policy.limit or "all"} distinct matches per tag')
+        print(f'Streamed scan: {f"files larger than {args.stream_threshold} MB" if stream_threshold is not None else "never"}')
+        print(f'Parallel versions: {args.parallel_versions}')
+        print(f'Adaptive execution: {args.adaptive}')
+        print(f'Metrics cache: {f"{args.cache} ({args.cache_size} MB)" if metrics_cache is not None else "disabled"}')
         if args.local:
             print(f'Local versions directory: {args.local_dir}')
         if args.log:
@@ -48,10 +85,24 @@ def main():
         Path(args.output).mkdir(parents=True, exist_ok=True)
 
         start_time = time.time()
-        for i, pkg in enumerate(packages):
-            analyze_single_package(pkg, args.output, i+1, len(packages), args.local, args.local_dir, args.workers)
+        # A single pool for all the packages, its workers are started once. Also with one worker: the packages run on the threads of the scheduler,
+        # where the pattern budgets cannot stop a regex match (SIGALRM is handled only by the main thread), their files are analyzed by the worker
+        # (with --adaptive, the small versions are analyzed on the package thread, their budgets checked between the matches)
+        pool = AnalysisPool(max(1, args.workers), evidence_policy, stream_threshold, metrics_cache, args.max_tasks_per_worker or None,
+                             args.file_timeout or None)
+        # Shared by the packages, it measures the scan cost on all of them
+        planner = ExecutionPlanner(args.workers) if args.adaptive else None
+        with pool:
+            scheduler = BatchScheduler(args.download_workers, args.scan_workers)
+            scheduler.run(packages, lambda pkg, i, **slots: analyze_single_package(
+                pkg, args.output, i, len(packages), args.local, args.local_dir, args.workers, evidence_policy, stream_threshold, metrics_cache, pool, parallel_versions=args.parallel_versions, planner=planner, **slots))
         
         total_time = time.time() - start_time
+        print(f'HTTP: {http_session.summary()}')
+        if packuments.enabled:
+            print(f'Metadata cache: {packuments.summary()}')
+        if metrics_cache is not None:
+            print(f'Metrics cache: {metrics_cache.hits} hits, {metrics_cache.misses} misses ({metrics_cache.hit_rate():.1%} hit rate)')
         print(f'=== ANALYSIS COMPLETED. Total time: {total_time:.1f}s ===')
 
     finally:
@@ -2,5 +2,8 @@ from .graph_label import GraphLabel
 from .version_entry import VersionEntry, SourceType
 from .code_type import CodeType
 from .symbol import Symbol
+from .evidence_policy import EvidenceMode, EvidencePolicy
+from .version_manifest import VersionManifest, ManifestDiff
+from .packument import Packument, PackumentVersion
 
-__all__ = ["GraphLabel", "VersionEntry", "CodeType", "Symbol", "SourceType"]
\ No newline at end of file
+__all__ = ["GraphLabel", "VersionEntry", "CodeType", "Symbol", "SourceType", "EvidenceMode", "EvidencePolicy", "VersionManifest", "ManifestDiff", "Packument", "PackumentVersion"]
\ No newline at end of file
@@ -61,6 +61,7 @@ class CryptoChanges:
         GenericThresholdRule(
             name="Increase wallet checks",
             metric_path="crypto.wallet_checks",
+            evidence_path="crypto.wallet_detection_list",
             config=ThresholdConfig(
                 absolute=1,
                 symbol=Symbol.GREATER_THAN,
@@ -70,6 +71,7 @@ class CryptoChanges:
         GenericThresholdRule(
             name="Increase replaced crypto addresses",
             metric_path="crypto.replaced_crypto_addresses",
+            evidence_path="crypto.replaced_crypto_addresses_list",
             config=ThresholdConfig(
                 absolute=1,
                 symbol=Symbol.GREATER_THAN,
@@ -29,6 +29,7 @@ class EvasionChanges:
         GenericThresholdRule(
             name="Increase hex obfuscation patterns",
             metric_path="evasion.hex_obfuscation_patterns",
+            evidence_path="evasion.list_obfuscation_patterns",
             config=ThresholdConfig(
                 percentage=1000.0,
                 symbol=Symbol.GREATER_THAN,
@@ -38,6 +39,7 @@ class EvasionChanges:
         GenericThresholdRule(                           # to understand
             name="Remove all hex obfuscation patterns",
             metric_path="evasion.hex_obfuscation_patterns",
+            evidence_path="evasion.list_obfuscation_patterns",
             config=ThresholdConfig(
                 percentage=-100.0,
                 symbol=Symbol.LESS_THAN,
@@ -47,6 +49,7 @@ class EvasionChanges:
         GenericThresholdRule(
             name="Increase platform detections",        # See better later
             metric_path="evasion.platform_detections",
+            evidence_path="evasion.list_platform_detections",
             config=ThresholdConfig(
                 absolute=10.0,
                 percentage=50.0,
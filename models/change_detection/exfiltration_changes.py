@@ -12,6 +12,7 @@ class ExfiltrationChanges:
         GenericThresholdRule(
             name="Increase scan functions",          # See better later
             metric_path="exfiltration.scan_functions",
+            evidence_path="exfiltration.list_scan_functions",
             config=ThresholdConfig(
                 absolute=100.0,
                 percentage=50.0,
@@ -22,6 +23,7 @@ class ExfiltrationChanges:
         GenericThresholdRule(
             name="Increase sensitive elements",      # See better later
             metric_path="exfiltration.sensitive_elements",
+            evidence_path="exfiltration.list_sensitive_elements",
             config=ThresholdConfig(
                 absolute=50.0,
                 percentage=50.0,
@@ -32,6 +34,7 @@ class ExfiltrationChanges:
         GenericThresholdRule(
             name="Increase data transmission",       # See better later
             metric_path="exfiltration.data_transmission",
+            evidence_path="exfiltration.list_data_transmissions",
             config=ThresholdConfig(
                 absolute=200.0,
                 percentage=50.0,
@@ -14,6 +14,7 @@ class PayloadChanges:
         GenericThresholdRule(
             name="Increase timing delays",          # See better later
             metric_path="payload.timing_delays",
+            evidence_path="payload.list_timing_delays",
             config=ThresholdConfig(
                 absolute=500.0,
                 percentage=50.0,
@@ -24,6 +25,7 @@ class PayloadChanges:
         GenericThresholdRule(
             name="Increase eval function usage",    # See better later
             metric_path="payload.eval_function",
+            evidence_path="payload.eval_list",
             config=ThresholdConfig(
                 absolute=100.0,
                 percentage=50.0,
@@ -34,6 +36,7 @@ class PayloadChanges:
         GenericThresholdRule(
             name="Increase shell commands",        # See better later
             metric_path="payload.shell_commands",
+            evidence_path="payload.list_shell_commands",
             config=ThresholdConfig(
                 absolute=50.0,
                 percentage=50.0,
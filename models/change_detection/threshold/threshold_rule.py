@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from .threshold_config import ThresholdConfig
 
 @dataclass
@@ -6,3 +7,4 @@ class GenericThresholdRule:
     name: str                       # e.g. increase_total_files
     metric_path: str                # e.g. generic.total_files.percentage
     config: ThresholdConfig
+    evidence_path: Optional[str] = None     # Evidence of the metric in FileMetrics, shown when the rule is triggered, e.g. payload.eval_list
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
 @dataclass
 class CryptoVersion:
     """For a single version"""
     crypto_addresses: int = 0
-    list_crypto_addresses: List[str] = field(default_factory=list)
+    list_crypto_addresses: List[Tuple[str, int]] = field(default_factory=list)     # Evidence of each file, (address, occurrences)
+    crypto_addresses_digest: int = 0        # Sum of the digests of the files
     cryptocurrency_name: int = 0
     wallet_detection: int = 0
     replaced_crypto_addresses: int = 0
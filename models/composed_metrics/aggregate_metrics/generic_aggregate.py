@@ -9,6 +9,10 @@ class GenericVersion:
     weighted_avg_blank_space_and_character_ratio: float = 0
     weighted_avg_shannon_entropy: float = 0
     longest_line_length: int = 0
+    # Files changed from the previous version (all the files are added in the first one)
+    files_added: int = 0
+    files_removed: int = 0
+    files_modified: int = 0
     
 @dataclass
 class GenericAggregate:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from ..domains import GenericMetrics, EvasionMetrics, PayloadMetrics, ExfiltrationMetrics, CryptoMetrics
+from ..domains import GenericMetrics, EvasionMetrics, PayloadMetrics, ExfiltrationMetrics, CryptoMetrics, ScanMetrics
 
 @dataclass
 class FileMetrics:
@@ -11,4 +11,5 @@ class FileMetrics:
     evasion: EvasionMetrics = field(default_factory=EvasionMetrics)
     payload: PayloadMetrics = field(default_factory=PayloadMetrics)
     exfiltration: ExfiltrationMetrics = field(default_factory=ExfiltrationMetrics)
-    crypto: CryptoMetrics = field(default_factory=CryptoMetrics)
\ No newline at end of file
+    crypto: CryptoMetrics = field(default_factory=CryptoMetrics)
+    scan: ScanMetrics = field(default_factory=ScanMetrics)
\ No newline at end of file
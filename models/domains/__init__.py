@@ -3,5 +3,7 @@ from .evasion import EvasionMetrics
 from .payload import PayloadMetrics
 from .exfiltration import ExfiltrationMetrics
 from .crypto import CryptoMetrics
+from .scan import ScanMetrics
+from .evidence import Evidence
 
-__all__ = ['GenericMetrics', 'EvasionMetrics', 'PayloadMetrics', 'ExfiltrationMetrics', 'CryptoMetrics']
\ No newline at end of file
+__all__ = ['GenericMetrics', 'EvasionMetrics', 'PayloadMetrics', 'ExfiltrationMetrics', 'CryptoMetrics', 'ScanMetrics', 'Evidence']
\ No newline at end of file
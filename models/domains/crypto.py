@@ -1,13 +1,17 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
+from .evidence import Evidence
 
 @dataclass
 class CryptoMetrics:
     crypto_addresses: int = 0
-    list_crypto_addresses: List[str] = field(default_factory=list)
+    list_crypto_addresses: List[Tuple[str, int]] = field(default_factory=list)     # (address, occurrences) chosen by the EvidencePolicy
+    # Sum of a hash of every matched address, all of them (not only the evidence): the same addresses with the same occurrences give the same digest,
+    # in any order and summed over the files of a version. Compared between versions
+    crypto_addresses_digest: int = 0
     cryptocurrency_name: int = 0
     wallet_detection: int = 0
-    wallet_detection_list: List[str] = field(default_factory=list)
+    wallet_detection_list: Evidence = field(default_factory=Evidence)
     replaced_crypto_addresses: int = 0
-    replaced_crypto_addresses_list: List[str] = field(default_factory=list)
+    replaced_crypto_addresses_list: Evidence = field(default_factory=Evidence)
     hook_provider: int = 0
\ No newline at end of file
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List
+from .evidence import Evidence
 from ..code_type import CodeType
 @dataclass
 class EvasionMetrics:
     code_type: CodeType = CodeType.NONE
     obfuscation_patterns_count: int = 0
-    list_obfuscation_patterns: List[str] = field(default_factory=list)
+    list_obfuscation_patterns: Evidence = field(default_factory=Evidence)     # Offsets of the matches chosen by the EvidencePolicy
     platform_detections_count: int = 0
-    list_platform_detections: List[str] = field(default_factory=list)
+    list_platform_detections: Evidence = field(default_factory=Evidence)
@@ -0,0 +1,34 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+
+@dataclass
+class Evidence:
+    """Distinct matches kept for a tag of a file, as offsets in the scanned content instead of strings.
+        A flat array of integers with (pattern id, start, end, occurrences) for each match, the pattern id is its index in the pattern list of the tag.
+        The text of each match with its context is taken from the content when the metrics are collected (excerpts), the reports use only it
+    """
+    entries: array = field(default_factory=lambda: array('q'))
+    unminified: bool = False    # The offsets refer to the unminified content (minified files are scanned after jsbeautifier)
+    # (before, match, after) of each entry: up to the context characters around the match, with ... where the content goes on
+    # The context of a streamed file is not kept, only the text of its matches
+    excerpts: List[Tuple[str, str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.entries) // 4
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int]]:
+        for i in range(0, len(self.entries), 4):
+            yield tuple(self.entries[i:i + 4])
+
+    def texts(self) -> List[Tuple[str, int]]:
+        """Matched text of each entry with its occurrences"""
+        return [(match, occurrences) for (_, match, _), (_, _, _, occurrences) in zip(self.excerpts, self)]
+
+    def snippets(self) -> List[str]:
+        """Matches with their context, on a single line, e.g. ...var x = [eval(atob(p))]; run(x)... (x3)"""
+        snippets = []
+        for (before, match, after), (_, _, _, occurrences) in zip(self.excerpts, self):
+            snippet = ' '.join(f"{before}[{match}]{after}".split())
+            snippets.append(snippet if occurrences == 1 else f"{snippet} (x{occurrences})")
+        return snippets
\ No newline at end of file
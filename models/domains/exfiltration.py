@@ -1,11 +1,11 @@
 from dataclasses import dataclass, field
-from typing import List
+from .evidence import Evidence
 
 @dataclass
 class ExfiltrationMetrics:
     scan_functions_count: int = 0
-    list_scan_functions: List[str] = field(default_factory=list)
+    list_scan_functions: Evidence = field(default_factory=Evidence)     # Offsets of the matches chosen by the EvidencePolicy
     sensitive_elements_count: int = 0
-    list_sensitive_elements: List[str] = field(default_factory=list)
+    list_sensitive_elements: Evidence = field(default_factory=Evidence)
     data_transmission_count: int = 0
-    list_data_transmissions: List[str] = field(default_factory=list)
\ No newline at end of file
+    list_data_transmissions: Evidence = field(default_factory=Evidence)
\ No newline at end of file
@@ -1,12 +1,13 @@
 from dataclasses import dataclass, field
 from typing import List
+from .evidence import Evidence
 
 @dataclass
 class PayloadMetrics:
     timing_delays_count: int = 0
-    list_timing_delays: List[str] = field(default_factory=list)
+    list_timing_delays: Evidence = field(default_factory=Evidence)     # Offsets of the matches chosen by the EvidencePolicy
     eval_count: int = 0
-    eval_list: List[str] = field(default_factory=list)
+    eval_list: Evidence = field(default_factory=Evidence)
     shell_commands_count: int = 0
-    list_shell_commands: List[str] = field(default_factory=list)
+    list_shell_commands: Evidence = field(default_factory=Evidence)
     preinstall_scripts: List[str] = field(default_factory=list)
\ No newline at end of file
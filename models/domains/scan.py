@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass
+class ScanMetrics:
+    """Statistics of the pattern scan of a file"""
+    patterns_scanned: int = 0
+    patterns_skipped: int = 0   # Patterns not run because none of their literal anchors is in the file
+    scan_truncated: bool = False    # At least one pattern was stopped by its time budget, its matches are partial
+    budget_exceeded_patterns: List[str] = field(default_factory=list)   # e.g. ['timing_delays[0]']
+    cached: bool = False    # The metrics were served from the MetricsCache, the statistics are of the scan that computed them
+    degraded: bool = False  # Only the generic metrics, the full analysis of the file failed, crashed or timed out on the workers
+    timed_out: bool = False # The full analysis was stopped by the file timeout of the pool
\ No newline at end of file
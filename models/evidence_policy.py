@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+class EvidenceMode(Enum):
+    FIRST = "first"     # First distinct matches, in the order they are found
+    TOP = "top"         # Most frequent distinct matches
+
+@dataclass
+class EvidencePolicy:
+    '''Which matches are kept as evidence of a tag, the counts are always exact'''
+    mode: EvidenceMode = EvidenceMode.FIRST
+    limit: Optional[int] = 20       # Distinct matches kept for each tag of a file, None keeps all of them
+    context: int = 40               # Characters shown before and after a match in the snippets of the reports
\ No newline at end of file
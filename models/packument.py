@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+@dataclass
+class PackumentVersion:
+    '''Fields used of a version in the registry metadata of a package'''
+    tarball: str = ""                       # dist.tarball, URL of the tarball
+    integrity: str = ""                     # dist.integrity, SRI of the tarball (e.g. sha512-<base64>)
+    shasum: str = ""                        # dist.shasum, SHA-1 hex of the tarball
+    maintainers: Tuple[str, ...] = ()       # Names of the maintainers
+    git_head: str = ""                      # gitHead, commit of the release
+    released: str = ""                      # time[version], ISO date of the release
+
+@dataclass
+class Packument:
+    '''Registry metadata of a package reduced to the fields used (no README, dependencies etc. of every version)'''
+    name: str = ""
+    versions: Dict[str, PackumentVersion] = field(default_factory=dict)    # In the order of the registry
+    repository_url: str = ""                # repository.url
\ No newline at end of file
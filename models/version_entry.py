@@ -11,4 +11,4 @@ class VersionEntry:
     '''Represents a specific version entry of a package'''
     name: str           # e.g. 1.1.2, 1.1.1-local, 2.1.0-candidate, posthog-node@5.18.0
     source: SourceType 
-    ref: object         # Local Path or Git TagReference
\ No newline at end of file
+    ref: object         # TarballSource (npm and local tarballs) or Git TagReference
\ No newline at end of file
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import hashlib
+
+@dataclass
+class ManifestDiff:
+    '''Paths of the files of a version, compared with the previous version'''
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+@dataclass
+class VersionManifest:
+    '''Files of a version: path relative to the package -> (size in bytes, SHA-256 of the content)'''
+    files: Dict[str, Tuple[int, str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_contents(cls, contents: Dict[str, bytes]) -> "VersionManifest":
+        """Manifest of files already in memory (e.g. read from a tarball), by path relative to the package"""
+        return cls({path: (len(raw), hashlib.sha256(raw).hexdigest()) for path, raw in contents.items()})
+
+    def diff(self, previous: Optional["VersionManifest"]) -> ManifestDiff:
+        """Changes from the previous version, every file is added if there is no previous version"""
+        previous_files = previous.files if previous is not None else {}
+        changes = ManifestDiff(removed=[path for path in previous_files if path not in self.files])
+        for path, entry in self.files.items():
+            if path not in previous_files:
+                changes.added.append(path)
+            elif previous_files[path] != entry:
+                changes.modified.append(path)
+            else:
+                changes.unchanged.append(path)
+        return changes
\ No newline at end of file
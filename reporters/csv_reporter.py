@@ -1,10 +1,11 @@
 import csv
 import json
-from dataclasses import is_dataclass, asdict
+from dataclasses import is_dataclass, fields
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Union
 from datetime import datetime
+from models.domains import Evidence
 from utils import synchronized_print
 
 class CSVReporter:
@@ -67,12 +68,16 @@ class CSVReporter:
 
     @staticmethod
     def normalize_value(value):
-        if isinstance(value, Enum):
+        if isinstance(value, Evidence):
+            # The matched texts with their occurrences, e.g. [["eval(x)", 2]]
+            return CSVReporter.normalize_value(value.texts())
+        elif isinstance(value, Enum):
             return value.value
         elif isinstance(value, datetime):
             return value.isoformat()
         elif is_dataclass(value):
-            return asdict(value)
+            # Field by field (not asdict) so that each Evidence is rendered
+            return {f.name: CSVReporter.normalize_value(getattr(value, f.name)) for f in fields(value)}
         elif isinstance(value, list):
             return [CSVReporter.normalize_value(v) for v in value]
         elif isinstance(value, dict):
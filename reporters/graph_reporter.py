@@ -1,14 +1,23 @@
 import matplotlib.pyplot as plt
 from pathlib import Path
+import threading
 import pandas as pd
 from models import GraphLabel
 from matplotlib.ticker import MaxNLocator
 
 class GraphReporter:
 
+    # pyplot draws on a global current figure, the graphs of packages analyzed concurrently are generated one package at a time
+    _lock = threading.Lock()
+
     @staticmethod
     def generate_graphs(output_dir: Path, package_name: str) -> None:
         """Generate one graph per metric"""
+        with GraphReporter._lock:
+            GraphReporter._generate_graphs(output_dir, package_name)
+
+    @staticmethod
+    def _generate_graphs(output_dir: Path, package_name: str) -> None:
 
         metrics_file = output_dir / "aggregate_metrics_by_tag.csv"
         history_file = output_dir / "aggregate_metrics_history.csv"
@@ -1,10 +1,14 @@
 from pathlib import Path
+from typing import List, Optional
 from models.change_detection import Flags
 from models.change_detection.threshold.threshold_evaluator import ThresholdEvaluator
+from models.composed_metrics import FileMetrics
 from utils import synchronized_print
 class TextReporter:
     """Generate flag text report considering all flag fields"""
 
+    MAX_SNIPPETS = 5    # Evidence snippets shown for each triggered flag
+
     @staticmethod
     def initialize_report(output_dir: Path, package: str) -> None:
         with open(output_dir, "w", encoding="utf-8") as f:
@@ -12,7 +16,8 @@ class TextReporter:
             f.write("=" * 60 + "\n\n")
     
     @staticmethod
-    def generate_report(output_dir: Path, flag: Flags) -> None:
+    def generate_report(output_dir: Path, flag: Flags, files: Optional[List[FileMetrics]] = None) -> None:
+        """Append the triggered flags of a version. With the metrics of its files, a flag also shows the snippets of its evidence"""
         with open(output_dir, "a", encoding="utf-8") as f:
             bullets = []
 
@@ -31,6 +36,9 @@ class TextReporter:
                     detail = f"     Value absolute: {value.absolute:.2f}.   Threshold: {rule.config.absolute:.2f}."
                 else:
                     detail = f"     Value: {value}."
+                if rule.evidence_path and files:
+                    for snippet in TextReporter._evidence_snippets(rule.evidence_path, files):
+                        detail += f"\n       {snippet}"
                 bullets.append(f"{base}\n{detail}")
 
             if bullets:
@@ -38,6 +46,20 @@ class TextReporter:
                 f.write("\n".join(bullets))
                 f.write("\n\n")
 
+    @staticmethod
+    def _evidence_snippets(evidence_path: str, files: List[FileMetrics]) -> List[str]:
+        """First snippets of the evidence at evidence_path (e.g. payload.eval_list) in the files, from the excerpts taken when they were analyzed"""
+        snippets = []
+        for metrics in files:
+            evidence = ThresholdEvaluator.get_value(metrics, evidence_path)
+            if not evidence:
+                continue
+            for snippet in evidence.snippets():
+                snippets.append(f"{metrics.file_path}: {snippet}")
+                if len(snippets) == TextReporter.MAX_SNIPPETS:
+                    return snippets
+        return snippets
+
     @staticmethod
     def finish_report(output_dir: Path) -> None:
         with open(output_dir, "r+", encoding="utf-8") as f:
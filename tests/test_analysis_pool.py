@@ -0,0 +1,18 @@
+from multiprocessing import Pipe
+import unittest
+from analyzers import AnalysisPool
+
+class MonitorStopTest(unittest.TestCase):
+
+    def test_connection_accepted_before_the_stop_is_released(self):
+        # Accepted by the acceptor, the monitor has not read its wakeup yet when the pool closes
+        with AnalysisPool(1) as pool:
+            worker_end, monitor_end = Pipe()
+            with pool._lock:
+                pool._accepted.append(monitor_end)
+        self.assertTrue(worker_end.poll(5))
+        self.assertFalse(worker_end.recv())
+        self.assertTrue(monitor_end.closed)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
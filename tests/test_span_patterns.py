@@ -0,0 +1,60 @@
+import random
+import re
+import unittest
+from analyzers.categories.payload_analyzer import PayloadAnalyzer
+from analyzers.categories.evasion_analyzer import EvasionAnalyzer
+from utils import BackrefSpanPattern
+
+# Characters whose lowercase is special for re.IGNORECASE: the dotted İ (two characters with str.lower), the Kelvin sign and the long s
+# (lowercase to ASCII letters), the final sigma (str.lower depends on the context), ß and its capital, Cherokee (lowercase outside the BMP)
+NON_ASCII = 'İiıKkſsΣσςßẞÅåĲĳᏸᏰꭰ'
+
+def spans(pattern, content):
+    return [match.span() for match in pattern.finditer(content)]
+
+class BackrefSpanPatternTest(unittest.TestCase):
+    """The span patterns give the matches of plain re, also when the name of the backreference is not ASCII"""
+
+    def setUp(self):
+        self.delay = PayloadAnalyzer.TIMING_DELAYS_PATTERNS[0]
+        self.plain = re.compile(self.delay.pattern, self.delay.flags)
+
+    def test_non_ascii_names(self):
+        for head in NON_ASCII:
+            for partner in NON_ASCII:
+                for name, reference in ((head, partner), (f"a{head}", f"A{partner}"), (f"{head}x", f"{partner}X")):
+                    content = f"await new Promise({name} => {{ setTimeout({reference}, 10) }});"
+                    self.assertEqual(spans(self.delay, content), spans(self.plain, content), content)
+
+    def test_random_non_ascii_contents(self):
+        generator = random.Random(0)
+        names = [''.join(generator.choice(NON_ASCII + 'abXY') for _ in range(generator.randint(1, 3))) for _ in range(20)]
+        for _ in range(2000):
+            parts = []
+            for _ in range(generator.randint(1, 4)):
+                name = generator.choice(names)
+                parts.append(generator.choice([
+                    f"await new Promise({name} => {{",
+                    f"setTimeout({generator.choice(names)}, 5)",
+                    f"setTimeout({name.upper()}{generator.choice(['', '1', 'ſ'])}) ",
+                    generator.choice(')}; \n'),
+                ]))
+            content = ''.join(parts)
+            self.assertEqual(spans(self.delay, content), spans(self.plain, content), content)
+
+    def test_case_sensitive(self):
+        pattern = BackrefSpanPattern(r'go\((\w+)\)', r'stop\(', ')')
+        plain = re.compile(pattern.pattern)
+        for content in ('go(Σa) stop(σa)', 'go(ſ) stop(s)', 'go(İ) x stop(İ) y', 'go(ß) go(ẞ) stop(ß)'):
+            self.assertEqual(spans(pattern, content), spans(plain, content), content)
+
+class LineSpanPatternTest(unittest.TestCase):
+
+    def test_non_ascii_lines(self):
+        pattern = EvasionAnalyzer.OBFUSCATION_PATTERNS[2]
+        plain = re.compile(pattern.pattern, pattern.flags)
+        for content in ('TRY{ İ }CATCH(_0XABCDEF)', 'try{ſ\n}catch(0xabcdef) try{ Σ }catch(_0x1234567)', 'ẞtry{}catch(0x123456)try{'):
+            self.assertEqual(spans(pattern, content), spans(plain, content), content)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+from pathlib import Path
+from unittest import mock
+import re
+import tempfile
+import threading
+import unittest
+from analyzers import ExecutionPlanner
+from analyzers.version_analyzer import VersionAnalyzer
+from models import SourceType
+from models.domains import ScanMetrics
+from utils import PatternEngine
+
+def in_thread(function):
+    """Result of function called on a thread that is not the main one, as the packages of the BatchScheduler"""
+    result = {}
+    def run():
+        try:
+            result['value'] = function()
+        except BaseException as e:
+            result['error'] = e
+    thread = threading.Thread(target=run, name="package")
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+class AdaptiveOffMainThreadTest(unittest.TestCase):
+
+    def test_small_version_is_analyzed_sequentially(self):
+        with tempfile.TemporaryDirectory() as directory:
+            package_dir = Path(directory)
+            (package_dir / 'index.js').write_text('eval(atob(x));\n')
+            # The pool is never used for a small version, also on a package thread
+            analyzer = VersionAnalyzer(max_processes=4, package_name='example', pool=object(), planner=ExecutionPlanner(4))
+            with mock.patch.object(analyzer, '_analyze_files_parallel', side_effect=AssertionError("small version sent to the pool")), \
+                 mock.patch.object(analyzer, '_analyze_files_sequential', wraps=analyzer._analyze_files_sequential) as sequential:
+                results = in_thread(lambda: analyzer._analyze_version('1.0.0', package_dir, SourceType.TARBALL, [package_dir / 'index.js']))
+            sequential.assert_called_once()
+            self.assertEqual([metrics.payload.eval_count for metrics in results], [1])
+
+    def test_large_version_goes_to_the_pool(self):
+        planner = ExecutionPlanner(1)
+        plan = planner.plan(100, 100 * 1024 * 1024, pool_available=True, deadlines_enforced=False)
+        self.assertTrue(plan.parallel)
+        self.assertFalse(planner.plan(100, 100 * 1024 * 1024, pool_available=True, deadlines_enforced=True).parallel)
+
+class PoolOffMainThreadTest(unittest.TestCase):
+
+    def test_no_pool_forked_from_a_package_thread(self):
+        analyzer = VersionAnalyzer(max_processes=2, package_name='example')
+        analyzer.entries = ['1.0.0']
+        with mock.patch('analyzers.version_analyzer.AnalysisPool', side_effect=AssertionError("pool forked from a thread")):
+            with self.assertRaises(ValueError):
+                in_thread(analyzer.analyze_versions)
+
+class BudgetOffMainThreadTest(unittest.TestCase):
+
+    def test_pattern_budget_is_checked_between_matches(self):
+        engine = PatternEngine({'x': [re.compile(r'x')]}, pattern_time_budget=0.05, file_time_budget=None)
+        content = 'x' * 20_000_000
+        stats = ScanMetrics()
+        hits = in_thread(lambda: engine.scan(content, stats=stats))
+        self.assertTrue(stats.scan_truncated)
+        self.assertEqual(stats.budget_exceeded_patterns, ['x[0]'])
+        self.assertLess(hits['x'][0], len(content))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,9 +1,16 @@
 from .npm_client import NPMClient
 from .file_handler import FileHandler
-from .logging_utils import synchronized_print, setup_logging, TeeOutput, OutputTarget
+from .logging_utils import synchronized_print, setup_logging, TeeOutput, OutputTarget, ThreadOutput, capture_output
 from .deobfuscate import Deobfuscator
-from .utils_for_analyzer import UtilsForAnalyzer
+from .utils_for_analyzer import UtilsForAnalyzer, PatternEngine, PatternTimeout
+from .span_patterns import LineSpanPattern, BackrefSpanPattern
 from .utils_for_comparator import UtilsForComparator
+from .content_view import ContentView, StreamedView
+from .metrics_cache import MetricsCache
+from .tarball_source import TarballSource
+from .pipeline import prefetch, BackgroundConsumer, with_output
+from .http_session import HttpSession, IntegrityError
+from .packument_cache import PackumentCache
 
 __all__ = [
     'NPMClient',
@@ -12,7 +19,23 @@ __all__ = [
     'setup_logging',
     'OutputTarget',
     'TeeOutput',
+    'ThreadOutput',
+    'capture_output',
     'Deobfuscator',
     'UtilsForAnalyzer',
-    'UtilsForComparator'
+    'PatternEngine',
+    'PatternTimeout',
+    'LineSpanPattern',
+    'BackrefSpanPattern',
+    'UtilsForComparator',
+    'ContentView',
+    'StreamedView',
+    'MetricsCache',
+    'TarballSource',
+    'prefetch',
+    'BackgroundConsumer',
+    'with_output',
+    'HttpSession',
+    'IntegrityError',
+    'PackumentCache'
 ]
\ No newline at end of file
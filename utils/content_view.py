@@ -0,0 +1,177 @@
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import hashlib
+import io
+import numpy as np
+from models.domains import Evidence
+from .file_handler import FileHandler
+
+class ContentView:
+    """Content of a single file and the data derived from it, computed lazily at most once and shared by all the analyzers"""
+
+    # Line boundaries used by str.splitlines(): \n \v \f \r \x1c \x1d \x1e \x85
+    LINE_BOUNDARIES = np.array([0x0a, 0x0b, 0x0c, 0x0d, 0x1c, 0x1d, 0x1e, 0x85, 0x2028, 0x2029], dtype=np.uint32)
+    streamed = False    # The content is read in chunks, see StreamedView
+
+    def __init__(self, file_path: Optional[Path], file_name: str, text: Optional[str] = None, raw: Optional[bytes] = None):
+        self.file_path = file_path      # e.g. repos/pkg/dist/index.min.js
+        self.file_name = file_name      # path relative to the package, e.g. dist/index.min.js
+        if text is not None:
+            self.text = text
+        if raw is not None:
+            self.raw = raw              # Already in memory, e.g. a member of a tarball
+
+    @classmethod
+    def from_text(cls, text: str, file_name: str) -> "ContentView":
+        """View of a content that is not read from disk, e.g. unminified code"""
+        return cls(None, file_name, text)
+
+    @cached_property
+    def raw(self) -> bytes:
+        """Raw bytes of the file"""
+        if self.file_path is None:
+            return self.text.encode('utf-8')
+        return FileHandler.read_bytes(self.file_path)
+
+    @cached_property
+    def digest(self) -> str:
+        """SHA-256 of the raw bytes"""
+        return hashlib.sha256(self.raw).hexdigest()
+
+    @cached_property
+    def text(self) -> str:
+        """Decoded content, the same of FileHandler.read_file"""
+        return FileHandler.decode_content(self.raw)
+
+    @cached_property
+    def extension(self) -> str:
+        """Lowercase extension, e.g. .js"""
+        return Path(self.file_name).suffix.lower()
+
+    @cached_property
+    def size_chars(self) -> int:
+        return len(self.text)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.size_chars == 0
+
+    @cached_property
+    def code_points(self) -> np.ndarray:
+        """NumPy view of the text, one element per character (uint8 if it is ASCII, otherwise the uint32 code points)"""
+        return self._code_points(self.text)
+
+    @cached_property
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct characters (code points in ascending order) and their frequencies"""
+        return self._histogram(self.code_points)
+
+    @cached_property
+    def line_offsets(self) -> np.ndarray:
+        """Offset of the first character of each line"""
+        boundaries = np.flatnonzero(np.isin(self.code_points, self.LINE_BOUNDARIES))
+        return np.concatenate(([0], boundaries + 1))
+
+    @cached_property
+    def longest_line_length(self) -> int:
+        """Same as max(len(r) for r in text.splitlines()), 0 for an empty text"""
+        if not self.text:
+            return 0
+        # Each line ends at the next boundary (the offset of the next line - 1), the last one at the end of the text
+        line_ends = np.append(self.line_offsets[1:] - 1, len(self.code_points))
+        return int((line_ends - self.line_offsets).max())
+
+    def match_texts(self, evidence: Evidence) -> List[Tuple[str, int]]:
+        """Matched text of each entry of the evidence with its occurrences"""
+        return [(self.text[start:end], occurrences) for _, start, end, occurrences in evidence]
+
+    def excerpts(self, evidence: Evidence, context: int) -> List[Tuple[str, str, str]]:
+        """(before, match, after) of each entry of the evidence, with up to context characters around the match (see Evidence.excerpts)"""
+        text = self.text
+        return [(f"{'...' if start > context else ''}{text[max(start - context, 0):start]}", text[start:end],
+                 f"{text[end:end + context]}{'...' if end + context < len(text) else ''}") for _, start, end, _ in evidence]
+
+    @staticmethod
+    def _code_points(text: str) -> np.ndarray:
+        if text.isascii():
+            return np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+    @staticmethod
+    def _histogram(code_points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(code_points) and int(code_points.max()) < 0x10000:
+            counts = np.bincount(code_points)
+            values = np.flatnonzero(counts)
+            return values, counts[values]
+        return np.unique(code_points, return_counts=True)
+
+class StreamedView(ContentView):
+    """View of a large file read in chunks, the content is never in memory as a whole.
+        The data derived from the content is accumulated while the chunks are read (with a single pass of chunks()), and is available only after it.
+        The text of the matches is kept by the pattern scan in match_text, it cannot be extracted from the content later
+    """
+    streamed = True
+
+    def __init__(self, file_path: Path, file_name: str, chunk_size: int, raw: Optional[bytes] = None):
+        super().__init__(file_path, file_name, raw=raw)
+        self.in_memory = raw is not None
+        self.chunk_size = chunk_size
+        self.size_chars = 0
+        self.match_text: Dict[Tuple[int, int], str] = {}   # (start, end) -> matched text, filled by PatternEngine.scan_chunks
+        self.frequencies: Dict[int, int] = {}               # code point -> occurrences
+        self.longest_complete_line = 0                      # Longest line followed by a line boundary
+        self.last_line_length = 0                           # Length of the line still open at the end of the chunks read so far
+
+    @cached_property
+    def digest(self) -> str:
+        """SHA-256 of the raw bytes, read in chunks"""
+        if self.in_memory:
+            return hashlib.sha256(self.raw).hexdigest()
+        sha256 = hashlib.sha256()
+        with open(self.file_path, 'rb') as f:
+            for block in iter(lambda: f.read(self.chunk_size), b''):
+                sha256.update(block)
+        return sha256.hexdigest()
+
+    def chunks(self) -> Iterator[str]:
+        # The content in memory is decoded in chunks as well, the text of a large file is never decoded as a whole
+        if self.in_memory:
+            chunks = FileHandler.decode_chunks(io.BytesIO(self.raw), self.chunk_size)
+        else:
+            chunks = FileHandler.read_chunks(self.file_path, self.chunk_size)
+        for chunk in chunks:
+            self._update(chunk)
+            yield chunk
+
+    @property
+    def longest_line_length(self) -> int:
+        return max(self.longest_complete_line, self.last_line_length)
+
+    @property
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.array(sorted(self.frequencies), dtype=np.int64)
+        return values, np.array([self.frequencies[value] for value in values.tolist()], dtype=np.int64)
+
+    def match_texts(self, evidence: Evidence) -> List[Tuple[str, int]]:
+        return [(self.match_text[(start, end)], occurrences) for _, start, end, occurrences in evidence]
+
+    def excerpts(self, evidence: Evidence, context: int) -> List[Tuple[str, str, str]]:
+        # The content around the matches is not in memory anymore, only their text
+        return [('', self.match_text[(start, end)], '') for _, start, end, _ in evidence]
+
+    def _update(self, chunk: str) -> None:
+        code_points = self._code_points(chunk)
+        self.size_chars += len(chunk)
+        for value, count in zip(*(a.tolist() for a in self._histogram(code_points))):
+            self.frequencies[value] = self.frequencies.get(value, 0) + count
+
+        # A line can span more chunks: its first part is in last_line_length
+        boundaries = np.flatnonzero(np.isin(code_points, self.LINE_BOUNDARIES))
+        if not len(boundaries):
+            self.last_line_length += len(chunk)
+            return
+        self.longest_complete_line = max(self.longest_complete_line, self.last_line_length + int(boundaries[0]))
+        if len(boundaries) > 1:
+            self.longest_complete_line = max(self.longest_complete_line, int(np.diff(boundaries).max()) - 1)
+        self.last_line_length = len(chunk) - int(boundaries[-1]) - 1
\ No newline at end of file
@@ -1,8 +1,11 @@
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, List
+import codecs
+import hashlib
 import json
 import shutil
 import os
+from models import VersionManifest
 
 class FileHandler:
     """Handles file and directory operations"""
@@ -45,22 +48,78 @@ class FileHandler:
                 files.append(Path(root) / name)
         return files
     
+    @staticmethod
+    def build_manifest(directory: Path, files: List[Path], block_size: int = 1024 * 1024) -> VersionManifest:
+        """Size and SHA-256 of each file, by path relative to the directory"""
+        manifest = VersionManifest()
+        for file_path in files:
+            sha256 = hashlib.sha256()
+            size = 0
+            try:
+                with open(file_path, 'rb') as f:
+                    for block in iter(lambda: f.read(block_size), b''):
+                        sha256.update(block)
+                        size += len(block)
+            except Exception as e:
+                print(f"Error reading {file_path}: {e}")
+            manifest.files[str(file_path.relative_to(directory))] = (size, sha256.hexdigest())
+        return manifest
+
     @staticmethod
     def read_file(file_path: Path) -> str:
         """Read file content and remove comments"""
+        content = FileHandler.decode_content(FileHandler.read_bytes(file_path))
+        '''
+        js_extensions = {'.js', '.mjs', '.cjs', '.ts', '.jsx', '.tsx'}
+        if file_path.suffix.lower() in js_extensions:
+            content = FileHandler.remove_js_comments_easy(content)
+        '''
+        return content
+
+    @staticmethod
+    def read_bytes(file_path: Path) -> bytes:
+        """Read raw file content"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                '''
-                js_extensions = {'.js', '.mjs', '.cjs', '.ts', '.jsx', '.tsx'}
-                if file_path.suffix.lower() in js_extensions:
-                    content = FileHandler.remove_js_comments_easy(content)
-                '''    
-                return content
-            
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return b""
+
+    @staticmethod
+    def read_chunks(file_path: Path, chunk_size: int) -> Iterator[str]:
+        """Read the file in chunks of chunk_size bytes, decoded as decode_content: the concatenation of the chunks is the content of read_file"""
+        try:
+            with open(file_path, 'rb') as f:
+                yield from FileHandler.decode_chunks(f, chunk_size)
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
-            return ""
+
+    @staticmethod
+    def decode_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[str]:
+        """Chunks of a binary stream (a file or the content of a tarball member in memory), decoded as decode_content"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        carriage_return = ''    # \r at the end of a chunk, it could be the first half of a \r\n
+        while True:
+            raw = stream.read(chunk_size)
+            chunk = carriage_return + decoder.decode(raw, final=not raw)
+            carriage_return = '\r' if raw and chunk.endswith('\r') else ''
+            if carriage_return:
+                chunk = chunk[:-1]
+            if '\r' in chunk:
+                chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+            if chunk:
+                yield chunk
+            if not raw:
+                return
+
+    @staticmethod
+    def decode_content(raw: bytes) -> str:
+        """Decode raw content as reading the file in text mode: utf-8 ignoring invalid bytes, universal newlines (\r\n and \r become \n)"""
+        content = raw.decode('utf-8', errors='ignore')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
 
     @staticmethod
     def delete_previous_analysis() -> None:
@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import hashlib
+import os
+import random
+import tempfile
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+class IntegrityError(Exception):
+    """Raised by a download whose content does not have the expected digest"""
+
+class HttpSession:
+    """HTTP session shared by all the requests of a process (registry metadata and tarballs): the connections are kept alive and reused
+        (no new TLS handshake for each tarball), at most pool_size requests at a time for each host (one for each connection of its pool).
+        A request that fails with a connection error, a timeout, 429 or 5xx is retried with exponential backoff and jitter (or after Retry-After)
+    """
+    POOL_SIZE = 10
+    CONNECT_TIMEOUT = 5.0       # seconds
+    READ_TIMEOUT = 30.0         # seconds between two bytes of the response
+    RETRIES = 3
+    BACKOFF = 0.5               # seconds before the first retry, doubled at each retry
+    MAX_BACKOFF = 30.0          # seconds
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    RETRY_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+    CHUNK_SIZE = 64 * 1024      # bytes written at a time by download
+
+    _shared: Optional["HttpSession"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_size: int = POOL_SIZE, connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT, retries: int = RETRIES):
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        # Requests sent (retries included), requests retried and requests failed after all the retries, for the summary of the run
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+        self._counters_lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "HttpSession":
+        """Session of the process, created with the default settings unless configured before"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, pool_size: int = POOL_SIZE, connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT, retries: int = RETRIES) -> "HttpSession":
+        """Replace the session of the process, before the first request"""
+        with cls._shared_lock:
+            cls._shared = cls(pool_size, connect_timeout, read_timeout, retries)
+            return cls._shared
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET with the retries, the response of the last attempt (its status is not checked), or the error of the last attempt raised"""
+        with self.host_slot(url):
+            return self._retrying(lambda: self.session.get(url, headers=headers, timeout=self.timeout))
+
+    def download(self, url: str, target: Path, digest: Optional[Tuple[str, str]] = None, chunk_size: int = CHUNK_SIZE) -> None:
+        """Streamed GET of url into target, with the retries of get (also for an error while reading the body), raises the error of the last attempt.
+            The content is written to a temporary file in the same directory, renamed to target only when complete (and, given digest as
+            (hashlib algorithm, hex digest), only if its digest matches, IntegrityError otherwise): an existing target is never truncated or corrupted
+        """
+        try:
+            response, _ = self.stream(url, lambda response: self._write(response, Path(target), digest, chunk_size))
+        except IntegrityError:
+            self._count(failed=1)   # Not retried: the registry would send the same content
+            raise
+        response.raise_for_status()
+
+    def stream(self, url: str, consume: Callable[[requests.Response], Any], headers: Optional[Dict[str, str]] = None) -> Tuple[requests.Response, Any]:
+        """Streamed GET of url, consume(response) reads the body of a successful (2xx) response as it arrives (e.g. response.iter_content),
+            with the retries of get (also for an error while reading the body). The response of the last attempt (its status is not checked,
+            its body is closed) and the result of consume, None if not successful
+        """
+        result = None
+
+        def send() -> requests.Response:
+            nonlocal result
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            try:
+                if 200 <= response.status_code < 300:     # Not ok: e.g. 304, without a body
+                    result = consume(response)
+            finally:
+                response.close()
+            return response
+
+        with self.host_slot(url):
+            response = self._retrying(send)
+        return response, result
+
+    def host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Limit of the requests at the same time to the host of url"""
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            return self._host_slots.setdefault(host, threading.BoundedSemaphore(self.pool_size))
+
+    @staticmethod
+    def _write(response: requests.Response, target: Path, digest: Optional[Tuple[str, str]], chunk_size: int) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".part")
+        try:
+            # The digest is updated chunk by chunk: the content is never held in memory, nor read again
+            hasher = hashlib.new(digest[0]) if digest else None
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
+            if hasher and hasher.hexdigest() != digest[1].lower():
+                raise IntegrityError(f"{digest[0]} of {response.url} is {hasher.hexdigest()}, expected {digest[1]}")
+            os.replace(temp_path, target)   # Atomic on the same file system
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _retrying(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send the request until it does not fail with a connection error, a timeout, 429 or 5xx, at most retries times more"""
+        for attempt in range(self.retries + 1):
+            response, error = None, None
+            self._count(requests=1)
+            try:
+                response = send()
+                if response.status_code not in self.RETRY_STATUSES:
+                    return response
+            except self.RETRY_ERRORS as e:
+                error = e
+            if attempt == self.retries:
+                self._count(failed=1)
+                if error is not None:
+                    raise error
+                return response
+            delay = self._delay(attempt, response)
+            if response is not None:
+                response.close()
+            self._count(retried=1)
+            time.sleep(delay)
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Seconds before the next attempt: Retry-After of the server if given in seconds, otherwise exponential with jitter (half to full delay)"""
+        retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+        if retry_after.isdigit():
+            return min(float(retry_after), self.MAX_BACKOFF)
+        delay = min(self.BACKOFF * 2 ** attempt, self.MAX_BACKOFF)
+        return random.uniform(delay / 2, delay)
+
+    def _count(self, requests: int = 0, retried: int = 0, failed: int = 0) -> None:
+        with self._counters_lock:
+            self.requests += requests
+            self.retried += retried
+            self.failed += failed
+
+    def connections(self) -> int:
+        """Connections opened so far, for all the hosts (a request on a kept-alive connection does not open one)"""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def summary(self) -> str:
+        connections = self.connections()
+        return (f"{self.requests} requests on {connections} connections ({max(self.requests - connections, 0)} reused), "
+                f"{self.retried} retried, {self.failed} failed")
\ No newline at end of file
@@ -1,4 +1,6 @@
 import sys
+import contextlib
+import threading
 from multiprocessing import Lock
 from enum import Enum
 
@@ -33,6 +35,37 @@ class TeeOutput:
         except Exception:
             pass
 
+class ThreadOutput:
+    """sys.stdout shared by more threads: a thread can redirect its own output (e.g. to the log buffer of its package) without redirecting the others"""
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    @property
+    def stream(self):
+        return getattr(self._local, 'stream', None) or self.default
+
+    def write(self, message):
+        self.stream.write(message)
+
+    def flush(self):
+        self.stream.flush()
+
+    @contextlib.contextmanager
+    def redirect(self, stream):
+        previous = getattr(self._local, 'stream', None)
+        self._local.stream = stream
+        try:
+            yield stream
+        finally:
+            self._local.stream = previous
+
+def capture_output(stream):
+    """Redirect the output of the current thread to stream, only of this thread if sys.stdout is a ThreadOutput"""
+    if isinstance(sys.stdout, ThreadOutput):
+        return sys.stdout.redirect(stream)
+    return contextlib.redirect_stdout(stream)
+
 def synchronized_print(*args, target: OutputTarget = OutputTarget.BOTH, **kwargs):
     """Atomic and synchronized print to avoid mixing output between processes
     Writes to both terminal AND current stdout (which may be redirected to a buffer
@@ -0,0 +1,100 @@
+from pathlib import Path
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+class MetricsCache:
+    """Persistent cache of the metrics of a file, by hash of its content (and of how it is analyzed), shared by runs, versions and packages.
+        A SQLite database: safe for concurrent access from more processes and threads, each one opens its own connection (also after being pickled into a pool worker).
+        The least recently used entries are evicted when the database is larger than max_bytes
+    """
+    DEFAULT_PATH = Path('cache') / 'metrics.sqlite3'
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, path: Path = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        # Files served from the cache and files analyzed, counted by the VersionAnalyzer for the whole run (see record)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()     # Connection of each thread, with the pid of the process that opened it
+        self._counters_lock = threading.Lock()
+
+    def __getstate__(self):
+        # A connection can be used only by the thread that opened it
+        state = self.__dict__.copy()
+        del state['_local'], state['_counters_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._counters_lock = threading.Lock()
+
+    def record(self, hits: int, misses: int) -> None:
+        """Count files served from the cache and files analyzed, from the threads of the packages analyzed concurrently"""
+        with self._counters_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def get(self, key: str):
+        """Cached FileMetrics of the key, None if missing"""
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT metrics FROM metrics WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with connection:
+                connection.execute("UPDATE metrics SET last_used = ? WHERE key = ?", (time.time(), key))
+            return pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, AttributeError, EOFError) as e:
+            print(f"Error reading the metrics cache {self.path}: {e}")
+            return None
+
+    def put(self, key: str, metrics) -> None:
+        """Store the FileMetrics of the key, evicting the least recently used entries beyond max_bytes"""
+        blob = pickle.dumps(metrics, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO metrics (key, metrics, size, last_used) VALUES (?, ?, ?, ?)", (key, blob, len(blob), time.time()))
+                used_bytes = self._used_bytes(connection)
+                if used_bytes > self.max_bytes:
+                    # Keep the most recently used entries that fit in 90% of max_bytes (not to evict again at the next insert),
+                    # the pages of the database are larger than the sum of the entries
+                    entries_bytes = connection.execute("SELECT SUM(size) FROM metrics").fetchone()[0]
+                    connection.execute(
+                        "DELETE FROM metrics WHERE key IN ("
+                        "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS total FROM metrics) WHERE total > ?)",
+                        (int(entries_bytes * self.max_bytes * self.EVICTION_TARGET / used_bytes),)
+                    )
+        except sqlite3.Error as e:
+            print(f"Error writing the metrics cache {self.path}: {e}")
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def _used_bytes(connection: sqlite3.Connection) -> int:
+        """Size of the pages in use of the database, without summing the size of every entry"""
+        page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free_pages) * connection.execute("PRAGMA page_size").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # A forked process inherits the thread local data of the thread that forked it
+        if getattr(self._local, 'connection', None) is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Wait for the other processes instead of failing while they write
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS metrics (key TEXT PRIMARY KEY, metrics BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS metrics_last_used ON metrics (last_used)")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
\ No newline at end of file
@@ -1,26 +1,40 @@
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Iterator, List, Optional, Tuple
+from collections import deque
+from itertools import islice
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from git import Repo
 import requests
 import subprocess
+import base64
+import binascii
+import tarfile
 import os
 from .logging_utils import OutputTarget, synchronized_print
-from models import VersionEntry, SourceType
+from .tarball_source import TarballSource
+from .http_session import HttpSession
+from .packument_cache import PackumentCache
+from .pipeline import with_output
+from models import VersionEntry, SourceType, Packument, PackumentVersion
 
 class NPMClient:
     """Cloning Git repos associated with a pkg and retrieving ordered tags"""
-    def __init__(self, registry_url: str = "https://registry.npmjs.org", pkg_name: str = ""):
+    DOWNLOAD_THREADS = 8    # Tarballs of a package downloaded at the same time: the latency of the requests, not the bandwidth, dominates
+    INTEGRITY_ALGORITHMS = ('sha512', 'sha384', 'sha256', 'sha1')     # Strongest first
+    def __init__(self, registry_url: str = "https://registry.npmjs.org", pkg_name: str = "", session: Optional[HttpSession] = None,
+                 packuments: Optional[PackumentCache] = None):
         self.pkg_name = pkg_name
         self.registry_url = registry_url
+        self.session = session or HttpSession.shared()     # Connections reused by all the packages
+        self.packuments = packuments or PackumentCache.shared()
     
-    def get_npm_package_data(self) -> Optional[Dict]:
-        """Fetch raw metadata for an NPM package by making an HTTP request to the registry"""
+    def get_npm_package_data(self) -> Optional[Packument]:
+        """Fetch the metadata (the fields used) of an NPM package from the registry, or from the packument cache shared by the runs and processes if still valid"""
         try:
-            response = requests.get(f'{self.registry_url}/{self.pkg_name}', timeout=5)
-            response.raise_for_status()
-            return response.json()
+            return self.packuments.fetch(f'{self.registry_url}/{self.pkg_name}', self.session)
         
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Failed to fetch '{self.pkg_name}': {e}")
             return None
     
@@ -41,7 +55,7 @@ class NPMClient:
         if not data:
             return None
         
-        git_url = data.get('repository', {}).get('url', '')
+        git_url = data.repository_url
         if not git_url:
             return None
 
@@ -133,73 +147,110 @@ class NPMClient:
     def download_package_versions_tarball(self, download_dir: Path = Path("tarballs")) -> list[VersionEntry]:
         """Download the tarball for 50 lastest versions of the package from NPM registry"""
         data = self.get_npm_package_data()
-        if not data or 'versions' not in data:
+        versions = self.get_versions_to_download(data)
+        if not versions:
+            return None
+        return list(self.iter_version_tarballs(data, versions, download_dir))
+
+    def get_versions_to_download(self, data: Optional[Packument]) -> Optional[List[str]]:
+        """50 lastest versions of the package in its NPM registry data, None if there are no versions"""
+        if not data:
             synchronized_print(f"No version data found for {self.pkg_name}")
             return None
         
-        if len(data['versions']) == 0:
+        if len(data.versions) == 0:
             synchronized_print(f"No versions found for {self.pkg_name}")
             return None
         
-        if len(data['versions']) > 50:
-            synchronized_print(f"Found {len(data['versions'])} versions for {self.pkg_name}, but i consider only the last 50")
-        versions = list(data['versions'].keys())[-50:] # Get the last 50 versions, if more exist. No error if less. Assuming they are in order
+        if len(data.versions) > 50:
+            synchronized_print(f"Found {len(data.versions)} versions for {self.pkg_name}, but i consider only the last 50")
+        return list(data.versions.keys())[-50:] # Get the last 50 versions, if more exist. No error if less. Assuming they are in order
 
+    def iter_version_tarballs(self, data: Packument, versions: List[str], download_dir: Path = Path("tarballs"), download_slot=None,
+                              window: Optional[int] = None) -> Iterator[VersionEntry]:
+        """Download the tarballs of the versions, up to DOWNLOAD_THREADS at the same time, yielding the entry of each version in the order of versions
+            as soon as its tarball is available.
+            At most window versions (DOWNLOAD_THREADS by default) are downloaded ahead of the consumer: the next one is submitted as each one is yielded,
+            the tarballs of a slow consumer do not pile up on disk and the others are not requested if it stops early.
+            download_slot (e.g. a semaphore shared by more packages, the limit of the downloads in flight) is held only during each download,
+            the session also limits the requests at the same time to the registry host
+        """
         pkg_dir = download_dir / self.pkg_name.replace('/', '_')
         pkg_dir.mkdir(parents=True, exist_ok=True)
+        extract_dir = pkg_dir / "extracted"
+        window = max(window or self.DOWNLOAD_THREADS, 1)
         synchronized_print(f"Downloading tarballs for {self.pkg_name} {len(versions)} versions...")
 
-        for version in versions:
-            version_data = data['versions'][version]
-            tarball_url = version_data.get('dist', {}).get('tarball', '')
-            if not tarball_url:
-                synchronized_print(f"No tarball URL for version {version} of {self.pkg_name}", target=OutputTarget.FILE_ONLY)
-                continue
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_THREADS, thread_name_prefix="download") as executor:
+            download = with_output(self._download_tarball)
+            remaining = iter(versions)
+            downloads = deque()     # (tarball path, future) of the versions submitted and not yielded yet, in order
+
+            def refill() -> None:
+                for version in islice(remaining, window - len(downloads)):
+                    tarball_path = pkg_dir / f"{version}.tgz"
+                    downloads.append((tarball_path, executor.submit(download, data, version, tarball_path, download_slot)))
 
-            tarball_path = pkg_dir / f"{version}.tgz"
-            if tarball_path.exists():
-                synchronized_print(f"Tarball already downloaded for {self.pkg_name} version {version}", target=OutputTarget.FILE_ONLY)
-                continue
-            
             try:
+                refill()
+                while downloads:
+                    tarball_path, future = downloads.popleft()
+                    future.result()
+                    # The next download starts while the consumer handles this version
+                    refill()
+                    if tarball_path.exists():
+                        entry = self.tarball_entry(tarball_path, extract_dir)
+                        if entry:
+                            yield entry
+            finally:
+                # The consumer stopped early (or failed): do not start the downloads not needed anymore
+                for _, future in downloads:
+                    future.cancel()
+
+        synchronized_print(f"Finished downloading tarballs for {self.pkg_name}")
+
+    def _download_tarball(self, data: Packument, version: str, tarball_path: Path, download_slot=None) -> None:
+        version_data = data.versions[version]
+        tarball_url = version_data.tarball
+        if not tarball_url:
+            synchronized_print(f"No tarball URL for version {version} of {self.pkg_name}", target=OutputTarget.FILE_ONLY)
+            return
+
+        if tarball_path.exists():
+            synchronized_print(f"Tarball already downloaded for {self.pkg_name} version {version}", target=OutputTarget.FILE_ONLY)
+            return
+        
+        try:
+            with download_slot or nullcontext():
                 #synchronized_print(f"Downloading tarball for {self.pkg_name} version {version}...")
-                response = requests.get(tarball_url, timeout=10)
-                response.raise_for_status()
-                
-                with open(tarball_path, 'wb') as f:
-                    f.write(response.content)
-                
-                synchronized_print(f"Downloaded tarball for {self.pkg_name} version {version}", target=OutputTarget.FILE_ONLY)
-
-            except Exception as e:
-                synchronized_print(f"Error downloading tarball for {self.pkg_name} version {version}: {e}", target=OutputTarget.FILE_ONLY)
-
-        synchronized_print(f"Finished downloading tarballs for {self.pkg_name}")        
-        extract_dir = download_dir / self.pkg_name.replace('/', '_') / "extracted" 
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        entries = []
-        for version in versions:
-            tarball_path = pkg_dir / f"{version}.tgz"
-            if tarball_path.exists():
-                entries.append(self.extract_tarball(tarball_path, extract_dir))
-        synchronized_print(f"Extracted tarballs for {self.pkg_name}", target=OutputTarget.FILE_ONLY)
-        return entries
-
-    def extract_tarball(self, tarball_path: Path, extract_dir: Path) -> VersionEntry:
-        """Extracts a tarball to a specified directory"""
+                # Written to a temporary file and renamed only once complete and verified: an existing tarball_path is trusted without hashing it again
+                self.session.download(tarball_url, tarball_path, self.tarball_digest(version_data))
+            
+            synchronized_print(f"Downloaded tarball for {self.pkg_name} version {version}", target=OutputTarget.FILE_ONLY)
+
+        except Exception as e:
+            synchronized_print(f"Error downloading tarball for {self.pkg_name} version {version}: {e}", target=OutputTarget.FILE_ONLY)
+
+    @classmethod
+    def tarball_digest(cls, version_data: PackumentVersion) -> Optional[Tuple[str, str]]:
+        """(algorithm, hex digest) of a tarball from the integrity (SRI, e.g. "sha512-<base64>") or else the shasum (SHA-1 hex) of its dist, None if neither"""
+        digests = {}
+        for token in version_data.integrity.split():
+            algorithm, _, value = token.partition('-')
+            try:
+                digests[algorithm] = base64.b64decode(value.split('?')[0], validate=True).hex()    # After '?' the options of SRI
+            except (binascii.Error, ValueError):
+                continue
+        if version_data.shasum:
+            digests.setdefault('sha1', version_data.shasum.lower())
+        return next(((algorithm, digests[algorithm]) for algorithm in cls.INTEGRITY_ALGORITHMS if algorithm in digests), None)
+
+    def tarball_entry(self, tarball_path: Path, extract_dir: Path) -> Optional[VersionEntry]:
+        """Version entry of a tarball, its files are read from the archive when analyzed (extracted in extract_dir only if needed on disk)"""
         if not tarball_path.exists():
             print(f"Tarball {tarball_path} does not exist")
             return None
-        
-        extract_path = extract_dir / tarball_path.stem
-        extract_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            import tarfile
-            with tarfile.open(tarball_path, 'r:gz') as tar:
-                tar.extractall(path=extract_path)
-            #synchronized_print(f"Extracted {tarball_path} to {extract_path}")
-            return VersionEntry(name=tarball_path.stem, source=SourceType.TARBALL, ref=extract_path)
-        except Exception as e:
-            print(f"Error extracting {tarball_path}: {e}")
-            return None
\ No newline at end of file
+        if not tarfile.is_tarfile(tarball_path):
+            print(f"Error reading {tarball_path}: not a valid tarball")
+            return None
+        return VersionEntry(name=tarball_path.stem, source=SourceType.TARBALL, ref=TarballSource(tarball_path, extract_dir / tarball_path.stem))
\ No newline at end of file
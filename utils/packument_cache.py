@@ -0,0 +1,143 @@
+from pathlib import Path
+from typing import Optional
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from .http_session import HttpSession
+from .packument_parser import parse_packument
+from models import Packument
+
+class PackumentCache:
+    """Persistent cache of the registry metadata (packument) of the packages, shared by runs, threads and processes: a SQLite database, as MetricsCache.
+        The packument is parsed while downloaded and only its Packument (the fields used) is kept, pickled and zlib compressed.
+        A packument fetched less than ttl seconds ago is used without asking the registry, an older one is revalidated with a conditional request
+        (If-None-Match / If-Modified-Since with the ETag / Last-Modified stored with it): the registry answers 304 without the document if it did not change.
+        A negative ttl disables the cache, every packument is downloaded
+    """
+    DEFAULT_PATH = Path('cache') / 'packuments.sqlite3'
+    DEFAULT_TTL = 300.0     # seconds
+    CHUNK_SIZE = 64 * 1024  # bytes parsed at a time
+
+    _shared: Optional["PackumentCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Path = DEFAULT_PATH, ttl: float = DEFAULT_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        # Packuments used without a request, revalidated (304) and downloaded, for the summary of the run
+        self.fresh = 0
+        self.revalidated = 0
+        self.downloaded = 0
+        self._local = threading.local()     # Connection of each thread, with the pid of the process that opened it
+        self._counters_lock = threading.Lock()
+
+    def __getstate__(self):
+        # A connection can be used only by the thread that opened it
+        state = self.__dict__.copy()
+        del state['_local'], state['_counters_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._counters_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "PackumentCache":
+        """Cache of the process, created with the default settings unless configured before"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, path: Path = DEFAULT_PATH, ttl: float = DEFAULT_TTL) -> "PackumentCache":
+        """Replace the cache of the process, before the first packument"""
+        with cls._shared_lock:
+            cls._shared = cls(path, ttl)
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl >= 0
+
+    def fetch(self, url: str, session: HttpSession) -> Packument:
+        """Packument at url, from the cache if fresh or not modified, otherwise downloaded (and stored with its validators).
+            Raises the errors of the request, ValueError if the document is not valid JSON
+        """
+        row = self._get(url) if self.enabled else None
+        if row is not None and time.time() - row[3] < self.ttl:
+            self._count(fresh=1)
+            return row[0]
+
+        headers = {}
+        if row is not None:
+            if row[1]:
+                headers['If-None-Match'] = row[1]
+            if row[2]:
+                headers['If-Modified-Since'] = row[2]
+        response, packument = session.stream(url, lambda response: parse_packument(response.iter_content(self.CHUNK_SIZE)), headers)
+        if row is not None and response.status_code == 304:
+            self._touch(url)
+            self._count(revalidated=1)
+            return row[0]
+        response.raise_for_status()
+        if self.enabled:
+            self._put(url, packument, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        self._count(downloaded=1)
+        return packument
+
+    def summary(self) -> str:
+        return f"{self.fresh} fresh, {self.revalidated} not modified, {self.downloaded} downloaded"
+
+    def _get(self, url: str):
+        """(Packument, etag, last modified, fetched) of the url, None if missing or not readable (it is downloaded again)"""
+        try:
+            row = self._connect().execute("SELECT packument, etag, last_modified, fetched FROM packument_records WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            packument = pickle.loads(zlib.decompress(row[0]))
+            return (packument, *row[1:]) if isinstance(packument, Packument) else None
+        except (sqlite3.Error, zlib.error, pickle.UnpicklingError, AttributeError, EOFError) as e:
+            print(f"Error reading the packument cache {self.path}: {e}")
+            return None
+
+    def _put(self, url: str, packument: Packument, etag: Optional[str], last_modified: Optional[str]) -> None:
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO packument_records (url, packument, etag, last_modified, fetched) VALUES (?, ?, ?, ?, ?)",
+                                   (url, zlib.compress(pickle.dumps(packument, protocol=pickle.HIGHEST_PROTOCOL)), etag, last_modified, time.time()))
+        except sqlite3.Error as e:
+            print(f"Error writing the packument cache {self.path}: {e}")
+
+    def _touch(self, url: str) -> None:
+        """The packument is still valid: fresh again for ttl seconds"""
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("UPDATE packument_records SET fetched = ? WHERE url = ?", (time.time(), url))
+        except sqlite3.Error as e:
+            print(f"Error writing the packument cache {self.path}: {e}")
+
+    def _count(self, fresh: int = 0, revalidated: int = 0, downloaded: int = 0) -> None:
+        with self._counters_lock:
+            self.fresh += fresh
+            self.revalidated += revalidated
+            self.downloaded += downloaded
+
+    def _connect(self) -> sqlite3.Connection:
+        # A forked process inherits the thread local data of the thread that forked it
+        if getattr(self._local, 'connection', None) is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Wait for the other processes instead of failing while they write
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS packument_records (url TEXT PRIMARY KEY, packument BLOB NOT NULL, etag TEXT, last_modified TEXT, fetched REAL NOT NULL)")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
\ No newline at end of file
@@ -0,0 +1,196 @@
+from typing import Iterable, Iterator
+import codecs
+import json
+import re
+from models import Packument, PackumentVersion
+
+_WHITESPACE = re.compile(r'\s*')
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)  # Up to the closing quote (or the end of the text read so far)
+# Inside a container, up to the next bracket: the whole strings (they may contain brackets) and everything else in a single match
+_FLAT = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+_SCALAR = re.compile(r'[^,:}\]\s]*')
+_DECODER = json.JSONDecoder()
+_DELIMITERS = ' \t\r\n,:}]'    # After a complete value (a number followed by something else may go on in the next chunk, e.g. "1." of "1.5")
+
+class _JSONStream:
+    """JSON text read in chunks as the parser needs it, the text already parsed is dropped.
+        Values are either decoded (json, only the small ones that are kept) or skipped without building them
+    """
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def more(self) -> bool:
+        """Read the next chunk, False at the end of the document"""
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.text += text
+                return True
+        self._decoder.decode(b'', final=True)   # Raises on a truncated UTF-8 sequence
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next character after the whitespace, '' at the end of the document"""
+        if self.pos < len(self.text) and not self.text[self.pos].isspace():
+            return self.text[self.pos]     # The registry sends compact JSON
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.more():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at {self.pos} of the JSON document, found '{found}'")
+        self.pos += 1
+
+    def decoded(self):
+        """The next value if it is all in the text read so far (decoded at once, in C), None otherwise"""
+        self.peek()
+        try:
+            value, end = _DECODER.raw_decode(self.text, self.pos)
+        except json.JSONDecodeError:
+            return None
+        if not self._complete(end):
+            return None
+        self.pos = end
+        return value
+
+    def value(self):
+        """Decode the next value, reading until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+                if self._complete(end):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.more()
+
+    def _complete(self, end: int) -> bool:
+        """Whether the value decoded up to end is not the start of a longer one"""
+        return self.text[end] in _DELIMITERS if end < len(self.text) else self.eof
+
+    def members(self) -> Iterator[str]:
+        """Keys of the next object, the caller reads or skips the value of each key before the next one"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' at {self.pos - 1} of the JSON document, found '{separator}'")
+
+    def skip(self) -> None:
+        """Skip the next value. Decoding it (in C) and dropping it is the fastest if it is all in the text read so far, at most a chunk:
+            otherwise only its strings and brackets are looked at, across the chunks, nothing is decoded
+        """
+        if self.decoded() is not None:
+            return
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in '{[':
+            self._skip_scalar()
+            return
+        depth = 0
+        while True:
+            self.pos = _FLAT.match(self.text, self.pos).end()
+            if self.pos == len(self.text):
+                self._need_more()
+                continue
+            char = self.text[self.pos]
+            if char == '"':
+                # A string that goes on in the next chunk
+                self._skip_string()
+                continue
+            self.pos += 1
+            depth += 1 if char in '{[' else -1
+            if depth == 0:
+                return
+
+    def _skip_string(self) -> None:
+        self.pos += 1
+        while True:
+            self.pos = _STRING_BODY.match(self.text, self.pos).end()
+            if self.pos < len(self.text) and self.text[self.pos] == '"':
+                self.pos += 1
+                return
+            # The string (or the escape at the end) goes on in the next chunk
+            self._need_more()
+
+    def _skip_scalar(self) -> None:
+        while True:
+            end = _SCALAR.match(self.text, self.pos).end()
+            if end < len(self.text) or self.eof:
+                self.pos = end
+                return
+            self.more()
+
+    def _need_more(self) -> None:
+        if not self.more():
+            raise ValueError("Truncated JSON document")
+
+def parse_packument(chunks: Iterable[bytes]) -> Packument:
+    """Registry metadata of a package from the chunks of its JSON document, keeping only the fields of Packument:
+        the rest (README, dependencies etc. of every version) is skipped as it is read, never built in memory
+    """
+    stream = _JSONStream(chunks)
+    packument = Packument()
+    released = {}
+    for key in stream.members():
+        if key == 'versions' and stream.peek() == '{':
+            for version in stream.members():
+                packument.versions[version] = _parse_version(stream)
+        elif key == 'time' and stream.peek() == '{':
+            released = stream.value()
+        elif key == 'repository' and stream.peek() == '{':
+            packument.repository_url = str(stream.value().get('url') or '')
+        elif key == 'name':
+            packument.name = str(stream.value() or '')
+        else:
+            stream.skip()
+    if stream.peek():
+        raise ValueError(f"Extra data at {stream.pos} of the JSON document")
+    for version, record in packument.versions.items():
+        record.released = str(released.get(version) or '')
+    return packument
+
+def _parse_version(stream: _JSONStream) -> PackumentVersion:
+    record = PackumentVersion()
+    if stream.peek() != '{':
+        stream.skip()
+        return record
+    for key in stream.members():
+        if key == 'dist' and stream.peek() == '{':
+            dist = stream.value()
+            record.tarball = str(dist.get('tarball') or '')
+            record.integrity = str(dist.get('integrity') or '')
+            record.shasum = str(dist.get('shasum') or '')
+        elif key == 'maintainers' and stream.peek() == '[':
+            record.maintainers = tuple(str(maintainer.get('name', '')) if isinstance(maintainer, dict) else str(maintainer) for maintainer in stream.value())
+        elif key == 'gitHead':
+            record.git_head = str(stream.value() or '')
+        else:
+            stream.skip()
+    return record
\ No newline at end of file
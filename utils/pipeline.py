@@ -0,0 +1,122 @@
+from contextlib import nullcontext
+from typing import Callable, Iterable, Iterator, Optional
+import queue
+import sys
+import threading
+from .logging_utils import ThreadOutput
+
+_END = object()     # Marks the end of the items of a stage
+
+def _thread_output():
+    """Output of the current thread, the threads of a stage write to the same one (e.g. the log buffer of the package)"""
+    return sys.stdout.stream if isinstance(sys.stdout, ThreadOutput) else None
+
+def _redirected(output):
+    return sys.stdout.redirect(output) if output is not None and isinstance(sys.stdout, ThreadOutput) else nullcontext()
+
+def with_output(func: Callable) -> Callable:
+    """func running with the output of the current thread, for the threads started by it (e.g. the threads of an executor)"""
+    output = _thread_output()
+
+    def run(*args, **kwargs):
+        with _redirected(output):
+            return func(*args, **kwargs)
+    return run
+
+class _Failure:
+    """Exception raised by the thread of a stage, raised again by the thread that reads its items"""
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def prefetch(items: Iterable, buffer_size: int) -> Iterator:
+    """Produce the items in a background thread, started now, at most buffer_size ahead of the consumer (backpressure: the producer waits when the buffer is full).
+        An exception of the producer is raised by the consumer after the items produced before it
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=max(1, buffer_size))
+    stop = threading.Event()
+    output = _thread_output()
+
+    def produce():
+        with _redirected(output):
+            try:
+                for item in items:
+                    if not _put(buffer, item, stop):
+                        return
+                _put(buffer, _END, stop)
+            except BaseException as e:
+                _put(buffer, _Failure(e), stop)
+
+    thread = threading.Thread(target=produce, name="prefetch", daemon=True)
+    thread.start()
+    return _consume(buffer, stop, thread)
+
+def _consume(buffer: "queue.Queue", stop: threading.Event, thread: threading.Thread) -> Iterator:
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        # The consumer stopped early (or failed): stop the producer waiting on the full buffer
+        stop.set()
+        thread.join()
+
+def _put(buffer: "queue.Queue", item, stop: threading.Event) -> bool:
+    """Put the item in the buffer unless the consumer has stopped, False if it has"""
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+class BackgroundConsumer:
+    """Consume the submitted items in a background thread, in order, with at most buffer_size items waiting (submit waits when they are more).
+        close() waits for the items submitted and raises the first exception of the consumer
+    """
+    def __init__(self, consume: Callable, buffer_size: int, name: str = "consumer"):
+        self._consume = consume
+        self._buffer: "queue.Queue" = queue.Queue(maxsize=max(1, buffer_size))
+        self._error: Optional[BaseException] = None
+        self._output = _thread_output()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> None:
+        if self._error is not None:
+            raise self._error
+        self._buffer.put(item)
+
+    def close(self) -> None:
+        self._buffer.put(_END)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        with _redirected(self._output):
+            while True:
+                item = self._buffer.get()
+                if item is _END:
+                    return
+                if self._error is not None:
+                    continue    # Drain the items still submitted after the failure
+                try:
+                    self._consume(item)
+                except BaseException as e:
+                    self._error = e
+
+    def __enter__(self) -> "BackgroundConsumer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Already failing: stop the consumer without hiding the exception
+            self._buffer.put(_END)
+            self._thread.join()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from typing import Dict, Iterator, List, Match
+import re
+
+_WORD = re.compile(r'\w*')
+
+def _fold(text: str) -> str:
+    """Lowercase of each character as re compares a backreference with re.IGNORECASE: the simple lowercase of the character alone
+        (str.lower of the whole text is context dependent, e.g. a final Σ, and 'İ'.lower() == 'i̇' has two characters, the first one is its simple lowercase)
+    """
+    return text.lower() if text.isascii() else ''.join(char.lower()[0] for char in text)
+
+class LineSpanPattern:
+    """The pattern head.*?partner with the matches of re in linear time, used as a compiled pattern (finditer, pattern, flags).
+        re tries the lazy span from every head up to the end of its line when the partner is missing, e.g. every try{ of a minified line
+        without the obfuscated catch rescans the rest of the line (quadratic). Here the partners are found first, each one is matched
+        from the first head of its line after the last match: the partner occurrences must not overlap (e.g. \\}catch\\(...\\))
+    """
+    def __init__(self, head: str, partner: str, flags: int = 0):
+        self.regex = re.compile(f'{head}.*?{partner}', flags)
+        self.pattern = self.regex.pattern
+        self.flags = self.regex.flags
+        self._heads = re.compile(head, flags)
+        self._partners = re.compile(partner, flags)
+
+    def finditer(self, string: str, pos: int = 0) -> Iterator[Match]:
+        for partner in self._partners.finditer(string, pos):
+            end = partner.start()
+            if end < pos:
+                continue    # Inside the last match
+            # A head before the line of the partner (or the last match) has no partner, it was not matched with the ones of its line
+            head = self._heads.search(string, max(pos, string.rfind('\n', pos, end) + 1), end)
+            if head is None:
+                pos = end
+                continue
+            match = self.regex.match(string, head.start())
+            if match:
+                yield match
+                pos = match.end()
+
+class BackrefSpanPattern:
+    """The pattern head[\\s\\S]*?partner\\1[^closing]*closing with the matches of re in linear time, used as a compiled pattern (finditer, pattern, flags).
+        re tries the lazy span from every head up to the end of the content when no partner has the name captured by the head (group 1),
+        e.g. every await new Promise(r => ...) that is not a delay rescans the rest of the file (quadratic).
+        Here the last partner followed by each name is found with one pass on the partners, and re matches only from the heads with a partner after them.
+        The head captures a word (\\w+) that does not depend on what follows, the partner ends where the name is compared and the closing is a character that is not a word character
+    """
+    def __init__(self, head: str, partner: str, closing: str, flags: int = 0):
+        self.closing = closing
+        self.regex = re.compile(f'{head}[\\s\\S]*?{partner}\\1[^{re.escape(closing)}]*{re.escape(closing)}', flags)
+        self.pattern = self.regex.pattern
+        self.flags = self.regex.flags
+        self._heads = re.compile(head, flags)
+        self._partners = re.compile(partner, flags)
+        self._fold = _fold if flags & re.IGNORECASE else str
+
+    def finditer(self, string: str, pos: int = 0) -> Iterator[Match]:
+        heads: List[Match] = []
+        head = self._heads.search(string, pos)
+        while head is not None:
+            heads.append(head)
+            head = self._heads.search(string, head.start() + 1)
+        if not heads:
+            return
+
+        # Start of the last partner followed by each name of the heads (its word starts with the name) and by a closing
+        names: Dict[str, dict] = {}     # Trie of the names, None -> the whole name
+        for head in heads:
+            node = names
+            name = self._fold(head.group(1))
+            for char in name:
+                node = node.setdefault(char, {})
+            node[None] = name
+        last_closing = string.rfind(self.closing, pos)
+        last_partner: Dict[str, int] = {}
+        for partner in self._partners.finditer(string, heads[0].end()):
+            if partner.end() > last_closing:
+                break
+            # The word after the partner (the partners inside its match, e.g. setTimeout(setTimeout(r, are found after it)
+            node = names
+            for char in self._fold(_WORD.match(string, partner.end()).group()):
+                node = node.get(char)
+                if node is None:
+                    break
+                if None in node:
+                    last_partner[node[None]] = partner.start()
+
+        for head in heads:
+            if head.start() < pos or last_partner.get(self._fold(head.group(1)), -1) < head.end():
+                continue
+            match = self.regex.match(string, head.start())
+            if match:
+                yield match
+                pos = match.end()
\ No newline at end of file
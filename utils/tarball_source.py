@@ -0,0 +1,61 @@
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional
+import tarfile
+
+class TarballSource:
+    """Files of a version in an npm tarball (.tgz), read in memory from the members of the archive without extracting it.
+        A file is written to disk only when it is needed there (e.g. by the deobfuscator)
+    """
+    ROOT = "package"    # npm tarballs have all the files in package/
+
+    def __init__(self, tarball_path: Path, extract_dir: Path):
+        self.tarball_path = Path(tarball_path)    # e.g. tarballs/pkg/1.0.0.tgz
+        self.extract_dir = Path(extract_dir)      # e.g. tarballs/pkg/extracted/1.0.0, where the files are extracted on demand
+
+    @property
+    def package_dir(self) -> Path:
+        """Directory of the files once extracted, e.g. tarballs/pkg/extracted/1.0.0/package"""
+        return self.extract_dir / self.ROOT
+
+    def read(self) -> Dict[str, bytes]:
+        """Content of each file, by path relative to the package (as FileHandler.get_all_files on the extracted tarball), in the order of the archive.
+            A single pass on the archive, gzip cannot be read at random
+        """
+        contents: Dict[str, bytes] = {}
+        with tarfile.open(self.tarball_path, 'r:gz') as tar:
+            for member in tar:
+                name = self._relative_name(member)
+                if name is None:
+                    continue
+                f = tar.extractfile(member)
+                if f is not None:
+                    # A file repeated in the archive is overwritten by the last one, as by extractall
+                    contents[name] = f.read()
+        return contents
+
+    def extract(self, file_name: str) -> Path:
+        """Extract a single file (path relative to the package) into package_dir, returns its path"""
+        with tarfile.open(self.tarball_path, 'r:gz') as tar:
+            member = None
+            for candidate in tar:
+                if self._relative_name(candidate) == file_name:
+                    member = candidate
+            if member is None:
+                raise FileNotFoundError(f"{file_name} not found in {self.tarball_path}")
+            target = self.package_dir / file_name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with tar.extractfile(member) as src, open(target, 'wb') as dst:
+                dst.write(src.read())
+        return target
+
+    def _relative_name(self, member: tarfile.TarInfo) -> Optional[str]:
+        """Path relative to the package of a regular file of the archive, None for directories, symbolic links and files outside package/"""
+        if not (member.isreg() or member.islnk()):
+            return None
+        parts = PurePosixPath(member.name).parts
+        if len(parts) < 2 or parts[0] != self.ROOT:
+            return None
+        return str(PurePosixPath(*parts[1:]))
+
+    def __repr__(self) -> str:
+        return f"TarballSource({self.tarball_path})"
\ No newline at end of file
@@ -1,7 +1,19 @@
-from typing import List, Pattern, Tuple
+from array import array
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+import signal
+import sre_constants
+import sre_parse
+import threading
+import time
+from models import EvidenceMode, EvidencePolicy
+from models.domains import Evidence, ScanMetrics
+
+class PatternTimeout(Exception):
+    """Raised inside a pattern scan when its time budget is over"""
 
 class UtilsForAnalyzer:
-    
+
     @staticmethod
     def detect_patterns(content: str, patterns: List[Pattern]) -> Tuple[int, List[str]]:
         matches = []
@@ -9,7 +21,325 @@ class UtilsForAnalyzer:
             for match in pattern.finditer(content):
                 matches.append(match.group(0))
         return len(matches), matches
-    
+
     @staticmethod
     def detect_count_patterns(content: str, patterns: List[Pattern]) -> int:
-        return sum(1 for pattern in patterns for _ in pattern.finditer(content))
\ No newline at end of file
+        return sum(1 for pattern in patterns for _ in pattern.finditer(content))
+
+    # Non ASCII characters that re.IGNORECASE matches with an ASCII letter, but str.lower() does not turn into it
+    # e.g. re.match('s', 'ſ', re.IGNORECASE) matches, 'ſ'.lower() == 'ſ'. U+0307 is the dot left by 'İ'.lower() == 'i̇'
+    CASE_INSENSITIVE_FIXES = {0x131: 'i', 0x17f: 's', 0x307: None}
+
+    @staticmethod
+    def find_anchors(content: str, anchors: Iterable[str]) -> Set[str]:
+        """Prefilter: return the (lowercase) literal anchors that appear in the content, case insensitive"""
+        lowered = content.lower()
+        if not lowered.isascii():
+            lowered = lowered.translate(UtilsForAnalyzer.CASE_INSENSITIVE_FIXES)
+        # Substring search of CPython runs in C on the whole buffer, faster than an alternation of the anchors with re.IGNORECASE
+        return {anchor for anchor in anchors if anchor in lowered}
+
+    @staticmethod
+    def deadlines_enforced() -> bool:
+        """Whether deadline can stop a scan in the middle of a regex match in the current thread: SIGALRM is handled only by the main thread (e.g. of a pool worker)"""
+        return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+    @staticmethod
+    @contextmanager
+    def deadline(seconds: Optional[float]):
+        """Raise PatternTimeout in the block after the given seconds. Yields a check that the block calls between its steps (e.g. after each match).
+            On the main thread it uses SIGALRM, also in the middle of a regex match (re checks for signals while backtracking) and the check does nothing.
+            On the other threads (e.g. of the packages) SIGALRM cannot be used: the check raises once the time is over,
+            a single search of the regex is not stopped (the pool workers, on their main thread, stop it)
+        """
+        if seconds is None:
+            yield _no_check
+            return
+        if not UtilsForAnalyzer.deadlines_enforced():
+            expires = time.monotonic() + seconds
+            def check() -> None:
+                if time.monotonic() >= expires:
+                    raise PatternTimeout()
+            check()
+            yield check
+            return
+
+        active = True
+        def on_alarm(signum, frame):
+            if active:
+                raise PatternTimeout()
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, max(seconds, 0.001))
+        try:
+            yield _no_check
+        finally:
+            active = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+def _no_check() -> None:
+    pass
+
+class PatternEngine:
+    """Scans a content for a tagged set of pattern lists with a single call, with the same counts of detect_patterns called once per list
+        e.g. PatternEngine({'eval': [re.compile(r'eval\\s*\\(')], ...}).scan(content) -> {'eval': (3, Evidence(entries=array('q', [0, 10, 15, 2, 0, 40, 46, 1]))), ...}
+        Instead of every match, each tag keeps as evidence the distinct matches chosen by the evidence policy, as offsets of their first occurrence
+        with their occurrences: the text is extracted from the content only when needed (Evidence.texts, Evidence.snippets).
+        The unbounded tags keep all their distinct matches, in order of appearance (select_evidence applies the policy to them).
+        Patterns with literal anchors are run only if at least one of their anchors is in the content.
+        Each pattern has a time budget, and all the patterns of a scan share a budget for the file: a pattern over budget is stopped
+        and keeps the matches found until then (the scan is marked as truncated).
+        Outside of the main thread the budgets are checked after each match and before each chunk of a streamed scan, see UtilsForAnalyzer.deadline
+    """
+    PATTERN_TIME_BUDGET = 5.0     # seconds
+    FILE_TIME_BUDGET = 20.0       # seconds
+    # Overlap between the chunks of a streamed scan, on top of the longest bounded pattern: margin for the unbounded runs (\s*, [^)]*, ...)
+    # A match that reaches the end of a chunk is always found whole in the next one, but a pattern that needs more than the overlap
+    # to fail or to stop (e.g. eval( with an argument longer than the margin, without a ) in the chunk) can miss a match
+    UNBOUNDED_RUN_MARGIN = 64 * 1024     # characters
+    LOOKBEHIND_MARGIN = 64               # characters kept before the position where a pattern resumes, for its lookbehinds
+
+    def __init__(self, groups: Dict[str, List[Pattern]], anchors: Optional[Dict[Pattern, Tuple[str, ...]]] = None,
+                 pattern_time_budget: Optional[float] = PATTERN_TIME_BUDGET, file_time_budget: Optional[float] = FILE_TIME_BUDGET,
+                 evidence: Optional[EvidencePolicy] = None, unbounded_tags: Iterable[str] = ()):
+        self.groups = groups
+        self.evidence = evidence or EvidencePolicy()
+        self.unbounded_tags = set(unbounded_tags)
+        self.pattern_time_budget = pattern_time_budget
+        self.file_time_budget = file_time_budget
+        # Each distinct pattern (same source and flags) is scanned once, even if it belongs to more tags
+        self.patterns: Dict[Tuple[str, int], Pattern] = {}
+        # Readable name of each pattern, e.g. timing_delays[0]
+        self.labels: Dict[Tuple[str, int], str] = {}
+        for tag, patterns in groups.items():
+            for i, pattern in enumerate(patterns):
+                self.patterns.setdefault(self._key(pattern), pattern)
+                self.labels.setdefault(self._key(pattern), f"{tag}[{i}]")
+        # How many times each pattern was stopped by a budget, for all the scans of this engine
+        self.budget_counters: Dict[str, int] = {}
+        # Patterns of the unbounded tags, they collect every distinct match also with FIRST
+        self.unbounded_keys = {self._key(pattern) for tag in self.unbounded_tags for pattern in groups[tag]}
+        # Patterns without anchors are always run
+        self.anchors: Dict[Tuple[str, int], Tuple[str, ...]] = {
+            self._key(pattern): tuple(anchor.lower() for anchor in pattern_anchors)
+            for pattern, pattern_anchors in (anchors or {}).items()
+        }
+        # Characters of content that a match needs to be decided, beyond its start (for the streamed scan)
+        self.stream_overlap = max((self._bounded_width(sre_parse.parse(pattern.pattern, pattern.flags)) for pattern in self.patterns.values()), default=0) + self.UNBOUNDED_RUN_MARGIN
+
+    def scan(self, content: str, tags: Optional[Iterable[str]] = None, stats: Optional[ScanMetrics] = None) -> Dict[str, Tuple[int, Evidence]]:
+        """Return for each tag (all tags if not specified) the count and the evidence of the matches.
+            If given, stats counts the scanned, skipped and truncated patterns
+        """
+        tags = list(self.groups) if tags is None else list(tags)
+        return self._route(tags, *self.scan_patterns(content, self.pattern_keys(tags), stats))
+
+    def pattern_keys(self, tags: Iterable[str]) -> List[Tuple[str, int]]:
+        """Distinct patterns required by the tags, in order"""
+        return list(dict.fromkeys(self._key(pattern) for tag in tags for pattern in self.groups[tag]))
+
+    def scan_patterns(self, content: str, keys: List[Tuple[str, int]], stats: Optional[ScanMetrics] = None
+                      ) -> Tuple[Dict[Tuple[str, int], int], Dict[Tuple[str, int], Dict[str, List[int]]]]:
+        """Part of scan: count and matches (distinct match -> [start, end, occurrences]) of each of the given patterns, not yet routed to the tags.
+            The patterns of a file can be scanned in more parts (e.g. by more processes), merge gives the same result of scan
+        """
+        # Prefilter, find all the anchors of the required patterns with one search
+        required_anchors = {anchor for key in keys for anchor in self.anchors.get(key, ())}
+        present = UtilsForAnalyzer.find_anchors(content, required_anchors) if content and required_anchors else set()
+
+        # One pass for each distinct pattern required by the tags, if it can match
+        counts: Dict[Tuple[str, int], int] = {}
+        # For each pattern, distinct match -> [start, end, occurrences], the text is only a key and is not returned
+        found: Dict[Tuple[str, int], Dict[str, List[int]]] = {}
+        # With FIRST, a pattern stops collecting new distinct matches at the limit (it still counts the ones it has), so memory does not grow with the matches
+        first_limit = self.evidence.limit if self.evidence.mode == EvidenceMode.FIRST else None
+        skipped = 0
+        over_budget = []
+        file_deadline = time.monotonic() + self.file_time_budget if self.file_time_budget is not None else None
+        for key in keys:
+            anchors = self.anchors.get(key)
+            counts[key] = 0
+            found[key] = evidence = {}
+            if not content or (anchors is not None and present.isdisjoint(anchors)):
+                skipped += 1
+                continue
+            distinct_limit = None if key in self.unbounded_keys else first_limit
+            try:
+                with UtilsForAnalyzer.deadline(self._time_left(file_deadline)) as check:
+                    for match in self.patterns[key].finditer(content):
+                        check()
+                        counts[key] += 1
+                        text = match.group(0)
+                        if text in evidence:
+                            evidence[text][2] += 1
+                        elif distinct_limit is None or len(evidence) < distinct_limit:
+                            evidence[text] = [*match.span(), 1]
+            except PatternTimeout:
+                over_budget.append(self.labels[key])
+                self.budget_counters[self.labels[key]] = self.budget_counters.get(self.labels[key], 0) + 1
+
+        if stats is not None:
+            stats.patterns_scanned += len(keys) - skipped
+            stats.patterns_skipped += skipped
+            if over_budget:
+                stats.scan_truncated = True
+                stats.budget_exceeded_patterns.extend(over_budget)
+
+        return counts, found
+
+    def merge(self, tags: Iterable[str], parts: Iterable[Tuple[Dict[Tuple[str, int], int], Dict[Tuple[str, int], Dict[str, List[int]]]]]) -> Dict[str, Tuple[int, Evidence]]:
+        """Result of scan from the results of scan_patterns on parts of the patterns of the tags"""
+        counts: Dict[Tuple[str, int], int] = {}
+        found: Dict[Tuple[str, int], Dict[str, List[int]]] = {}
+        for part_counts, part_found in parts:
+            counts.update(part_counts)
+            found.update(part_found)
+        return self._route(list(tags), counts, found)
+
+    def scan_chunks(self, chunks: Iterable[str], tags: Optional[Iterable[str]] = None, stats: Optional[ScanMetrics] = None,
+                    match_text: Optional[Dict[Tuple[int, int], str]] = None) -> Dict[str, Tuple[int, Evidence]]:
+        """Same as scan on the concatenation of the chunks, without the whole content in memory: each chunk is scanned with the stream_overlap
+            characters before it. Each pattern resumes where it stopped in the previous chunk, a match is taken only if it starts at least
+            stream_overlap characters before the end of the content read so far and does not reach it (it could go on in the next chunk),
+            otherwise it is found again with the next chunk. The offsets of the evidence are in the whole content.
+            The budget of a pattern is for all the chunks of the file. If given, match_text is filled with the text of the evidence, by offsets
+        """
+        tags = list(self.groups) if tags is None else list(tags)
+        keys = self.pattern_keys(tags)
+        required_anchors = {anchor for key in keys for anchor in self.anchors.get(key, ())}
+
+        counts: Dict[Tuple[str, int], int] = {key: 0 for key in keys}
+        found: Dict[Tuple[str, int], Dict[str, List[int]]] = {key: {} for key in keys}
+        first_limit = self.evidence.limit if self.evidence.mode == EvidenceMode.FIRST else None
+        resume = {key: 0 for key in keys}     # Offset in the content where each pattern goes on with the next chunk
+        spent = {key: 0.0 for key in keys}    # Seconds used from the budget of each pattern
+        scanned = set()
+        over_budget = []
+        file_deadline = time.monotonic() + self.file_time_budget if self.file_time_budget is not None else None
+
+        buffer, buffer_start = '', 0      # Content kept in memory and its offset in the whole content
+        pending = iter(chunks)
+        chunk = next(pending, None)
+        while chunk is not None:
+            next_chunk = next(pending, None)
+            last = next_chunk is None
+            buffer += chunk
+            buffer_end = buffer_start + len(buffer)
+            # Matches starting from here are left to the next chunk, they could need more content to be decided
+            limit = buffer_end if last else buffer_end - self.stream_overlap
+            present = UtilsForAnalyzer.find_anchors(buffer, required_anchors) if required_anchors else set()
+            for key in keys:
+                if self.labels[key] in over_budget or resume[key] >= limit:
+                    continue
+                anchors = self.anchors.get(key)
+                if anchors is not None and present.isdisjoint(anchors):
+                    resume[key] = limit
+                    continue
+                scanned.add(key)
+                evidence = found[key]
+                distinct_limit = None if key in self.unbounded_keys else first_limit
+                started = time.monotonic()
+                try:
+                    with UtilsForAnalyzer.deadline(self._time_left(file_deadline, spent[key])) as check:
+                        for match in self.patterns[key].finditer(buffer, resume[key] - buffer_start):
+                            check()
+                            start, end = match.start() + buffer_start, match.end() + buffer_start
+                            if not last and (start >= limit or end == buffer_end):
+                                resume[key] = start if start < limit else max(resume[key], limit)
+                                break
+                            counts[key] += 1
+                            resume[key] = end
+                            text = match.group(0)
+                            if text in evidence:
+                                evidence[text][2] += 1
+                            elif distinct_limit is None or len(evidence) < distinct_limit:
+                                evidence[text] = [start, end, 1]
+                        else:
+                            resume[key] = max(resume[key], limit)
+                except PatternTimeout:
+                    over_budget.append(self.labels[key])
+                    self.budget_counters[self.labels[key]] = self.budget_counters.get(self.labels[key], 0) + 1
+                spent[key] += time.monotonic() - started
+
+            # Keep only the content still needed by a pattern
+            running = [resume[key] for key in keys if self.labels[key] not in over_budget]
+            keep_from = max(min(running + [limit]) - self.LOOKBEHIND_MARGIN, buffer_start)
+            buffer, buffer_start = buffer[keep_from - buffer_start:], keep_from
+            chunk = next_chunk
+
+        if stats is not None:
+            stats.patterns_scanned += len(scanned)
+            stats.patterns_skipped += len(keys) - len(scanned)
+            if over_budget:
+                stats.scan_truncated = True
+                stats.budget_exceeded_patterns.extend(over_budget)
+
+        results = self._route(tags, counts, found)
+        if match_text is not None:
+            texts = {(start, end): text for evidence in found.values() for text, (start, end, _) in evidence.items()}
+            for _, selected in results.values():
+                for _, start, end, _ in selected:
+                    match_text[(start, end)] = texts[(start, end)]
+        return results
+
+    def _route(self, tags: List[str], counts: Dict[Tuple[str, int], int], found: Dict[Tuple[str, int], Dict[str, List[int]]]) -> Dict[str, Tuple[int, Evidence]]:
+        """Route the matches to their tag, keeping the order of the patterns in the group (as detect_patterns)"""
+        results = {}
+        for tag in tags:
+            # distinct match -> [pattern id, start, end, occurrences], the offsets of the first pattern that found it
+            merged: Dict[str, List[int]] = {}
+            for pattern_id, pattern in enumerate(self.groups[tag]):
+                for text, (start, end, occurrences) in found[self._key(pattern)].items():
+                    if text in merged:
+                        merged[text][3] += occurrences
+                    else:
+                        merged[text] = [pattern_id, start, end, occurrences]
+            entries = list(merged.values())
+            evidence = Evidence(array('q', [value for entry in entries for value in entry])) if tag in self.unbounded_tags else self._select_evidence(entries)
+            results[tag] = (sum(counts[self._key(pattern)] for pattern in self.groups[tag]), evidence)
+        return results
+
+    def select_evidence(self, evidence: Evidence) -> Evidence:
+        """Entries of the evidence of an unbounded tag kept by the evidence policy"""
+        return self._select_evidence([list(entry) for entry in evidence])
+
+    def _select_evidence(self, entries: List[List[int]]) -> Evidence:
+        """Distinct matches kept by the evidence policy, in order of appearance (FIRST) or by occurrences (TOP, ties in order of appearance)"""
+        if self.evidence.mode == EvidenceMode.TOP:
+            entries.sort(key=lambda entry: -entry[3])
+        if self.evidence.limit is not None:
+            entries = entries[:self.evidence.limit]
+        return Evidence(array('q', [value for entry in entries for value in entry]))
+
+    def _time_left(self, file_deadline: Optional[float], spent: float = 0.0) -> Optional[float]:
+        """Budget of the next pattern: its own budget (minus the seconds already spent on the file), but not beyond the one left for the file"""
+        pattern_left = self.pattern_time_budget - spent if self.pattern_time_budget is not None else None
+        if file_deadline is None:
+            return pattern_left
+        file_left = file_deadline - time.monotonic()
+        return file_left if pattern_left is None else min(pattern_left, file_left)
+
+    @staticmethod
+    def _bounded_width(subpattern) -> int:
+        """Longest match of a parsed pattern, with the unbounded repeats (*, +, {n,}) counted at their minimum, e.g. 21 for try\\{.*?\\}catch\\(_?0x[0-9a-f]{6,}\\)"""
+        width = 0
+        for op, av in subpattern:
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+                low, high, item = av
+                width += (low if high == sre_constants.MAXREPEAT else high) * PatternEngine._bounded_width(item)
+            elif op == sre_constants.SUBPATTERN:
+                width += PatternEngine._bounded_width(av[-1])
+            elif op == sre_constants.BRANCH:
+                width += max(PatternEngine._bounded_width(branch) for branch in av[1])
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                width += PatternEngine._bounded_width(av[1]) if av[0] > 0 else 0     # Lookaheads read after the match
+            elif op == sre_constants.GROUPREF_EXISTS:
+                width += max(PatternEngine._bounded_width(branch) if branch else 0 for branch in av[1:])
+            elif op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN):
+                width += 1
+        return width
+
+    @staticmethod
+    def _key(pattern: Pattern) -> Tuple[str, int]:
+        return pattern.pattern, pattern.flags
\ No newline at end of file